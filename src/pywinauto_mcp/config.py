@@ -1,6 +1,7 @@
 """Configuration settings for PyWinAuto MCP."""
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 
 try:
@@ -8,8 +9,6 @@ try:
 except ImportError:
     from pydantic import BaseSettings
 
-from pydantic import field_validator
-
 
 class Settings(BaseSettings):
     """Load application settings from environment variables and .env file."""
@@ -29,6 +28,11 @@ class Settings(BaseSettings):
     TIMEOUT: float = 10.0  # Default timeout in seconds for operations
     RETRY_ATTEMPTS: int = 3
     RETRY_DELAY: float = 1.0
+    # Click elements with one SendInput burst at their centre, after bringing
+    # their window to the foreground. When False (the default), the wrapper's
+    # own click() is used (message-based on the win32 backend, so background
+    # windows can be clicked), or click_input where the wrapper has no click().
+    FAST_CLICK: bool = False
 
     # Screenshot Settings
     SCREENSHOT_DIR: Path = Path("./screenshots")
@@ -53,17 +57,21 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
         case_sensitive = True
 
-    @field_validator("SCREENSHOT_DIR", mode="before")
-    @classmethod
-    def create_screenshot_dir(cls, v):
-        """Create screenshot directory if it doesn't exist."""
-        path = Path(v)
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+    @property
+    def screenshot_dir(self) -> Path:
+        """Return SCREENSHOT_DIR, creating it on first use."""
+        self.SCREENSHOT_DIR.mkdir(parents=True, exist_ok=True)
+        return self.SCREENSHOT_DIR
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance, built on first call."""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
 
 # Log effective backend at startup so we can verify in the log file
 _cfg_logger = logging.getLogger(__name__)
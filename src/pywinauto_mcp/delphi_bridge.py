@@ -7,11 +7,21 @@ and checking for the /forms endpoint.
 from __future__ import annotations
 
 import logging
-import socket
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 import psutil
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional at runtime; fall back to stdlib
+    from json import loads as _json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +31,82 @@ REQUEST_TIMEOUT = 3.0
 # Timeout for port probe during discovery (seconds)
 PROBE_TIMEOUT = 0.5
 
+# Maximum number of ports probed concurrently during discovery
+PROBE_WORKERS = 32
+
+# How long a /controls query result is reused before refetching (seconds)
+CONTROLS_CACHE_TTL = 2.0
+
+# Maximum number of distinct /controls queries kept in the cache
+CONTROLS_CACHE_SIZE = 128
+
+# Cap on the back-off between re-discovery attempts after failures (seconds)
+REDISCOVER_MAX_DELAY = 60.0
+
+# Random jitter added to the re-discovery back-off, as a fraction of the delay
+REDISCOVER_JITTER = 0.2
+
+# Ports the bridge is commonly configured on; probed before enumerating listeners
+KNOWN_BRIDGE_PORTS = (8080, 8081, 8888, 9000, 9090)
+
+# Remembers the last port the bridge answered on across server restarts
+LAST_PORT_FILE = Path.home() / ".pywinauto_mcp_bridge_port"
+
+# How long a snapshot of the TCP listener table stays valid (seconds)
+LISTENER_CACHE_TTL = 2.0
+
+# (timestamp, [(port, pid), ...]) snapshot of local TCP listeners
+_conn_cache: tuple[float, list[tuple[int, int | None]]] | None = None
+
+
+def _listening_sockets() -> list[tuple[int, int | None]]:
+    """Return (port, pid) for local TCP listeners, cached for a short TTL.
+
+    psutil.net_connections walks the whole OS connection table, which gets
+    slow on busy machines, so back-to-back discoveries share one snapshot.
+    """
+    global _conn_cache
+    now = time.monotonic()
+    if _conn_cache is not None and now - _conn_cache[0] < LISTENER_CACHE_TTL:
+        return _conn_cache[1]
+
+    # IPv4 only: probes connect to 127.0.0.1, which an IPv6-only listener
+    # would refuse anyway
+    listeners: list[tuple[int, int | None]] = []
+    for conn in psutil.net_connections(kind="tcp4"):
+        if conn.status != "LISTEN":
+            continue
+        if conn.laddr.ip not in ("0.0.0.0", "127.0.0.1"):
+            continue
+        listeners.append((conn.laddr.port, conn.pid))
+    _conn_cache = (now, listeners)
+    return listeners
+
+
+def _load_last_port() -> int | None:
+    """Return the port saved by the last successful discovery, if any."""
+    try:
+        return int(LAST_PORT_FILE.read_text(encoding="utf-8").strip())
+    except (OSError, ValueError):
+        return None
+
+
+def _save_last_port(port: int) -> None:
+    """Persist *port* so the next discovery tries it first."""
+    try:
+        LAST_PORT_FILE.write_text(str(port), encoding="utf-8")
+    except OSError as e:
+        logger.debug(f"Could not save bridge port to {LAST_PORT_FILE}: {e}")
+
+
+@lru_cache(maxsize=512)
+def _process_name(pid: int) -> str | None:
+    """Return the lowercased name of process *pid*, or None if unavailable."""
+    try:
+        return psutil.Process(pid).name().lower()
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
+
 
 class DelphiBridge:
     """Client for communicating with a DelphiUITestExposer HTTP server."""
@@ -31,6 +117,13 @@ class DelphiBridge:
         self._base_url: str | None = None
         if port is not None:
             self._base_url = f"http://{host}:{port}"
+        self._discover_failures = 0
+        self._last_discover_ts = 0.0
+        # (class, name, caption, base_url) -> (timestamp, controls)
+        self._controls_cache: dict[tuple, tuple[float, list[dict[str, Any]]]] = {}
+        # Keep-alive session so repeated bridge calls reuse the TCP connection
+        self._session = requests.Session()
+        self._session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
     @property
     def base_url(self) -> str | None:
@@ -53,59 +146,96 @@ class DelphiBridge:
         by that process are probed.  Otherwise all local listening ports
         are tried.
 
+        Without a process filter, the last known bridge port and
+        KNOWN_BRIDGE_PORTS are probed first so the common case never has to
+        enumerate the system's TCP listeners.
+
         Returns True if the bridge was found.
         """
-        candidate_ports = self._get_candidate_ports(process_name)
+        tried: list[int] = []
+        if process_name is None:
+            last_port = _load_last_port()
+            preferred = [last_port] if last_port else []
+            tried = list(dict.fromkeys(preferred + list(KNOWN_BRIDGE_PORTS)))
+            port = self._probe_ports(tried)
+            if port is not None:
+                return self._connect_to(port)
+
+        candidate_ports = [
+            p for p in self._get_candidate_ports(process_name) if p not in tried
+        ]
         logger.info(
             f"Discovering Delphi bridge: {len(candidate_ports)} candidate "
             f"ports (process={process_name!r})"
         )
 
-        for port in candidate_ports:
-            if self._probe_port(port):
-                self.port = port
-                self._base_url = f"http://{self.host}:{port}"
-                logger.info(f"Delphi bridge found at {self._base_url}")
-                return True
+        port = self._probe_ports(candidate_ports)
+        if port is not None:
+            return self._connect_to(port)
 
         logger.warning("Delphi bridge not found on any candidate port")
         return False
 
+    def _connect_to(self, port: int) -> bool:
+        """Record *port* as the bridge location and remember it for next time."""
+        self.port = port
+        self._base_url = f"http://{self.host}:{port}"
+        logger.info(f"Delphi bridge found at {self._base_url}")
+        _save_last_port(port)
+        return True
+
+    def _probe_ports(self, ports: list[int]) -> int | None:
+        """Probe *ports* concurrently and return the first one serving the bridge.
+
+        Probes are submitted in list order so lower ports start first; the
+        remaining probes are cancelled as soon as one succeeds.
+        """
+        if not ports:
+            return None
+        executor = ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, len(ports)))
+        try:
+            futures = {executor.submit(self._probe_port, port): port for port in ports}
+            for future in as_completed(futures):
+                if future.result():
+                    return futures[future]
+            return None
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def _get_candidate_ports(self, process_name: str | None) -> list[int]:
         """Get TCP listening ports, optionally filtered by process name."""
-        ports: list[int] = []
-        for conn in psutil.net_connections(kind="tcp"):
-            if conn.status != "LISTEN":
-                continue
-            if conn.laddr.ip not in ("0.0.0.0", "127.0.0.1", "::"):
-                continue
-            if process_name and conn.pid:
-                try:
-                    proc = psutil.Process(conn.pid)
-                    if process_name.lower() not in proc.name().lower():
-                        continue
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
+        listeners = _listening_sockets()
+        if not process_name:
+            return sorted({port for port, _ in listeners})
+
+        wanted = process_name.lower()
+        ports: set[int] = set()
+        for port, pid in listeners:
+            if pid:
+                name = _process_name(pid)
+                if name is None or wanted not in name:
                     continue
-            ports.append(conn.laddr.port)
-        return sorted(set(ports))
+            ports.add(port)
+        return sorted(ports)
 
     def _probe_port(self, port: int) -> bool:
-        """Check if a port serves the /forms endpoint."""
-        # Quick TCP check first
-        try:
-            with socket.create_connection((self.host, port), timeout=PROBE_TIMEOUT):
-                pass
-        except OSError:
-            return False
+        """Check if a port serves the /forms endpoint.
 
-        # Try HTTP /forms
+        Closed ports are rejected by the GET's own connection error, so no
+        separate TCP pre-check is needed. Any other request failure (a
+        malformed response from an unrelated service, say) also just means
+        this port is not the bridge.
+        """
         try:
-            resp = requests.get(
+            resp = self._session.get(
                 f"http://{self.host}:{port}/forms",
                 timeout=PROBE_TIMEOUT,
             )
+        except requests.RequestException:
+            return False
+        try:
             if resp.status_code == 200:
-                data = resp.json()
+                data = _json_loads(resp.content)
                 # Validate it looks like the Delphi bridge response
                 if isinstance(data, list) and (len(data) == 0 or "handle" in data[0]):
                     return True
@@ -122,31 +252,59 @@ class DelphiBridge:
 
         On connection failure, automatically re-discovers the bridge
         (the app may have restarted on a different port) and retries once.
+        If the bridge cannot be found the client is left disconnected;
+        see reconnect().
         """
         if not self._base_url:
             raise RuntimeError("Not connected. Call discover() or provide a port.")
         try:
             url = f"{self._base_url}{path}"
-            resp = requests.get(url, params=params or None, timeout=REQUEST_TIMEOUT)
+            resp = self._session.get(url, params=params or None, timeout=REQUEST_TIMEOUT)
             resp.raise_for_status()
-            return resp.json()
+            return _json_loads(resp.content)
         except (requests.ConnectionError, requests.Timeout) as e:
-            old_url = self._base_url
             logger.warning(f"Bridge request failed ({e}), re-discovering...")
-            self._base_url = None
-            self.port = None
-            if self.discover():
-                if self._base_url != old_url:
-                    logger.info(
-                        f"Bridge moved from {old_url} to {self._base_url}"
-                    )
-                url = f"{self._base_url}{path}"
-                resp = requests.get(
-                    url, params=params or None, timeout=REQUEST_TIMEOUT
-                )
-                resp.raise_for_status()
-                return resp.json()
-            raise
+            if not self.reconnect():
+                raise
+            url = f"{self._base_url}{path}"
+            resp = self._session.get(
+                url, params=params or None, timeout=REQUEST_TIMEOUT
+            )
+            resp.raise_for_status()
+            return _json_loads(resp.content)
+
+    def reconnect(self) -> bool:
+        """Re-discover the bridge after losing the connection to it.
+
+        The client is disconnected first, so a failed attempt leaves it
+        disconnected rather than pointing at a dead URL. Consecutive failed
+        attempts back off exponentially (with jitter): until the back-off
+        has passed, this returns False without scanning ports.
+
+        Returns True if the bridge was found.
+        """
+        if not self._rediscovery_due():
+            logger.debug("Bridge re-discovery backing off")
+            return False
+        old_url = self._base_url
+        self._base_url = None
+        self.port = None
+        self._last_discover_ts = time.monotonic()
+        if not self.discover():
+            self._discover_failures += 1
+            return False
+        self._discover_failures = 0
+        if old_url is not None and self._base_url != old_url:
+            logger.info(f"Bridge moved from {old_url} to {self._base_url}")
+        return True
+
+    def _rediscovery_due(self) -> bool:
+        """Return True if enough time has passed since the last failed re-discovery."""
+        if not self._discover_failures:
+            return True
+        delay = min(REDISCOVER_MAX_DELAY, 2.0**self._discover_failures)
+        delay += random.uniform(0, delay * REDISCOVER_JITTER)
+        return time.monotonic() - self._last_discover_ts >= delay
 
     def get_forms(self) -> list[dict[str, Any]]:
         """GET /forms — list all open forms."""
@@ -170,7 +328,17 @@ class DelphiBridge:
         name: str | None = None,
         caption: str | None = None,
     ) -> list[dict[str, Any]]:
-        """GET /controls — flat list of all controls with optional filters."""
+        """GET /controls — flat list of all controls with optional filters.
+
+        Results are reused for CONTROLS_CACHE_TTL seconds so repeated
+        lookups (e.g. verification passes) skip the round-trip. Call
+        invalidate_cache() after actions that may change the UI.
+        """
+        key = (class_name, name, caption, self._base_url)
+        cached = self._controls_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < CONTROLS_CACHE_TTL:
+            return cached[1]
+
         params: dict[str, str] = {}
         if class_name is not None:
             params["class"] = class_name
@@ -178,7 +346,16 @@ class DelphiBridge:
             params["name"] = name
         if caption is not None:
             params["caption"] = caption
-        return self._get("/controls", **params)
+        controls = self._get("/controls", **params)
+
+        if len(self._controls_cache) >= CONTROLS_CACHE_SIZE:
+            self._controls_cache.pop(next(iter(self._controls_cache)))
+        self._controls_cache[key] = (time.monotonic(), controls)
+        return controls
+
+    def invalidate_cache(self) -> None:
+        """Drop cached /controls results, e.g. after a click or text entry."""
+        self._controls_cache.clear()
 
     # ------------------------------------------------------------------
     # High-level helpers
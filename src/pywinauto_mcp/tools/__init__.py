@@ -54,7 +54,10 @@ PORTMANTEAU_MODULES = [
     "automation_batch",  # Batch operations (bridge)
 ]
 
-# Import all portmanteau tool modules - this will trigger their registration with FastMCP
+# Import all portmanteau tool modules - this will trigger their registration with FastMCP.
+# Imports stay serial on the importing thread: pywinauto/comtypes set up COM
+# on the thread that imports them, and a tool module importing from this
+# package while it is still initialising would deadlock on a worker thread.
 if app is not None:
     for module_name in PORTMANTEAU_MODULES:
         try:
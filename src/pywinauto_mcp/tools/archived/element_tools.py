@@ -5,9 +5,11 @@ This module provides tools for interacting with and validating UI elements.
 
 import logging
 import time
+from collections.abc import Callable
 from typing import Any
 
 from pywinauto import Application
+from pywinauto.application import ProcessNotFoundError
 from typing_extensions import TypedDict
 
 
@@ -42,44 +44,78 @@ except ImportError as e:
     app = None
 
 
+# Poll interval bounds for element_exists (seconds); doubles after each miss
+_POLL_INITIAL = 0.05
+_POLL_MAX = 0.5
+
+# Per-wrapper-class extractor functions, built on first sight of each class
+_extractor_cache: dict[type, Callable[[Any], ElementInfo]] = {}
+
+
+def _make_extractor(
+    has_runtime_id: bool, has_automation_id: bool, has_element_info: bool
+) -> Callable[[Any], ElementInfo]:
+    """Build an extractor that reads only the accessors a wrapper class has.
+
+    The capability checks are resolved here, once per class, so the
+    returned function does no hasattr() probing per element.
+    """
+
+    def extract(element) -> ElementInfo:
+        # Read the UIA element_info once for both name and control_type
+        uia_info = element.element_info if has_element_info else None
+        info: ElementInfo = {
+            "class_name": element.class_name(),
+            "text": element.window_text(),
+            "control_id": element.control_id(),
+            "process_id": element.process_id(),
+            "is_visible": element.is_visible(),
+            "is_enabled": element.is_enabled(),
+            "handle": element.handle,
+            "runtime_id": element.runtime_id() if has_runtime_id else None,
+            "automation_id": element.automation_id() if has_automation_id else None,
+            "name": uia_info.name if uia_info is not None else None,
+            "control_type": str(uia_info.control_type) if uia_info is not None else None,
+        }
+        try:
+            rect = element.rectangle()
+            info["x"] = rect.left
+            info["y"] = rect.top
+            info["width"] = rect.right - rect.left
+            info["height"] = rect.bottom - rect.top
+        except Exception:
+            pass
+        return info
+
+    return extract
+
+
+def _extractor_for(element) -> Callable[[Any], ElementInfo]:
+    """Return the cached extractor for *element*'s wrapper class."""
+    cls = type(element)
+    extractor = _extractor_cache.get(cls)
+    if extractor is None:
+        extractor = _make_extractor(
+            hasattr(element, "runtime_id"),
+            hasattr(element, "automation_id"),
+            hasattr(element, "element_info"),
+        )
+        _extractor_cache[cls] = extractor
+    return extractor
+
+
 def _get_element_info(element) -> ElementInfo:
     """Extract relevant information from a UI element."""
     element_info: ElementInfo = {}
 
     try:
         # Handle both element objects and dicts
-        if hasattr(element, "class_name"):
-            # It's a UI element object
-            element_info = {
-                "class_name": element.class_name(),
-                "text": element.window_text(),
-                "control_id": element.control_id(),
-                "process_id": element.process_id(),
-                "is_visible": element.is_visible(),
-                "is_enabled": element.is_enabled(),
-                "handle": element.handle,
-                "runtime_id": element.runtime_id() if hasattr(element, "runtime_id") else None,
-                "automation_id": (
-                    element.automation_id() if hasattr(element, "automation_id") else None
-                ),
-                "name": element.element_info.name if hasattr(element, "element_info") else None,
-                "control_type": (
-                    str(element.element_info.control_type)
-                    if hasattr(element, "element_info")
-                    else None
-                ),
-            }
-
-            try:
-                rect = element.rectangle()
-                element_info.update(
-                    {"x": rect.left, "y": rect.top, "width": rect.width(), "height": rect.height()}
-                )
-            except Exception:
-                pass
-        elif isinstance(element, dict):
+        if isinstance(element, dict):
             # It's already a dict, just ensure it has the right structure
             element_info = element
+        elif hasattr(element, "class_name"):
+            # It's a UI element object
+            element_info = _extractor_for(element)(element)
     except Exception as e:
         logger.error(f"Error getting element info: {e}")
 
@@ -106,9 +142,12 @@ if app is not None:
         """
         start_time = time.time()
         last_error = None
+        delay = _POLL_INITIAL
 
         while time.time() - start_time < timeout:
             try:
+                # Connect once; the connection is reused across polls and only
+                # re-established if the target process disappears
                 if app_param is None:
                     app_param = Application(backend="uia").connect(active_only=True)
 
@@ -135,9 +174,16 @@ if app is not None:
                         "element": _get_element_info(element),
                     }
 
+            except ProcessNotFoundError as e:
+                last_error = str(e)
+                app_param = None
             except Exception as e:
                 last_error = str(e)
-                time.sleep(0.1)
+
+            remaining = timeout - (time.time() - start_time)
+            if remaining > 0:
+                time.sleep(min(delay, remaining))
+            delay = min(delay * 2, _POLL_MAX)
 
         return {
             "status": "success" if last_error is None else "error",
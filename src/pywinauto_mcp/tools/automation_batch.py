@@ -4,13 +4,10 @@ Reduces round-trips for common workflows like filling forms.
 Each step is executed sequentially; stops on first error.
 """
 
-import ctypes
 import logging
 import time
 from typing import Any
 
-import pyautogui
-
 # Import the FastMCP app instance
 try:
     from pywinauto_mcp.app import app
@@ -26,24 +23,21 @@ from pywinauto_mcp.tools.portmanteau_elements import (  # noqa: E402
     _bridge_click,
     _bridge_find_controls,
     _get_bridge,
+    _get_desktop,
+    _index_bridge_controls,
+    _lookup_indexed_controls,
+    _type_replacing,
 )
+from pywinauto_mcp.win32_api import GetForegroundWindow  # noqa: E402
+from pywinauto_mcp.win32_windows import find_window_handle  # noqa: E402
 
 
 def _resolve_window_handle(window_title: str | None) -> int | None:
     """Resolve a window title to a handle, or return foreground window."""
-    if window_title:
-        from pywinauto import Desktop
-
-        from pywinauto_mcp.config import settings
-
-        desktop = Desktop(backend=settings.PYWINAUTO_BACKEND)
-        for w in desktop.windows():
-            try:
-                if w.window_text().lower() == window_title.lower():
-                    return w.handle
-            except Exception:
-                continue
-    return ctypes.windll.user32.GetForegroundWindow()
+    if not window_title:
+        return GetForegroundWindow()
+    hwnd = find_window_handle(window_title, lambda: _get_desktop().windows())
+    return hwnd or GetForegroundWindow()
 
 
 if app is not None:
@@ -65,9 +59,13 @@ Each step is a dict with:
   Values: "center", "right", "left", "top", "bottom".
   Use "right" to click dropdown buttons on combo/edit controls.
 - wait: seconds to pause after this step (default 0.1)
+- refresh_after: re-read the form's controls before the next step
+  (default true for click, false otherwise)
 
 All steps share the same window context (window_title param)
-and use active_form_only=True by default.
+and use active_form_only=True by default. The active form's control
+tree is fetched once and reused across steps; it is re-read after
+clicks (which may open or close forms) and whenever a target is missing.
 
 Examples:
     automation_batch(steps=[
@@ -112,6 +110,20 @@ Examples:
             }
 
         results: list[dict[str, Any]] = []
+        # name/caption maps over the active form's tree, shared across steps
+        index: tuple[dict[str, list[dict]], dict[str, list[dict]]] | None = None
+
+        def _find(auto_id: str | None, title: str | None) -> list[dict]:
+            nonlocal index
+            if not active_form_only:
+                return _bridge_find_controls(bridge, auto_id, title)
+            if index is not None:
+                ctrls = _lookup_indexed_controls(index, auto_id, title)
+                if ctrls:
+                    return ctrls
+            # First lookup, or the form changed since the tree was fetched
+            index = _index_bridge_controls(bridge.get_activeform_controls())
+            return _lookup_indexed_controls(index, auto_id, title)
 
         def _fail(step_index: int, step_dict: dict, error: str):
             return {
@@ -143,10 +155,7 @@ Examples:
                 if not auto_id and not title:
                     return _fail(i, step, "Step needs 'id' or 'title'")
 
-                ctrls = _bridge_find_controls(
-                    bridge, auto_id, title,
-                    active_form_only=active_form_only,
-                )
+                ctrls = _find(auto_id, title)
                 if not ctrls:
                     return _fail(
                         i, step,
@@ -174,12 +183,7 @@ Examples:
                     # focus pipeline unlike SetFocus API
                     if _bridge_click(ctrl, form_handle):
                         time.sleep(0.15)
-                        pyautogui.hotkey("ctrl", "a")
-                        pyautogui.press("delete")
-                        if text.isascii():
-                            pyautogui.typewrite(text, interval=0.02)
-                        else:
-                            pyautogui.write(text)
+                        _type_replacing(text)
                         results.append({
                             "op": "set_text",
                             "id": ctrl.get("name", ""),
@@ -194,6 +198,9 @@ Examples:
             except Exception as e:
                 return _fail(i, step, str(e))
 
+            if step.get("refresh_after", op == "click"):
+                index = None
+
             if wait:
                 time.sleep(float(wait))
 
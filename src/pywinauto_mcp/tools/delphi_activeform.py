@@ -11,6 +11,8 @@ cannot see, and reports them with their button labels.
 import ctypes
 import logging
 import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import win32gui
@@ -31,6 +33,14 @@ except ImportError as e:
 from pywinauto_mcp.tools.portmanteau_elements import (  # noqa: E402
     _get_bridge,
 )
+from pywinauto_mcp.win32_api import (  # noqa: E402
+    FindWindowExW,
+    GetClassNameW,
+    GetDlgCtrlID,
+    GetForegroundWindow,
+    GetWindowTextW,
+    IsWindowVisible,
+)
 
 # Classes that are internal child parts of composite controls — never useful
 _INNER_CLASSES = frozenset({
@@ -54,15 +64,25 @@ _CONTAINER_CLASSES = frozenset({
     "TScrollBox",
 })
 
+# Bit flags per known class, so a node is classified with one dict lookup
+_FLAG_INNER = 1
+_FLAG_LABEL = 2
+_FLAG_CONTAINER = 4
+_CLASS_FLAGS: dict[str, int] = (
+    dict.fromkeys(_INNER_CLASSES, _FLAG_INNER)
+    | dict.fromkeys(_LABEL_CLASSES, _FLAG_LABEL)
+    | dict.fromkeys(_CONTAINER_CLASSES, _FLAG_CONTAINER)
+)
+
 
-def _flatten_controls(
+def _iter_flatten_controls(
     nodes: list[dict],
     *,
     include_hidden: bool = False,
     include_labels: bool = False,
     include_containers: bool = False,
-) -> list[dict]:
-    """Flatten a nested control tree into a compact list.
+) -> Iterator[dict]:
+    """Yield compact entries for a nested control tree, in document order.
 
     Only includes fields useful for targeting: automation_id, class_name, text.
     Applies aggressive filtering by default to keep output small:
@@ -70,53 +90,113 @@ def _flatten_controls(
     - Skips inner child parts of composite controls
     - Skips read-only labels (unless *include_labels*)
     - Skips layout containers (unless *include_containers*)
-    - Skips invisible controls (unless *include_hidden*)
+    - Skips invisible controls and everything inside them (unless *include_hidden*)
+    """
+    class_flags = _CLASS_FLAGS.get
+    # Classes whose entries are dropped (their children are still walked)
+    skip_flags = (0 if include_labels else _FLAG_LABEL) | (
+        0 if include_containers else _FLAG_CONTAINER
+    )
+
+    # Explicit LIFO stack instead of recursion; children are pushed in
+    # reverse so they pop in document order (same pre-order as before)
+    stack = list(reversed(nodes))
+    while stack:
+        get = stack.pop().get
+
+        # Cheapest filters first: inner parts of composite controls are
+        # dropped with their whole subtree before anything else is read
+        cls = get("className", "")
+        flags = class_flags(cls, 0)
+        if flags & _FLAG_INNER:
+            continue
+
+        visible = get("visible", True)
+        if not visible and not include_hidden:
+            # A hidden VCL control hides everything inside it, so the
+            # whole subtree is skipped
+            continue
+
+        # Must have an automation_id to be targetable
+        name = get("name")
+        if name and not flags & skip_flags:
+            # Build the common shapes as a single literal rather than
+            # inserting keys one by one. Most captions are short, so test
+            # the length before slicing.
+            text = get("text")
+            entry: dict[str, Any] = (
+                {
+                    "automation_id": name,
+                    "class_name": cls,
+                    "text": text if len(text) <= 80 else text[:80],
+                }
+                if text and text != name
+                else {"automation_id": name, "class_name": cls}
+            )
+            if not visible:
+                entry["visible"] = False
+            if not get("enabled", True):
+                entry["enabled"] = False
+            yield entry
+
+        children = get("children")
+        if children:
+            stack.extend(reversed(children))
+
+
+def _flatten_controls(
+    nodes: list[dict],
+    *,
+    include_hidden: bool = False,
+    include_labels: bool = False,
+    include_containers: bool = False,
+) -> list[dict]:
+    """Flatten a nested control tree into a compact list.
+
+    See :func:`_iter_flatten_controls` for the filtering rules.
     """
-    result: list[dict] = []
-
-    def _walk(items: list[dict]) -> None:
-        for node in items:
-            children = node.get("children", [])
-            visible = node.get("visible", True)
-            if not visible and not include_hidden:
-                _walk(children)
-                continue
-
-            name = node.get("name", "")
-            cls = node.get("className", "")
-
-            # Always skip inner parts of composite controls
-            if cls in _INNER_CLASSES:
-                continue
-
-            # Must have an automation_id to be targetable
-            if name:
-                skip = False
-                if cls in _LABEL_CLASSES and not include_labels:
-                    skip = True
-                if cls in _CONTAINER_CLASSES and not include_containers:
-                    skip = True
-
-                if not skip:
-                    text = node.get("text", "")
-                    entry: dict[str, Any] = {
-                        "automation_id": name,
-                        "class_name": cls,
-                    }
-                    if text and text != name:
-                        entry["text"] = text[:80]
-                    if not visible:
-                        entry["visible"] = False
-                    if not node.get("enabled", True):
-                        entry["enabled"] = False
-                    result.append(entry)
-
-            _walk(children)
-
-    _walk(items=nodes)
-    return result
+    return list(
+        _iter_flatten_controls(
+            nodes,
+            include_hidden=include_hidden,
+            include_labels=include_labels,
+            include_containers=include_containers,
+        )
+    )
 
 
+def _columnar_controls(entries: Iterable[dict]) -> dict[str, list]:
+    """Pack flattened control entries into parallel per-field lists.
+
+    Row *i* of every list describes the same control. Missing text is "".
+    Hidden and disabled controls are listed by row index, since they are
+    rare and the per-row flags would mostly be True.
+    """
+    automation_ids: list[str] = []
+    class_names: list[str] = []
+    texts: list[str] = []
+    hidden: list[int] = []
+    disabled: list[int] = []
+    for i, entry in enumerate(entries):
+        automation_ids.append(entry["automation_id"])
+        class_names.append(entry["class_name"])
+        texts.append(entry.get("text", ""))
+        if entry.get("visible") is False:
+            hidden.append(i)
+        if entry.get("enabled") is False:
+            disabled.append(i)
+    return {
+        "automation_id": automation_ids,
+        "class_name": class_names,
+        "text": texts,
+        "hidden": hidden,
+        "disabled": disabled,
+    }
+
+
+# Runs native dialog detection while the bridge HTTP request is in flight
+_dialog_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dialog-scan")
+
 # Child control classes worth reporting in native dialogs
 _DIALOG_CHILD_CLASSES = frozenset({
     "Button",       # OK, Cancel, Yes, No, Save, Open, Browse...
@@ -127,6 +207,68 @@ _DIALOG_CHILD_CLASSES = frozenset({
     "CheckBox",     # Options like "Read-only"
 })
 
+# Bit n is set when some wanted child class name has length n. GetClassNameW
+# returns the length, so most unwanted children (e.g. "SysListView32") are
+# rejected without creating a Python string for their class name.
+_DIALOG_CHILD_LEN_MASK = 0
+for _name in _DIALOG_CHILD_CLASSES:
+    _DIALOG_CHILD_LEN_MASK |= 1 << len(_name)
+del _name
+
+
+# Buffer size for child class names and texts, which are read into one
+# reused buffer instead of through pywin32's per-call string wrappers
+# (window class names are at most 256 characters; child texts are
+# truncated to 120 anyway)
+_NAME_BUF_LEN = 256
+
+
+def _append_handle(hwnd: int, handles: list[int]) -> bool:
+    """EnumChildWindows callback that collects handles into the passed list."""
+    handles.append(hwnd)
+    return True
+
+
+def _describe_dialog(hwnd: int) -> dict[str, Any]:
+    """Describe a #32770 dialog: title, rect and its reportable child controls."""
+    # Collect child handles with a minimal module-level callback, then
+    # inspect them in one plain loop instead of inside the callback
+    child_hwnds: list[int] = []
+    win32gui.EnumChildWindows(hwnd, _append_handle, child_hwnds)
+
+    buf = ctypes.create_unicode_buffer(_NAME_BUF_LEN)
+    wanted_classes = _DIALOG_CHILD_CLASSES
+    len_mask = _DIALOG_CHILD_LEN_MASK
+    controls: list[dict[str, Any]] = []
+    for child in child_hwnds:
+        if not len_mask >> GetClassNameW(child, buf, _NAME_BUF_LEN) & 1:
+            continue
+        cls = buf.value
+        if cls not in wanted_classes or not IsWindowVisible(child):
+            continue
+        entry: dict[str, Any] = {
+            "class": cls,
+            "handle": child,
+        }
+        if GetWindowTextW(child, buf, _NAME_BUF_LEN):
+            entry["text"] = buf.value[:120]
+        ctrl_id = GetDlgCtrlID(child)
+        if ctrl_id:
+            entry["id"] = ctrl_id
+        controls.append(entry)
+
+    rect = win32gui.GetWindowRect(hwnd)
+    return {
+        "handle": hwnd,
+        "title": win32gui.GetWindowText(hwnd),
+        "class": "#32770",
+        "controls": controls,
+        "rect": {
+            "left": rect[0], "top": rect[1],
+            "right": rect[2], "bottom": rect[3],
+        },
+    }
+
 
 def _detect_native_dialogs() -> list[dict[str, Any]]:
     """Find native Win32 dialogs (#32770) owned by the foreground app.
@@ -135,60 +277,27 @@ def _detect_native_dialogs() -> list[dict[str, Any]]:
     Delphi bridge cannot see. Returns a list of dicts with handle, title,
     child controls (buttons, inputs, combos, static text), and rect.
     """
-    fg = ctypes.windll.user32.GetForegroundWindow()
+    fg = GetForegroundWindow()
     if not fg:
         return []
 
     _, fg_pid = win32process.GetWindowThreadProcessId(fg)
 
+    # Walk only the #32770 top-level windows (in z-order) rather than
+    # enumerating every top-level window and checking its class name.
+    # Usually there are none, so this is a single call.
     dialogs: list[dict[str, Any]] = []
-
-    def _enum_callback(hwnd: int, _: Any) -> bool:
-        if not win32gui.IsWindowVisible(hwnd):
-            return True
-        if win32gui.GetClassName(hwnd) != "#32770":
-            return True
+    hwnd = None
+    while True:
+        hwnd = FindWindowExW(None, hwnd, "#32770", None)
+        if not hwnd:
+            break
+        if not IsWindowVisible(hwnd):
+            continue
         _, pid = win32process.GetWindowThreadProcessId(hwnd)
         if pid != fg_pid:
-            return True
-
-        controls: list[dict[str, Any]] = []
-
-        def _enum_children(child: int, __: Any) -> bool:
-            cls = win32gui.GetClassName(child)
-            if cls not in _DIALOG_CHILD_CLASSES:
-                return True
-            if not win32gui.IsWindowVisible(child):
-                return True
-            txt = win32gui.GetWindowText(child)
-            entry: dict[str, Any] = {
-                "class": cls,
-                "handle": child,
-            }
-            if txt:
-                entry["text"] = txt[:120]
-            ctrl_id = win32gui.GetDlgCtrlID(child)
-            if ctrl_id:
-                entry["id"] = ctrl_id
-            controls.append(entry)
-            return True
-
-        win32gui.EnumChildWindows(hwnd, _enum_children, None)
-
-        rect = win32gui.GetWindowRect(hwnd)
-        dialogs.append({
-            "handle": hwnd,
-            "title": win32gui.GetWindowText(hwnd),
-            "class": "#32770",
-            "controls": controls,
-            "rect": {
-                "left": rect[0], "top": rect[1],
-                "right": rect[2], "bottom": rect[3],
-            },
-        })
-        return True
-
-    win32gui.EnumWindows(_enum_callback, None)
+            continue
+        dialogs.append(_describe_dialog(hwnd))
     return dialogs
 
 
@@ -217,17 +326,23 @@ Each entry has:
 Options to include more:
 - include_labels=True: Add TLabel/TcxLabel (read-only text)
 - include_containers=True: Add TPanel/TScrollBox etc.
-- include_hidden=True: Add invisible controls
+- include_hidden=True: Add invisible controls (and those inside hidden containers)
+
+Compact output for large forms:
+- columnar=True: "controls" becomes parallel lists {automation_id: [...],
+  class_name: [...], text: [...], hidden: [row indexes], disabled: [row indexes]}
 
 Examples:
     delphi_activeform()
     delphi_activeform(include_labels=True)
+    delphi_activeform(columnar=True)
 """,
     )
     def delphi_activeform(
         include_hidden: bool = False,
         include_labels: bool = False,
         include_containers: bool = False,
+        columnar: bool = False,
     ) -> dict[str, Any]:
         """List controls on the currently active Delphi form.
 
@@ -235,6 +350,7 @@ Examples:
             include_hidden: Include invisible controls.
             include_labels: Include read-only labels (TLabel, TcxLabel).
             include_containers: Include layout containers (TPanel, etc.).
+            columnar: Return controls as parallel per-field lists.
 
         """
         timestamp = time.time()
@@ -247,19 +363,27 @@ Examples:
             }
 
         try:
-            # Check for native Win32 dialogs first — they block the VCL UI
-            native_dialogs = _detect_native_dialogs()
+            # Check for native Win32 dialogs (they block the VCL UI) on a
+            # worker thread while the bridge request is in flight
+            dialogs_future = _dialog_executor.submit(_detect_native_dialogs)
 
             raw = bridge.get_activeform_controls()
-            controls = _flatten_controls(
+            entries = _iter_flatten_controls(
                 raw,
                 include_hidden=include_hidden,
                 include_labels=include_labels,
                 include_containers=include_containers,
             )
+            if columnar:
+                controls: Any = _columnar_controls(entries)
+                count = len(controls["automation_id"])
+            else:
+                controls = list(entries)
+                count = len(controls)
+            native_dialogs = dialogs_future.result()
             result: dict[str, Any] = {
                 "status": "success",
-                "count": len(controls),
+                "count": count,
                 "controls": controls,
                 "timestamp": timestamp,
             }
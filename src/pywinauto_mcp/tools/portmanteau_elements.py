@@ -24,11 +24,18 @@ SUPPORTED OPERATIONS:
 - wait: Wait for element to appear
 - verify_text: Verify element contains expected text
 - list: Get all elements in a window
+- batch: Run several operations on one element
+- chain: Run steps on different elements in one window
 """
 
 import ctypes
 import logging
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache, partial
 from typing import Any, Literal
 
 from pywinauto import Desktop
@@ -40,10 +47,23 @@ try:
 except ImportError:
     ButtonWrapper = EditWrapper = ComboBoxWrapper = None
 
-import pyautogui
-
 from pywinauto_mcp.config import settings
 from pywinauto_mcp.delphi_bridge import DelphiBridge
+from pywinauto_mcp.win32_api import (
+    GA_ROOT,
+    SMTO_ABORTIFHUNG,
+    AttachThreadInput,
+    GetAncestor,
+    GetCurrentThreadId,
+    GetDlgCtrlID,
+    GetForegroundWindow,
+    IsChild,
+    SendMessageTimeoutW,
+    SetFocus,
+    SetForegroundWindow,
+)
+from pywinauto_mcp.win32_input import click_at, move_cursor, replace_field_text
+from pywinauto_mcp.win32_windows import find_window_handle
 
 # Import the FastMCP app instance
 try:
@@ -56,18 +76,114 @@ except ImportError as e:
     logger.error(f"Failed to import FastMCP app in portmanteau_elements: {e}")
     app = None
 
+_WM_NULL = 0x0000
+
+# How long a window may take to answer a WM_NULL probe before it counts as hung (ms)
+_RESPONSE_TIMEOUT_MS = 500
+
+
+def _window_responding(hwnd: int) -> bool:
+    """Return whether *hwnd*'s thread processes messages within _RESPONSE_TIMEOUT_MS."""
+    result = ctypes.c_size_t()
+    return bool(
+        SendMessageTimeoutW(
+            hwnd, _WM_NULL, 0, 0, SMTO_ABORTIFHUNG, _RESPONSE_TIMEOUT_MS, ctypes.byref(result)
+        )
+    )
+
+
+# Time for a window to settle after being brought to the foreground (seconds)
+_FOREGROUND_SETTLE = 0.05
+
+
+def _bring_to_foreground(hwnd: int) -> None:
+    """Bring *hwnd* to the foreground, skipping the call and settle delay if it is there."""
+    if GetForegroundWindow() == hwnd:
+        return
+    SetForegroundWindow(hwnd)
+    time.sleep(_FOREGROUND_SETTLE)
+
+
+# pyautogui is imported where it is used: loading it pulls in PIL and probes
+# the display, and most operations only need it as a fallback.
+
+
+def _click(x: int, y: int, button: str = "left", clicks: int = 1) -> None:
+    """Click at screen (*x*, *y*) via SendInput; pyautogui only if that fails."""
+    if not click_at(x, y, button, clicks):
+        import pyautogui
+
+        pyautogui.click(x, y, clicks=clicks, button=button)
+
+
+def _click_element(wrapper, window_handle: int, button: str = "left", clicks: int = 1) -> None:
+    """Click *wrapper*, a control in window *window_handle*.
+
+    By default the wrapper's own click()/double_click() is used, with
+    click_input()/double_click_input() for wrappers that have no such method.
+    With settings.FAST_CLICK the top-level window owning *window_handle* is
+    brought to the foreground and the element's centre is clicked in one
+    SendInput burst, so the click cannot land on a window covering it.
+
+    Raises ElementNotVisible on the FAST_CLICK path if the element is hidden
+    or has an empty rectangle, as its centre would be some other control.
+    """
+    if not settings.FAST_CLICK:
+        name = "double_click" if clicks == 2 else "click"
+        click = getattr(wrapper, name, None) or getattr(wrapper, f"{name}_input")
+        click(button=button)
+        return
+    rect = wrapper.rectangle()
+    if not wrapper.is_visible() or rect.right <= rect.left or rect.bottom <= rect.top:
+        raise ElementNotVisible(f"{wrapper.window_text()!r} is hidden or has no area")
+    _bring_to_foreground(GetAncestor(window_handle, GA_ROOT) or window_handle)
+    _click((rect.left + rect.right) // 2, (rect.top + rect.bottom) // 2, button, clicks)
+
+
+def _move(x: int, y: int) -> None:
+    """Move the cursor to screen (*x*, *y*); pyautogui only if that fails."""
+    if not move_cursor(x, y):
+        import pyautogui
+
+        pyautogui.moveTo(x, y)
+
+
+def _type_replacing(text: str) -> None:
+    """Select all, delete, and type *text* at the keyboard focus.
+
+    Sent as one SendInput burst, so no other input or focus change can land
+    between the keystrokes; pyautogui is used only if that is blocked.
+    """
+    if replace_field_text(text):
+        return
+    import pyautogui
+
+    pyautogui.hotkey("ctrl", "a")
+    pyautogui.press("delete")
+    if text.isascii():
+        pyautogui.typewrite(text, interval=0.02)
+    else:
+        pyautogui.write(text)
+
+
 # Lazy-initialized Delphi bridge singleton
 _bridge: DelphiBridge | None = None
 _bridge_attempted: bool = False
 
 
 def _get_bridge() -> DelphiBridge | None:
-    """Get or discover the Delphi bridge (lazy singleton)."""
+    """Get or discover the Delphi bridge (lazy singleton).
+
+    A bridge that was lost is re-discovered once its back-off allows; until
+    then, and while it stays lost, None is returned.
+    """
     global _bridge, _bridge_attempted
     if _bridge is not None and _bridge.connected:
         return _bridge
+    if _bridge is not None:
+        return _bridge if _bridge.reconnect() else None
     if _bridge_attempted:
-        return _bridge
+        return None
     _bridge_attempted = True
     _bridge = DelphiBridge()
     if _bridge.discover():
@@ -78,23 +194,34 @@ def _get_bridge() -> DelphiBridge | None:
     return _bridge
 
 
-def _get_desktop():
-    """Get a Desktop instance with proper error handling."""
+@lru_cache(maxsize=4)
+def _desktop_for(backend: str):
+    """Return the shared Desktop for *backend*; Desktop holds no per-call state."""
+    return Desktop(backend=backend)
+
+
+def _get_desktop(backend: str | None = None):
+    """Get a Desktop instance with proper error handling.
+
+    Instances are reused per backend, so repeated tool calls skip Desktop
+    construction. *backend* defaults to the configured PYWINAUTO_BACKEND.
+    """
     try:
-        return Desktop(backend=settings.PYWINAUTO_BACKEND)
+        return _desktop_for(backend or settings.PYWINAUTO_BACKEND)
     except Exception as e:
         logger.error(f"Failed to get Desktop instance: {e}")
         raise
 
 
-def _bridge_control_to_element_info(ctrl: dict) -> dict:
-    """Convert a Delphi bridge control dict to our element info format."""
+def _bridge_control_fields(ctrl: dict) -> dict:
+    """Convert one Delphi bridge control dict, without its children."""
+    text = ctrl.get("text", "")
     return {
         "handle": ctrl.get("handle", 0),
         "class_name": ctrl.get("className", ""),
         "automation_id": ctrl.get("name", ""),
-        "text": ctrl.get("text", ""),
-        "name": ctrl.get("text", ""),
+        "text": text,
+        "name": text,
         "x": ctrl.get("left", 0),
         "y": ctrl.get("top", 0),
         "width": ctrl.get("width", 0),
@@ -102,10 +229,64 @@ def _bridge_control_to_element_info(ctrl: dict) -> dict:
         "is_visible": ctrl.get("visible", True),
         "is_enabled": ctrl.get("enabled", True),
         "parent_handle": ctrl.get("parentHandle", 0),
-        "children": [_bridge_control_to_element_info(c) for c in ctrl.get("children", [])],
+        "children": [],
     }
 
 
+def _bridge_control_to_element_info(ctrl: dict) -> dict:
+    """Convert a Delphi bridge control dict and its subtree to our element info format.
+
+    Walks with an explicit stack, so deeply nested forms do not hit the
+    recursion limit.
+    """
+    root = _bridge_control_fields(ctrl)
+    stack = [(ctrl, root)]
+    while stack:
+        source, info = stack.pop()
+        children = info["children"]
+        for child in source.get("children", ()):
+            child_info = _bridge_control_fields(child)
+            children.append(child_info)
+            stack.append((child, child_info))
+    return root
+
+
+# Indexed active-form control trees:
+# bridge base_url -> (timestamp, foreground hwnd, (by_name, by_text))
+_activeform_cache: dict[
+    str, tuple[float, int | None, tuple[dict[str, list[dict]], dict[str, list[dict]]]]
+] = {}
+
+# How long an active-form control tree is reused (seconds); long enough to
+# cover the lookups of one call or a quick run of calls
+_ACTIVEFORM_CACHE_TTL = 0.25
+
+
+def _activeform_index(
+    bridge: DelphiBridge,
+) -> tuple[dict[str, list[dict]], dict[str, list[dict]]]:
+    """Return the active form's controls indexed by _index_bridge_controls.
+
+    The tree is fetched and indexed once and reused for a very short time,
+    and only while the same window is in the foreground.
+    """
+    now = time.monotonic()
+    foreground = GetForegroundWindow()
+    cached = _activeform_cache.get(bridge.base_url)
+    if cached is not None and now - cached[0] < _ACTIVEFORM_CACHE_TTL and cached[1] == foreground:
+        return cached[2]
+    index = _index_bridge_controls(bridge.get_activeform_controls())
+    _activeform_cache[bridge.base_url] = (now, foreground, index)
+    return index
+
+
+def _invalidate_bridge_caches() -> None:
+    """Forget cached bridge lookups after input that may have changed the UI."""
+    _activeform_cache.clear()
+    if _bridge is not None:
+        _bridge.invalidate_cache()
+
+
 def _bridge_find_controls(
     bridge: DelphiBridge,
     auto_id: str | None = None,
@@ -115,9 +296,10 @@ def _bridge_find_controls(
 ) -> list[dict]:
     """Find controls via bridge, optionally restricted to the active form.
 
-    When *active_form_only* is True, fetches the active form's control tree
-    and searches within it — avoiding cross-form name collisions.
-    Otherwise delegates to the global /controls endpoint.
+    When *active_form_only* is True, looks the controls up in the active
+    form's indexed control tree — avoiding cross-form name collisions; at
+    least one of *auto_id* or *title* must then be given. Otherwise
+    delegates to the global /controls endpoint.
     """
     if not active_form_only:
         params: dict[str, str] = {}
@@ -127,23 +309,47 @@ def _bridge_find_controls(
             params["caption"] = title
         return bridge.get_controls(**params)
 
-    # Active-form path: flatten the tree and filter locally
-    tree = bridge.get_activeform_controls()
-    matches: list[dict] = []
+    return _lookup_indexed_controls(_activeform_index(bridge), auto_id, title)
+
 
-    def _walk(nodes: list[dict]) -> None:
-        for node in nodes:
-            match = True
-            if auto_id and node.get("name", "") != auto_id:
-                match = False
-            if title and node.get("text", "") != title:
-                match = False
-            if match:
-                matches.append(node)
-            _walk(node.get("children", []))
+def _index_bridge_controls(
+    tree: list[dict],
+) -> tuple[dict[str, list[dict]], dict[str, list[dict]]]:
+    """Flatten a bridge control tree into name -> nodes and text -> nodes maps.
+
+    Nodes are listed in depth-first document order, so the first entry is
+    the outermost, earliest match.
+    """
+    by_name: dict[str, list[dict]] = {}
+    by_text: dict[str, list[dict]] = {}
+    stack = list(reversed(tree))
+    while stack:
+        node = stack.pop()
+        by_name.setdefault(node.get("name", ""), []).append(node)
+        by_text.setdefault(node.get("text", ""), []).append(node)
+        stack.extend(reversed(node.get("children", [])))
+    return by_name, by_text
+
+
+def _lookup_indexed_controls(
+    index: tuple[dict[str, list[dict]], dict[str, list[dict]]],
+    auto_id: str | None = None,
+    title: str | None = None,
+) -> list[dict]:
+    """Find controls in an index built by _index_bridge_controls.
 
-    _walk(tree)
-    return matches
+    Both given selectors must match; at least one of *auto_id* or *title*
+    must be given.
+    """
+    by_name, by_text = index
+    if auto_id:
+        matches = by_name.get(auto_id, [])
+        if title:
+            matches = [n for n in matches if n.get("text", "") == title]
+        return matches
+    if title:
+        return by_text.get(title, [])
+    return []
 
 
 def _bridge_click(
@@ -154,7 +360,7 @@ def _bridge_click(
 ) -> bool:
     """Click a control found via the Delphi bridge.
 
-    Uses physical mouse input (pyautogui) at screen coordinates.
+    Uses physical mouse input (SendInput) at screen coordinates.
     For windowed controls, uses GetWindowRect for exact position.
     For non-windowed controls, falls back to form client-area offset.
 
@@ -165,8 +371,7 @@ def _bridge_click(
     try:
         import win32gui
 
-        ctypes.windll.user32.SetForegroundWindow(form_handle)
-        time.sleep(0.05)
+        _bring_to_foreground(form_handle)
 
         handle = ctrl.get("handle", 0)
         if handle:
@@ -201,7 +406,9 @@ def _bridge_click(
             f"Bridge click at screen ({click_x}, {click_y}) "
             f"anchor={anchor} for '{ctrl.get('name', '')}'"
         )
-        pyautogui.click(click_x, click_y, button=button)
+        _click(click_x, click_y, button)
+        # The click may have changed the UI; cached bridge results are stale
+        _invalidate_bridge_caches()
         return True
     except Exception as e:
         logger.warning(f"Bridge coordinate click failed: {e}")
@@ -219,25 +426,23 @@ def _bridge_set_focus(ctrl: dict, form_handle: int) -> bool:
     import win32gui
     import win32process
 
-    # Bring the form to the foreground
-    ctypes.windll.user32.SetForegroundWindow(form_handle)
-    time.sleep(0.05)
+    _bring_to_foreground(form_handle)
 
     handle = ctrl.get("handle", 0)
     if handle:
         # Windowed control — attach threads and SetFocus
         try:
-            current_tid = ctypes.windll.kernel32.GetCurrentThreadId()
+            current_tid = GetCurrentThreadId()
             target_tid = win32process.GetWindowThreadProcessId(handle)[0]
             attached = False
             if current_tid != target_tid:
                 attached = bool(
-                    ctypes.windll.user32.AttachThreadInput(
+                    AttachThreadInput(
                         current_tid, target_tid, True
                     )
                 )
             try:
-                ctypes.windll.user32.SetFocus(handle)
+                SetFocus(handle)
                 logger.info(
                     f"SetFocus on handle {handle} "
                     f"for '{ctrl.get('name', '')}'"
@@ -245,7 +450,7 @@ def _bridge_set_focus(ctrl: dict, form_handle: int) -> bool:
                 return True
             finally:
                 if attached:
-                    ctypes.windll.user32.AttachThreadInput(
+                    AttachThreadInput(
                         current_tid, target_tid, False
                     )
         except Exception as e:
@@ -260,15 +465,178 @@ def _bridge_set_focus(ctrl: dict, form_handle: int) -> bool:
             f"Focus via click at ({click_x}, {click_y}) "
             f"for '{ctrl.get('name', '')}'"
         )
-        pyautogui.click(click_x, click_y)
+        _click(click_x, click_y)
         return True
     except Exception as e:
         logger.warning(f"Focus via click failed: {e}")
         return False
 
 
-def _get_element_info(element) -> dict[str, Any]:
-    """Extract relevant information from a UI element."""
+# UIA properties fetched in one cache request for element info and "list"
+_UIA_LIST_PROPERTIES = (
+    "UIA_NamePropertyId",
+    "UIA_ClassNamePropertyId",
+    "UIA_AutomationIdPropertyId",
+    "UIA_ControlTypePropertyId",
+    "UIA_ProcessIdPropertyId",
+    "UIA_NativeWindowHandlePropertyId",
+    "UIA_BoundingRectanglePropertyId",
+    "UIA_IsEnabledPropertyId",
+    "UIA_IsOffscreenPropertyId",
+    "UIA_ValueValuePropertyId",
+    "UIA_ValueIsReadOnlyPropertyId",
+)
+
+# UIA control types pywinauto wraps as Button/Edit/ComboBox wrappers
+_UIA_ELEMENT_TYPES = {"Button": "button", "Edit": "edit", "ComboBox": "combobox"}
+
+
+def _cached_uia_element_info(elem, uia) -> dict[str, Any]:
+    """Build the _get_element_info dict from a UIA element's cached properties.
+
+    Reads only Cached* values filled by the cache request, so no further
+    cross-process calls are made. Text is the element's Name, or its
+    Value for Edit/Document controls.
+    """
+    control_type = uia.known_control_type_ids.get(elem.CachedControlType, "")
+    handle = elem.CachedNativeWindowHandle or 0
+    text = elem.CachedName or ""
+    if control_type in ("Edit", "Document"):
+        text = elem.GetCachedPropertyValue(uia.UIA_dll.UIA_ValueValuePropertyId) or text
+    r = elem.CachedBoundingRectangle
+    width = r.right - r.left
+    height = r.bottom - r.top
+    info: dict[str, Any] = {
+        "class_name": elem.CachedClassName or "",
+        "text": text,
+        "control_id": GetDlgCtrlID(handle) if handle else None,
+        "process_id": elem.CachedProcessId,
+        "is_visible": not elem.CachedIsOffscreen,
+        "is_enabled": bool(elem.CachedIsEnabled),
+        "handle": handle,
+        "automation_id": elem.CachedAutomationId or "",
+        "name": elem.CachedName or "",
+        "control_type": control_type,
+        "rect": {
+            "left": r.left,
+            "top": r.top,
+            "right": r.right,
+            "bottom": r.bottom,
+            "width": width,
+            "height": height,
+        },
+        "x": r.left,
+        "y": r.top,
+        "width": width,
+        "height": height,
+    }
+    element_type = _UIA_ELEMENT_TYPES.get(control_type)
+    if element_type:
+        info["element_type"] = element_type
+        if element_type == "edit":
+            info["is_readonly"] = bool(
+                elem.GetCachedPropertyValue(uia.UIA_dll.UIA_ValueIsReadOnlyPropertyId)
+            )
+    return info
+
+
+def _uia_cache_request():
+    """Return the IUIA singleton and a cache request for _UIA_LIST_PROPERTIES."""
+    from pywinauto.uia_defines import IUIA
+
+    uia = IUIA()
+    cache_request = uia.iuia.CreateCacheRequest()
+    for prop in _UIA_LIST_PROPERTIES:
+        cache_request.AddProperty(getattr(uia.UIA_dll, prop))
+    return uia, cache_request
+
+
+def _uia_element_info(element, verbose: bool = True) -> dict[str, Any]:
+    """Get element info for a UIA wrapper/spec with one cache round-trip.
+
+    Resolves the wrapper once, refreshes all listed properties with
+    BuildUpdatedCache, and, if *verbose*, adds the live combobox details
+    that are not plain properties.
+    """
+    wrapper = element.wrapper_object() if hasattr(element, "wrapper_object") else element
+    uia, cache_request = _uia_cache_request()
+    cached = wrapper.element_info.element.BuildUpdatedCache(cache_request)
+    info = _cached_uia_element_info(cached, uia)
+    if verbose and info.get("element_type") == "combobox":
+        _extract_combobox(wrapper, info)
+    return info
+
+
+def _list_uia_elements(root, max_depth: int) -> list[dict[str, Any]]:
+    """List the element tree under UIA element *root* down to *max_depth*.
+
+    Each parent's children and all their properties are fetched with one
+    FindAllBuildCache call, instead of one round-trip per property per
+    child. Returns the same nested shape as the "list" operation.
+    """
+    uia, cache_request = _uia_cache_request()
+    children_scope = uia.tree_scope["children"]
+
+    elements: list[dict[str, Any]] = []
+    # (list to append children to, element whose children to read, depth)
+    stack = [(elements, root, 0)]
+    while stack:
+        bucket, parent, depth = stack.pop()
+        found = parent.FindAllBuildCache(children_scope, uia.true_condition, cache_request)
+        for i in range(found.Length):
+            child = found.GetElement(i)
+            info = _cached_uia_element_info(child, uia)
+            info["children"] = []
+            bucket.append(info)
+            if depth < max_depth:
+                stack.append((info["children"], child, depth + 1))
+    return elements
+
+
+def _extract_edit(element, info: dict[str, Any]) -> None:
+    """Add edit-specific fields to *info*."""
+    try:
+        info["is_readonly"] = element.is_read_only()
+    except Exception as e:  # Changed bare except
+        logger.debug(f"Could not get is_read_only for edit element: {e}")
+
+
+def _extract_combobox(element, info: dict[str, Any]) -> None:
+    """Add the combobox's items and selection to *info*."""
+    try:
+        info["items"] = element.item_texts()
+        info["selected_index"] = element.selected_index()
+        info["selected_text"] = element.selected_text()
+    except Exception as e:  # Changed bare except
+        logger.debug(f"Could not get combobox info: {e}")
+
+
+# (wrapper class, element_type, extra-field extractor) for the wrapper
+# classes available in this pywinauto install, checked in order
+_WRAPPER_HANDLERS: tuple[tuple[type, str, Callable | None], ...] = tuple(
+    (cls, name, extract)
+    for cls, name, extract in (
+        (ButtonWrapper, "button", None),
+        (EditWrapper, "edit", _extract_edit),
+        (ComboBoxWrapper, "combobox", _extract_combobox),
+    )
+    if cls is not None
+)
+
+
+def _get_element_info(element, verbose: bool = True) -> dict[str, Any]:
+    """Extract relevant information from a UI element.
+
+    Without *verbose*, the type-specific extras (edit read-only state,
+    combobox items and selection) are skipped; each costs further
+    cross-process calls, and a combobox's items may need it expanded.
+    """
+    if settings.PYWINAUTO_BACKEND == "uia":
+        try:
+            return _uia_element_info(element, verbose)
+        except Exception as e:
+            logger.debug(f"Cached UIA element info failed, reading properties: {e}")
+
     info = {}
     try:
         info = {
@@ -290,38 +658,30 @@ def _get_element_info(element) -> dict[str, Any]:
 
         try:
             rect = element.rectangle()
+            width = rect.right - rect.left
+            height = rect.bottom - rect.top
             info["rect"] = {
                 "left": rect.left,
                 "top": rect.top,
                 "right": rect.right,
                 "bottom": rect.bottom,
-                "width": rect.width(),
-                "height": rect.height(),
+                "width": width,
+                "height": height,
             }
             info["x"] = rect.left
             info["y"] = rect.top
-            info["width"] = rect.width()
-            info["height"] = rect.height()
+            info["width"] = width
+            info["height"] = height
         except Exception as e:
             logger.debug(f"Could not get rectangle for element: {e}")  # Changed bare except
 
         # Element type detection
-        if ButtonWrapper and isinstance(element, ButtonWrapper):
-            info["element_type"] = "button"
-        elif EditWrapper and isinstance(element, EditWrapper):
-            info["element_type"] = "edit"
-            try:
-                info["is_readonly"] = element.is_read_only()
-            except Exception as e:  # Changed bare except
-                logger.debug(f"Could not get is_read_only for edit element: {e}")
-        elif ComboBoxWrapper and isinstance(element, ComboBoxWrapper):
-            info["element_type"] = "combobox"
-            try:
-                info["items"] = element.item_texts()
-                info["selected_index"] = element.selected_index()
-                info["selected_text"] = element.selected_text()
-            except Exception as e:  # Changed bare except
-                logger.debug(f"Could not get combobox info: {e}")
+        for wrapper_class, element_type, extract in _WRAPPER_HANDLERS:
+            if isinstance(element, wrapper_class):
+                info["element_type"] = element_type
+                if verbose and extract is not None:
+                    extract(element, info)
+                break
 
     except Exception as e:
         logger.warning(f"Error getting element info: {e}")
@@ -364,6 +724,1032 @@ def _find_element(
     return window.child_window(**kwargs), ", ".join(parts)
 
 
+# Selector tuple (control_id, auto_id, title, class_name, control_type) with nothing set
+_NO_SELECTORS = (None,) * 5
+
+# Wrappers resolved from selectors: (window_handle, selectors...) -> (timestamp, wrapper)
+_element_cache: dict[tuple, tuple[float, Any]] = {}
+
+# How long a resolved wrapper is reused before searching again (seconds)
+_ELEMENT_CACHE_TTL = 2.0
+
+
+def _find_control(element, timeout: float | None = None, visible_only: bool = True):
+    """Find *element*'s control with one bounded search and wrap it.
+
+    WindowSpecification.wrapper_object() keeps retrying for
+    Timings.window_find_timeout (5 s by default) before giving up; this
+    retries only for *timeout*, default Timings.exists_timeout as with
+    exists(). Like wrapper_object(), only visible controls match unless
+    *visible_only* is False. Raises ElementNotFoundError when nothing
+    matches.
+    """
+    from pywinauto.backend import registry
+    from pywinauto.findwindows import find_element
+    from pywinauto.timings import TimeoutError as WaitTimeoutError
+    from pywinauto.timings import Timings, wait_until_passes
+
+    if timeout is None:
+        timeout = Timings.exists_timeout
+    window_criteria, control_criteria = element.criteria[0], element.criteria[-1]
+    backend = registry.backends[window_criteria.get("backend", settings.PYWINAUTO_BACKEND)]
+    criteria = {
+        **control_criteria,
+        "backend": backend.name,
+        "parent": backend.element_info_class(window_criteria["handle"]),
+        "top_level_only": False,
+        "visible_only": visible_only,
+    }
+    try:
+        info = wait_until_passes(
+            timeout,
+            Timings.exists_retry,
+            find_element,
+            (ElementNotFoundError,),
+            **criteria,
+        )
+    except WaitTimeoutError as e:
+        raise e.original_exception from None
+    return backend.generic_wrapper_class(info)
+
+
+def _search_wrapper(element, visible_only: bool = True):
+    """Run the element search once; None when nothing matches.
+
+    The search gives up after Timings.exists_timeout, as exists() did.
+    Pass *visible_only* False to match hidden controls as well, as exists
+    and wait do.
+    """
+    try:
+        return _find_control(element, visible_only=visible_only)
+    except ElementNotFoundError:
+        return None
+
+
+def _cached_wrapper(key: tuple):
+    """Return the wrapper cached for *key* if it is within the TTL, else None."""
+    cached = _element_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _ELEMENT_CACHE_TTL:
+        return cached[1]
+    return None
+
+
+def _forget_window_elements(window_handle: int) -> None:
+    """Drop every wrapper cached for controls of *window_handle*."""
+    for key in [key for key in _element_cache if key[0] == window_handle]:
+        _element_cache.pop(key, None)
+
+
+def _resolve_wrapper(element, key: tuple):
+    """Resolve a WindowSpecification to its wrapper, reusing recent results.
+
+    Each attribute access on a WindowSpecification repeats the element
+    search; resolving once and acting on the wrapper avoids that. Returns
+    None when the element does not exist.
+    """
+    cached = _cached_wrapper(key)
+    if cached is not None:
+        return cached
+
+    wrapper = _search_wrapper(element)
+    if wrapper is None:
+        _element_cache.pop(key, None)
+    else:
+        _element_cache[key] = (time.monotonic(), wrapper)
+    return wrapper
+
+
+class _CachedWrapper:
+    """Per-call view of a wrapper that reads each state property once.
+
+    rectangle(), is_visible(), is_enabled() and window_text() are
+    cross-process calls; repeated reads within one automation_elements
+    call return the first result. Everything else passes through. Build a
+    new view after anything that may change the control's state.
+    """
+
+    _CACHED_READS = frozenset({"rectangle", "is_visible", "is_enabled", "window_text"})
+
+    def __init__(self, wrapper):
+        self._wrapper = wrapper
+        self._values: dict[str, Any] = {}
+
+    @property
+    def __class__(self):
+        # Keeps isinstance() checks against the wrapper classes working
+        return type(self._wrapper)
+
+    def __getattr__(self, name):
+        attr = getattr(self._wrapper, name)
+        if name not in self._CACHED_READS:
+            return attr
+
+        def read():
+            if name not in self._values:
+                self._values[name] = attr()
+            return self._values[name]
+
+        return read
+
+
+# Longest gap between re-checks while waiting on UIA structure events; some
+# changes (a control being shown, say) raise no structure event
+_WAIT_RECHECK_INTERVAL = 0.5
+
+# Without an event subscription, re-checks start this far apart (seconds)...
+_WAIT_POLL_INITIAL = 0.005
+
+# ...and back off by this factor up to _WAIT_POLL_INTERVAL
+_WAIT_POLL_BACKOFF = 1.5
+
+# Longest gap between re-checks when no event subscription is available
+_WAIT_POLL_INTERVAL = 0.1
+
+
+@lru_cache(maxsize=1)
+def _structure_handler_class():
+    """Build the COM class for StructureChanged callbacks (comtypes loaded lazily)."""
+    from comtypes import COMObject
+    from pywinauto.uia_defines import IUIA
+
+    class _StructureChangedHandler(COMObject):
+        _com_interfaces_ = [IUIA().UIA_dll.IUIAutomationStructureChangedEventHandler]
+
+        def __init__(self, event: threading.Event):
+            super().__init__()
+            self._event = event
+
+        def HandleStructureChangedEvent(self, sender, change_type, runtime_id):  # noqa: N802
+            self._event.set()
+
+    return _StructureChangedHandler
+
+
+def _subscribe_structure_changed(window, event: threading.Event) -> Callable[[], None] | None:
+    """Set *event* whenever *window*'s UIA subtree changes.
+
+    Returns a callable that removes the subscription, or None when events
+    are unavailable (non-UIA backend or registration failed).
+    """
+    if settings.PYWINAUTO_BACKEND != "uia":
+        return None
+    try:
+        from pywinauto.uia_defines import IUIA
+
+        uia = IUIA()
+        root = window.wrapper_object().element_info.element
+        handler = _structure_handler_class()(event)
+        uia.iuia.AddStructureChangedEventHandler(
+            root, uia.tree_scope["descendants"], None, handler
+        )
+    except Exception as e:
+        logger.debug(f"StructureChanged subscription failed, polling instead: {e}")
+        return None
+    return lambda: uia.iuia.RemoveStructureChangedEventHandler(root, handler)
+
+
+def _wait_for_element(window, element, timeout: float) -> float | None:
+    """Wait up to *timeout* seconds for *element* to exist.
+
+    Re-checks when the window's UIA structure changes instead of searching
+    on a fixed short interval. Without UIA events it polls, starting at a
+    few milliseconds and backing off to _WAIT_POLL_INTERVAL, so elements
+    that appear quickly are seen quickly. Returns the seconds waited, or
+    None on timeout.
+    """
+    if timeout <= 0:
+        # A single probe; not worth registering an event handler for
+        return 0.0 if element.exists(timeout=0) else None
+    start_time = time.monotonic()
+    changed = threading.Event()
+    unsubscribe = _subscribe_structure_changed(window, changed)
+    polling = unsubscribe is None
+    interval = _WAIT_POLL_INITIAL if polling else _WAIT_RECHECK_INTERVAL
+    try:
+        while True:
+            if element.exists(timeout=0):
+                return time.monotonic() - start_time
+            remaining = timeout - (time.monotonic() - start_time)
+            if remaining <= 0:
+                return None
+            changed.wait(min(remaining, interval))
+            changed.clear()
+            if polling:
+                interval = min(_WAIT_POLL_INTERVAL, interval * _WAIT_POLL_BACKOFF)
+    finally:
+        if unsubscribe is not None:
+            try:
+                unsubscribe()
+            except Exception as e:
+                logger.debug(f"StructureChanged unsubscribe failed: {e}")
+
+
+def _ok(operation: str, timestamp: float, **fields: Any) -> dict[str, Any]:
+    """Build a success response for *operation* carrying *fields*."""
+    return {"status": "success", "operation": operation, **fields, "timestamp": timestamp}
+
+
+def _err(operation: str, error: str, **fields: Any) -> dict[str, Any]:
+    """Build an error response for *operation*, with any extra *fields*."""
+    return {"status": "error", "operation": operation, "error": error, **fields}
+
+
+@dataclass
+class _OpContext:
+    """Arguments and resolved window for one automation_elements call."""
+
+    operation: str
+    window_handle: int
+    window: Any
+    selectors: tuple
+    has_selector: bool
+    element_key: tuple
+    timestamp: float
+    auto_id: str | None = None
+    title: str | None = None
+    x: int | None = None
+    y: int | None = None
+    button: str = "left"
+    anchor: str = "center"
+    absolute: bool = False
+    duration: float = 0.5
+    text: str | None = None
+    expected_text: str | None = None
+    exact_match: bool = True
+    timeout: float = 5.0
+    max_depth: int = 3
+    verbose: bool = False
+    active_form_only: bool = True
+    refresh_rect: bool = False
+    operations: list[str] | None = None
+    steps: list[dict[str, Any]] | None = None
+    # Set for operations in _ELEMENT_OPS before their handler runs
+    element: Any = None
+    selector_desc: str = ""
+    # Set for operations in _WRAPPER_OPS before their handler runs
+    wrapper: Any = None
+
+
+# Exception class -> (error_type reported to clients, message prefix); other
+# exceptions report their own class name with no prefix
+_EXCEPTION_RESULTS: dict[type, tuple[str, str]] = {
+    ElementNotFoundError: ("ElementNotFoundError", "Element not found: "),
+    ElementNotVisible: ("ElementNotVisible", "Element not visible: "),
+}
+
+
+def _exception_err(operation: str, e: Exception) -> dict[str, Any]:
+    """Build the error response for an exception raised by *operation*."""
+    for cls in type(e).__mro__:
+        known = _EXCEPTION_RESULTS.get(cls)
+        if known is not None:
+            error_type, prefix = known
+            return _err(operation, f"{prefix}{e}", error_type=error_type)
+    return _err(operation, str(e), error_type=type(e).__name__)
+
+
+def _selected_ok(ctx: _OpContext, **fields: Any) -> dict[str, Any]:
+    """Build a success response for an operation on the selected element."""
+    return _ok(ctx.operation, ctx.timestamp, selector=ctx.selector_desc, **fields)
+
+
+def _not_found(ctx: _OpContext, desc: str) -> dict[str, Any]:
+    return _err(ctx.operation, f"Element with {desc} not found")
+
+
+# Window rectangles for x/y offsets: hwnd -> (timestamp, (left, top, right, bottom))
+_window_rect_cache: dict[int, tuple[float, tuple[int, int, int, int]]] = {}
+
+# How long a cached window rectangle is trusted (seconds)
+_WINDOW_RECT_TTL = 0.5
+
+
+def _window_rect(handle: int, window, refresh: bool = False) -> tuple[int, int, int, int]:
+    """Return the window's (left, top, right, bottom), cached briefly per handle.
+
+    A window moved within the TTL is not noticed; pass *refresh* to re-read.
+    """
+    now = time.monotonic()
+    cached = _window_rect_cache.get(handle)
+    if not refresh and cached is not None and now - cached[0] < _WINDOW_RECT_TTL:
+        return cached[1]
+    r = window.rectangle()
+    rect = (r.left, r.top, r.right, r.bottom)
+    _window_rect_cache[handle] = (now, rect)
+    return rect
+
+
+def _wrap_handle(handle: int):
+    """Build the configured backend's wrapper for window *handle* without a search."""
+    from pywinauto.backend import registry
+
+    backend = registry.backends[settings.PYWINAUTO_BACKEND]
+    return backend.generic_wrapper_class(backend.element_info_class(handle))
+
+
+def _bridge_wrapper(ctx: _OpContext):
+    """Wrap the selected control straight from the HWND the Delphi bridge reports.
+
+    Used only when lookups are restricted to the active form and auto_id
+    and/or title are the only selectors, so the bridge match covers every
+    criterion. The active form need not be the target window, so the
+    handle is used only if it is that window or one of its descendants.
+    Returns None when the bridge is unavailable, finds nothing, the
+    control is non-windowed (handle 0) or lies outside the target window.
+    """
+    if not ctx.active_form_only or not (ctx.auto_id or ctx.title):
+        return None
+    control_id, _, _, class_name, control_type = ctx.selectors
+    if control_id is not None or class_name is not None or control_type is not None:
+        return None
+    bridge = _get_bridge()
+    if bridge is None:
+        return None
+    try:
+        results = _bridge_find_controls(bridge, ctx.auto_id, ctx.title, active_form_only=True)
+        handle = results[0].get("handle", 0) if results else 0
+        if handle and (handle == ctx.window_handle or IsChild(ctx.window_handle, handle)):
+            return _wrap_handle(handle)
+    except Exception as e:
+        logger.debug(f"Bridge handle lookup failed: {e}")
+    return None
+
+
+def _selected_wrapper(ctx: _OpContext):
+    """Resolve the wrapper for *ctx*'s selectors, or None if nothing matches.
+
+    A windowed control the bridge already knows is wrapped from its handle;
+    otherwise the bound element specification is searched for.
+    """
+    wrapper = _bridge_wrapper(ctx)
+    if wrapper is None:
+        wrapper = _resolve_wrapper(ctx.element, ctx.element_key)
+    return wrapper
+
+
+def _resolve_target(ctx: _OpContext) -> tuple[str, Any, Any]:
+    """Resolve the target of a pointer operation (click, hover, ...).
+
+    Returns ``("element", wrapper, selector_desc)`` when selectors are
+    given, ``("point", x, y)`` in screen coordinates when x and y are, and
+    ``("error", result, None)`` otherwise. An element already bound to
+    *ctx* is reused rather than specified again.
+    """
+    if ctx.has_selector:
+        if ctx.element is None:
+            ctx.element, ctx.selector_desc = _find_element(ctx.window, *ctx.selectors)
+        wrapper = _selected_wrapper(ctx)
+        if wrapper is None:
+            return "error", _not_found(ctx, ctx.selector_desc), None
+        return "element", wrapper, ctx.selector_desc
+    if ctx.x is not None and ctx.y is not None:
+        if ctx.absolute:
+            return "point", ctx.x, ctx.y
+        left, top, _, _ = _window_rect(ctx.window_handle, ctx.window, ctx.refresh_rect)
+        return "point", left + ctx.x, top + ctx.y
+    return "error", _err(
+        ctx.operation,
+        "A selector (control_id/auto_id/title/class_name/control_type)"
+        " or both x and y must be provided",
+    ), None
+
+
+def _init_com_worker() -> None:
+    """Join the multithreaded COM apartment pywinauto uses.
+
+    Wrappers created on the calling thread can then be read from the worker.
+    """
+    try:
+        import pythoncom
+
+        pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+    except Exception as e:
+        logger.debug(f"CoInitializeEx failed in element info worker: {e}")
+
+
+# Maximum number of sibling elements whose info is read concurrently
+_ELEMENT_INFO_WORKERS = 8
+
+# Reads sibling element info in parallel; each read is a cross-process call
+# that releases the GIL while it waits
+_element_info_executor = ThreadPoolExecutor(
+    max_workers=_ELEMENT_INFO_WORKERS,
+    thread_name_prefix="element-info",
+    initializer=_init_com_worker,
+)
+
+
+def _list_wrapper_children(
+    elem, max_depth: int, verbose: bool = False
+) -> list[dict[str, Any]]:
+    """Describe *elem*'s children, down to *max_depth*, through pywinauto wrappers.
+
+    Walks with an explicit stack, so deep trees do not hit the recursion
+    limit. The info for a parent's children is read on a small thread pool,
+    with the type-specific extras only if *verbose*.
+    """
+    element_info = partial(_get_element_info, verbose=verbose)
+    elements: list[dict[str, Any]] = []
+    # (list to append children to, element whose children to read, depth)
+    stack = [(elements, elem, 0)]
+    while stack:
+        bucket, parent, depth = stack.pop()
+        try:
+            children = parent.children()
+            if len(children) > 1:
+                infos = _element_info_executor.map(element_info, children)
+            else:
+                infos = map(element_info, children)
+            for child, elem_info in zip(children, infos, strict=True):
+                elem_info["children"] = []
+                bucket.append(elem_info)
+                if depth < max_depth:
+                    stack.append((elem_info["children"], child, depth + 1))
+        except Exception as e:
+            logger.warning(f"Error getting children: {e}")
+
+    return elements
+
+
+def _op_list(ctx: _OpContext) -> dict[str, Any]:
+    # Prefer Delphi bridge — sees all controls including non-windowed
+    bridge = _get_bridge()
+    if bridge is not None:
+        try:
+            raw = bridge.get_form_controls(ctx.window_handle)
+            elements = [_bridge_control_to_element_info(c) for c in raw]
+            return _ok(
+                "list",
+                ctx.timestamp,
+                source="delphi_bridge",
+                window_handle=ctx.window_handle,
+                element_count=len(elements),
+                elements=elements,
+            )
+        except Exception as e:
+            logger.debug(f"Bridge list failed, falling back to Win32: {e}")
+
+    # Fallback: Win32 enumeration
+    window = ctx.window
+    if not window.exists():
+        return _err("list", f"Window with handle {ctx.window_handle} not found")
+
+    elements = None
+    if settings.PYWINAUTO_BACKEND == "uia":
+        try:
+            root = window.wrapper_object().element_info.element
+            elements = _list_uia_elements(root, ctx.max_depth)
+        except Exception as e:
+            logger.debug(f"Cached UIA listing failed, walking wrappers: {e}")
+    if elements is None:
+        elements = _list_wrapper_children(window, ctx.max_depth, ctx.verbose)
+    return _ok(
+        "list",
+        ctx.timestamp,
+        source="win32",
+        window_handle=ctx.window_handle,
+        element_count=len(elements),
+        elements=elements,
+        max_depth=ctx.max_depth,
+    )
+
+
+def _op_click(ctx: _OpContext) -> dict[str, Any]:
+    # Try Delphi bridge first for auto_id or title
+    bridge = _get_bridge()
+    if bridge is not None and (ctx.auto_id or ctx.title):
+        try:
+            results = _bridge_find_controls(
+                bridge, ctx.auto_id, ctx.title,
+                active_form_only=ctx.active_form_only,
+            )
+            if results:
+                ctrl = results[0]
+                if _bridge_click(
+                    ctrl, ctx.window_handle, ctx.button,
+                    anchor=ctx.anchor,
+                ):
+                    return _ok(
+                        "click",
+                        ctx.timestamp,
+                        source="delphi_bridge",
+                        automation_id=ctrl.get("name", ""),
+                        text=ctrl.get("text", ""),
+                        button=ctx.button,
+                        anchor=ctx.anchor,
+                    )
+        except Exception as e:
+            logger.debug(f"Bridge click failed: {e}")
+
+    kind, target, detail = _resolve_target(ctx)
+    if kind == "error":
+        return target
+    if kind == "element":
+        _click_element(target, ctx.window_handle, ctx.button)
+        return _ok("click", ctx.timestamp, selector=detail, button=ctx.button)
+    _click(target, detail, ctx.button)
+    return _ok("click", ctx.timestamp, x=ctx.x, y=ctx.y, absolute=ctx.absolute, button=ctx.button)
+
+
+def _op_double_click(ctx: _OpContext) -> dict[str, Any]:
+    kind, target, detail = _resolve_target(ctx)
+    if kind == "error":
+        return target
+    if kind == "element":
+        _click_element(target, ctx.window_handle, ctx.button, clicks=2)
+        return _ok("double_click", ctx.timestamp, selector=detail, button=ctx.button)
+    _click(target, detail, ctx.button, clicks=2)
+    return _ok(
+        "double_click",
+        ctx.timestamp,
+        x=ctx.x,
+        y=ctx.y,
+        absolute=ctx.absolute,
+        button=ctx.button,
+    )
+
+
+def _op_right_click(ctx: _OpContext) -> dict[str, Any]:
+    kind, target, detail = _resolve_target(ctx)
+    if kind == "error":
+        return target
+    if kind == "element":
+        _click_element(target, ctx.window_handle, "right")
+        return _ok("right_click", ctx.timestamp, selector=detail)
+    _click(target, detail, "right")
+    return _ok("right_click", ctx.timestamp, x=ctx.x, y=ctx.y, absolute=ctx.absolute)
+
+
+def _op_hover(ctx: _OpContext) -> dict[str, Any]:
+    kind, target, detail = _resolve_target(ctx)
+    if kind == "error":
+        return target
+    if kind == "element":
+        rect = target.rectangle()
+        position = (rect.left + (rect.width() // 2), rect.top + (rect.height() // 2))
+        selector = {"selector": detail}
+    else:
+        position = (target, detail)
+        selector = {}
+    _move(*position)
+    time.sleep(ctx.duration)
+    return _ok("hover", ctx.timestamp, **selector, position=position, duration=ctx.duration)
+
+
+def _op_info(ctx: _OpContext) -> dict[str, Any]:
+    info = _get_element_info(ctx.wrapper)
+    info["status"] = "success"
+    info["operation"] = "info"
+    info["timestamp"] = ctx.timestamp
+    return info
+
+
+def _op_text(ctx: _OpContext) -> dict[str, Any]:
+    return _selected_ok(ctx, text=ctx.wrapper.window_text())
+
+
+# UIA control types that wrap an inner Edit in composite (DevExpress/VCL) controls
+_CONTAINER_TYPES = frozenset({"Pane", "Group", "Custom"})
+
+
+def _find_edit_child(wrapper):
+    """Return the first direct Edit child of a UIA *wrapper*, or None.
+
+    A single FindFirst with a control-type condition, rather than reading
+    the control type of every child.
+    """
+    from pywinauto.controls.uiawrapper import UIAWrapper
+    from pywinauto.uia_defines import IUIA
+    from pywinauto.uia_element_info import UIAElementInfo
+
+    uia = IUIA()
+    condition = uia.iuia.CreatePropertyCondition(
+        uia.UIA_dll.UIA_ControlTypePropertyId, uia.known_control_types["Edit"]
+    )
+    found = wrapper.element_info.element.FindFirst(uia.tree_scope["children"], condition)
+    return UIAWrapper(UIAElementInfo(found)) if found else None
+
+
+def _op_set_text(ctx: _OpContext) -> dict[str, Any]:
+    text = ctx.text
+    if text is None:
+        return _err("set_text", "text parameter is required for set_text operation")
+
+    # Try Delphi bridge first for auto_id or title
+    bridge = _get_bridge()
+    if bridge is not None and (ctx.auto_id or ctx.title):
+        try:
+            results = _bridge_find_controls(
+                bridge, ctx.auto_id, ctx.title,
+                active_form_only=ctx.active_form_only,
+            )
+            if results:
+                ctrl = results[0]
+                # Click the control to focus it — physical
+                # click goes through VCL's full focus pipeline
+                # which SetFocus alone does not.
+                if _bridge_click(ctrl, ctx.window_handle):
+                    time.sleep(0.15)
+                    _type_replacing(text)
+                    _invalidate_bridge_caches()
+                    return _ok(
+                        "set_text",
+                        ctx.timestamp,
+                        source="delphi_bridge",
+                        automation_id=ctrl.get("name", ""),
+                        text_set=text,
+                        method="keyboard",
+                    )
+        except Exception as e:
+            logger.debug(f"Bridge set_text failed: {e}")
+
+    wrapper = _resolve_wrapper(ctx.element, ctx.element_key)
+    if wrapper is None:
+        return _not_found(ctx, ctx.selector_desc)
+
+    # Resolve the target: if the element is a container (Pane),
+    # look for an Edit-type child to type into (common with
+    # DevExpress/VCL composite controls like TcxTextEdit).
+    target = wrapper
+    try:
+        ct = str(getattr(wrapper.element_info, "control_type", ""))
+        if ct in _CONTAINER_TYPES:
+            edit = _find_edit_child(wrapper)
+            if edit is not None:
+                target = edit
+                logger.debug(f"set_text: using inner Edit child of {ct} element")
+    except Exception as e:
+        logger.debug(
+            f"set_text: could not inspect children, using element directly: {e}"
+        )
+
+    # Always use focus + keyboard input. WM_SETTEXT and UIA
+    # ValuePattern update the Win32 buffer but don't notify
+    # VCL/DevExpress, causing broken internal state.
+    if ctx.window_handle:
+        # Keystrokes sent to a hung window are queued and land wherever
+        # focus is once it recovers; fail fast instead
+        if not _window_responding(ctx.window_handle):
+            return _err("set_text", f"Window {ctx.window_handle} is not responding")
+        _bring_to_foreground(ctx.window_handle)
+
+    if target is wrapper:
+        wrapper.set_focus()
+    else:
+        try:
+            target.set_focus()
+        except Exception as e:
+            logger.debug(f"set_text: inner Edit refused focus, focusing element: {e}")
+            wrapper.set_focus()
+    time.sleep(0.1)
+    _type_replacing(text)
+    _invalidate_bridge_caches()
+    method = "keyboard"
+
+    return _selected_ok(ctx, text_set=text, method=method)
+
+
+def _op_rect(ctx: _OpContext) -> dict[str, Any]:
+    # Try Delphi bridge first — UIA can't see many VCL controls
+    bridge = _get_bridge()
+    if bridge is not None and (ctx.auto_id or ctx.title):
+        try:
+            results = _bridge_find_controls(
+                bridge, ctx.auto_id, ctx.title,
+                active_form_only=ctx.active_form_only,
+            )
+            if results:
+                ctrl = results[0]
+                handle = ctrl.get("handle", 0)
+                if handle:
+                    import win32gui
+
+                    r = win32gui.GetWindowRect(handle)
+                    return _ok(
+                        "rect",
+                        ctx.timestamp,
+                        source="delphi_bridge",
+                        automation_id=ctrl.get("name", ""),
+                        left=r[0],
+                        top=r[1],
+                        right=r[2],
+                        bottom=r[3],
+                        width=r[2] - r[0],
+                        height=r[3] - r[1],
+                    )
+        except Exception as e:
+            logger.debug(f"Bridge rect failed: {e}")
+
+    wrapper = _resolve_wrapper(ctx.element, ctx.element_key)
+    if wrapper is None:
+        return _not_found(ctx, ctx.selector_desc)
+    rect = wrapper.rectangle()
+    return _selected_ok(
+        ctx,
+        left=rect.left,
+        top=rect.top,
+        right=rect.right,
+        bottom=rect.bottom,
+        width=rect.right - rect.left,
+        height=rect.bottom - rect.top,
+    )
+
+
+def _op_visible(ctx: _OpContext) -> dict[str, Any]:
+    return _selected_ok(ctx, is_visible=ctx.wrapper.is_visible())
+
+
+def _op_enabled(ctx: _OpContext) -> dict[str, Any]:
+    return _selected_ok(ctx, is_enabled=ctx.wrapper.is_enabled())
+
+
+def _op_exists(ctx: _OpContext) -> dict[str, Any]:
+    wait_time = _wait_for_element(ctx.window, ctx.element, ctx.timeout)
+    if wait_time is not None:
+        return _selected_ok(ctx, exists=True, wait_time=wait_time)
+
+    return _selected_ok(ctx, exists=False, timeout=ctx.timeout)
+
+
+def _op_wait(ctx: _OpContext) -> dict[str, Any]:
+    wait_time = _wait_for_element(ctx.window, ctx.element, ctx.timeout)
+    if wait_time is not None:
+        # Read the info through one resolved wrapper; every attribute read on
+        # the WindowSpecification itself would search for the element again.
+        # exists() matched hidden controls too, so the search must as well.
+        wrapper = _search_wrapper(ctx.element, visible_only=False)
+        return _selected_ok(
+            ctx,
+            found=True,
+            wait_time=wait_time,
+            element=_get_element_info(_CachedWrapper(wrapper)) if wrapper is not None else {},
+        )
+
+    return _err(
+        "wait",
+        f"Element not found within {ctx.timeout} seconds",
+        selector=ctx.selector_desc,
+    )
+
+
+def _op_verify_text(ctx: _OpContext) -> dict[str, Any]:
+    expected_text = ctx.expected_text
+    if expected_text is None:
+        return _err("verify_text", "expected_text parameter is required")
+
+    actual_text = ctx.wrapper.window_text()
+    if ctx.exact_match:
+        matches = actual_text == expected_text
+    else:
+        # Case folding maps characters one by one, so a same-case hit needs
+        # no folded copies
+        matches = (
+            expected_text in actual_text
+            or expected_text.casefold() in actual_text.casefold()
+        )
+
+    result = _selected_ok(
+        ctx,
+        expected_text=expected_text,
+        actual_text=actual_text,
+        exact_match=ctx.exact_match,
+        match_found=matches,
+    )
+    if not matches:
+        result["status"] = "failure"
+    return result
+
+
+# Operation name -> handler; one dict lookup replaces the if/elif chain
+_OP_HANDLERS: dict[str, Callable[[_OpContext], dict[str, Any]]] = {
+    "click": _op_click,
+    "double_click": _op_double_click,
+    "right_click": _op_right_click,
+    "hover": _op_hover,
+    "info": _op_info,
+    "text": _op_text,
+    "set_text": _op_set_text,
+    "rect": _op_rect,
+    "visible": _op_visible,
+    "enabled": _op_enabled,
+    "exists": _op_exists,
+    "wait": _op_wait,
+    "verify_text": _op_verify_text,
+    "list": _op_list,
+}
+
+# Operations that act on a selected element and need at least one selector
+_ELEMENT_OPS = frozenset(
+    {"info", "text", "set_text", "rect", "visible", "enabled", "exists", "wait", "verify_text"}
+)
+
+# Element operations that only ever read the resolved UIA wrapper. The
+# element is found once before dispatch; rect and set_text try the Delphi
+# bridge first and resolve the wrapper only when that fails.
+_WRAPPER_OPS = frozenset({"info", "text", "visible", "enabled", "verify_text"})
+
+
+def _bind_element(ctx: _OpContext) -> dict[str, Any] | None:
+    """Locate the selected element for an operation in _ELEMENT_OPS.
+
+    Fills in ``ctx.element`` and ``ctx.selector_desc``, and ``ctx.wrapper``
+    for _WRAPPER_OPS, keeping any already set. Returns an error result when
+    no selector is given or the wrapper cannot be found, otherwise None.
+    """
+    if not ctx.has_selector:
+        return _err(
+            ctx.operation,
+            f"At least one selector (control_id, auto_id, title,"
+            f" class_name, control_type) is required for {ctx.operation}",
+        )
+    if ctx.element is None:
+        ctx.element, ctx.selector_desc = _find_element(ctx.window, *ctx.selectors)
+    if ctx.operation in _WRAPPER_OPS and ctx.wrapper is None:
+        wrapper = _selected_wrapper(ctx)
+        if wrapper is None:
+            return _not_found(ctx, ctx.selector_desc)
+        ctx.wrapper = _CachedWrapper(wrapper)
+    return None
+
+
+# Operations that may change the control, so state read before them is stale
+_MUTATING_OPS = frozenset({"click", "double_click", "right_click", "set_text"})
+
+
+def _dispatch(ctx: _OpContext) -> dict[str, Any]:
+    """Bind the element for ``ctx.operation`` if it needs one, then run it."""
+    result = _bind_element(ctx) if ctx.operation in _ELEMENT_OPS else None
+    if result is None:
+        result = _OP_HANDLERS[ctx.operation](ctx)
+    return result
+
+
+def _run_operation(ctx: _OpContext) -> dict[str, Any]:
+    """Run ``ctx.operation``, retrying once if a reused wrapper was stale.
+
+    A wrapper bound earlier or taken from _element_cache may belong to a
+    control the application has since recreated. If the operation raises
+    while it had one, the wrapper is dropped and the operation runs once
+    more against a fresh search. After a mutating operation every wrapper
+    cached for the window is dropped, as any of its controls may have
+    been replaced.
+    """
+    reused = ctx.has_selector and (
+        ctx.wrapper is not None or _cached_wrapper(ctx.element_key) is not None
+    )
+    try:
+        try:
+            return _dispatch(ctx)
+        except Exception as e:
+            if not reused:
+                raise
+            logger.debug(f"{ctx.operation} failed on a reused wrapper, searching again: {e}")
+            _element_cache.pop(ctx.element_key, None)
+            ctx.wrapper = None
+            return _dispatch(ctx)
+    finally:
+        if ctx.operation in _MUTATING_OPS:
+            _forget_window_elements(ctx.window_handle)
+
+
+def _op_batch(ctx: _OpContext) -> dict[str, Any]:
+    """Run ``ctx.operations`` in order against the one selected element.
+
+    The element is searched for once and shared by every step. A failing
+    step is reported in its result and does not stop the rest.
+    """
+    operations = ctx.operations
+    if not operations:
+        return _err("batch", "operations parameter is required for batch operation")
+    unknown = [op for op in operations if op not in _BATCH_OPERATIONS]
+    if unknown:
+        return _err(
+            "batch",
+            f"Unknown operations: {', '.join(map(str, unknown))}",
+            valid_operations=list(_BATCH_OPERATIONS),
+        )
+
+    results = []
+    for op in operations:
+        ctx.operation = op
+        try:
+            result = _run_operation(ctx)
+        except Exception as e:
+            _element_cache.pop(ctx.element_key, None)
+            ctx.wrapper = None
+            result = _exception_err(op, e)
+        results.append(result)
+        if op in _MUTATING_OPS:
+            ctx.wrapper = None
+    ctx.operation = "batch"
+    return _ok("batch", ctx.timestamp, results=results)
+
+
+_OP_HANDLERS["batch"] = _op_batch
+
+# Step keys naming the step's element, in _find_element argument order
+_SELECTOR_KEYS = ("control_id", "auto_id", "title", "class_name", "control_type")
+
+# Step keys that override the chain call's own arguments for that step
+_STEP_OPTIONS = frozenset(
+    {
+        "x",
+        "y",
+        "button",
+        "anchor",
+        "absolute",
+        "duration",
+        "text",
+        "expected_text",
+        "exact_match",
+        "timeout",
+        "max_depth",
+        "verbose",
+        "active_form_only",
+        "refresh_rect",
+        "operations",
+    }
+)
+
+# Every key a chain step may contain
+_STEP_KEYS = frozenset({"operation", *_SELECTOR_KEYS, *_STEP_OPTIONS})
+
+
+def _step_context(ctx: _OpContext, step: dict[str, Any]) -> _OpContext:
+    """Build the context for one chain *step* in the chain's window."""
+    selectors = tuple(step.get(key) for key in _SELECTOR_KEYS)
+    return replace(
+        ctx,
+        operation=step["operation"],
+        selectors=selectors,
+        has_selector=selectors != _NO_SELECTORS,
+        element_key=(ctx.window_handle, *selectors),
+        auto_id=step.get("auto_id"),
+        title=step.get("title"),
+        steps=None,
+        element=None,
+        selector_desc="",
+        wrapper=None,
+        **{key: value for key, value in step.items() if key in _STEP_OPTIONS},
+    )
+
+
+def _op_chain(ctx: _OpContext) -> dict[str, Any]:
+    """Run ``ctx.steps`` in order, each on its own element, in one window.
+
+    The window is resolved once for the whole chain. Stops at the first
+    step that does not succeed.
+    """
+    steps = ctx.steps
+    if not steps:
+        return _err("chain", "steps parameter is required for chain operation")
+
+    results: list[dict[str, Any]] = []
+    for i, step in enumerate(steps):
+        op = step.get("operation")
+        if op not in _CHAIN_OPERATIONS:
+            return _err(
+                "chain",
+                f"Step {i}: unknown operation: {op}",
+                failed_step=i,
+                results=results,
+                valid_operations=list(_CHAIN_OPERATIONS),
+            )
+        unknown = sorted(step.keys() - _STEP_KEYS)
+        if unknown:
+            return _err(
+                "chain",
+                f"Step {i}: unknown keys: {', '.join(unknown)}",
+                failed_step=i,
+                results=results,
+            )
+
+        step_ctx = _step_context(ctx, step)
+        try:
+            result = _run_operation(step_ctx)
+        except Exception as e:
+            _element_cache.pop(step_ctx.element_key, None)
+            result = _exception_err(op, e)
+        results.append(result)
+        if result["status"] != "success":
+            return _err("chain", f"Step {i} ({op}) failed", failed_step=i, results=results)
+    return _ok("chain", ctx.timestamp, results=results)
+
+
+_OP_HANDLERS["chain"] = _op_chain
+
+# Operation names, in documentation order, for unknown-operation errors
+_VALID_OPERATIONS: tuple[str, ...] = tuple(_OP_HANDLERS)
+
+# Operations allowed as batch steps; batches do not nest or chain
+_BATCH_OPERATIONS: tuple[str, ...] = tuple(
+    op for op in _VALID_OPERATIONS if op not in ("batch", "chain")
+)
+
+# Operations allowed as chain steps; chains do not nest
+_CHAIN_OPERATIONS: tuple[str, ...] = tuple(op for op in _VALID_OPERATIONS if op != "chain")
+
+
 if app is not None:
     logger.info("Registering portmanteau_elements tool with FastMCP")
 
@@ -377,6 +1763,7 @@ Specify the parent window using EITHER:
 - window_title: Window title text (exact match, case-insensitive)
 
 Using window_title lets you skip the window discovery step entirely.
+Resolved titles are cached; pass refresh_window_cache=True to force a new search.
 
 ELEMENT SELECTION:
 Elements can be targeted using any combination of these selectors:
@@ -406,12 +1793,30 @@ SUPPORTED OPERATIONS:
 - wait: Wait for element to appear (with timeout)
 - verify_text: Verify element contains expected text
 - list: Get all elements in window (with depth control)
+- batch: Run the operations listed in `operations` on one element, in order
+- chain: Run the steps listed in `steps`, each on its own element, in order
 
 ACTIVE FORM SCOPE:
 active_form_only defaults to True — bridge lookups are restricted to the
 currently active form to avoid cross-form name collisions. Set False only
 when you need to target a control on a non-active form.
 
+BATCHING:
+Finding the element is the expensive part of most operations. To read
+several things about one control, pass operation="batch" with a list of
+operations; the element is found once and each step's result is returned
+in "results". A failing step does not stop the others.
+
+To act on several controls in one window, pass operation="chain" with a
+list of steps. Each step is a dict with an "operation" plus that
+operation's selectors and arguments (auto_id, title, text, ...); missing
+arguments default to the chain call's own. The window is resolved once,
+steps run in order, and the chain stops at the first step that fails.
+
+RELATIVE COORDINATES:
+Window-relative x/y use the window rectangle, cached for 0.5 seconds per
+window. Pass refresh_rect=True right after moving or resizing the window.
+
 Examples:
     # List elements to discover automation_id values
     automation_elements("list", window_title="Login")
@@ -427,6 +1832,17 @@ Examples:
     # List all elements (for discovery when selectors are unknown)
     automation_elements("list", window_title="MyApp")
 
+    # Several checks on one control with a single lookup
+    automation_elements("batch", auto_id="Btn_Login",
+                        operations=["visible", "enabled", "rect"])
+
+    # Fill a form and submit it in one call
+    automation_elements("chain", window_title="Login", steps=[
+        {"operation": "set_text", "auto_id": "TE_Username", "text": "admin"},
+        {"operation": "set_text", "auto_id": "TE_Password", "text": "secret"},
+        {"operation": "click", "auto_id": "Btn_Login"},
+    ])
+
 """,
     )
     def automation_elements(
@@ -445,6 +1861,8 @@ Examples:
             "wait",
             "verify_text",
             "list",
+            "batch",
+            "chain",
         ],
         window_handle: int | None = None,
         window_title: str | None = None,
@@ -464,7 +1882,12 @@ Examples:
         exact_match: bool = True,
         timeout: float = 5.0,
         max_depth: int = 3,
+        verbose: bool = False,
         active_form_only: bool = True,
+        refresh_window_cache: bool = False,
+        refresh_rect: bool = False,
+        operations: list[str] | None = None,
+        steps: list[dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         """Comprehensive UI element interaction operations for Windows automation.
 
@@ -490,14 +1913,27 @@ Examples:
             exact_match (bool): Toggles between strict and partial string matching.
             timeout (float): Maximum seconds to wait for an element to become ready.
             max_depth (int): Recursion limit for child element discovery.
+            verbose (bool): For list, also read edit read-only state and
+                combobox items/selection when walking pywinauto wrappers.
             active_form_only (bool): Restrict Delphi bridge lookups to the
                 currently active form. Default True to avoid cross-form name
                 collisions. Set False to search all forms.
+            refresh_window_cache (bool): Ignore the cached window_title -> handle
+                mapping and search the desktop again.
+            refresh_rect (bool): Re-read the window rectangle used for relative
+                x/y instead of reusing one read in the last 0.5 seconds.
+            operations (list[str] | None): Operations to run, in order, for
+                the batch operation.
+            steps (list[dict[str, Any]] | None): Steps for the chain operation,
+                each a dict with "operation" and that operation's arguments.
 
         Returns:
             dict[str, Any]: Operation-specific result dictionary with element status.
 
         """
+        selectors = (control_id, auto_id, title, class_name, control_type)
+        has_selector = selectors != _NO_SELECTORS
+        element_key = None
         try:
             timestamp = time.time()
             logger.info(
@@ -510,665 +1946,61 @@ Examples:
 
             # === RESOLVE WINDOW: by handle or by title ===
             if window_handle is None and window_title is not None:
-                for w in desktop.windows():
-                    try:
-                        if w.window_text().lower() == window_title.lower():
-                            window_handle = w.handle
-                            break
-                    except Exception:
-                        continue
-                if window_handle is None:
-                    return {
-                        "status": "error",
-                        "operation": operation,
-                        "error": f"No window found with title '{window_title}'",
-                    }
-
-            # === LIST OPERATION (doesn't require control_id) ===
-            if operation == "list":
+                window_handle = find_window_handle(
+                    window_title, desktop.windows, refresh=refresh_window_cache
+                )
                 if window_handle is None:
-                    return {
-                        "status": "error",
-                        "operation": "list",
-                        "error": "window_handle or window_title parameter is required",
-                    }
-
-                # Prefer Delphi bridge — sees all controls including non-windowed
-                bridge = _get_bridge()
-                if bridge is not None:
-                    try:
-                        raw = bridge.get_form_controls(window_handle)
-                        elements = [_bridge_control_to_element_info(c) for c in raw]
-                        return {
-                            "status": "success",
-                            "operation": "list",
-                            "source": "delphi_bridge",
-                            "window_handle": window_handle,
-                            "element_count": len(elements),
-                            "elements": elements,
-                            "timestamp": timestamp,
-                        }
-                    except Exception as e:
-                        logger.debug(f"Bridge list failed, falling back to Win32: {e}")
-
-                # Fallback: Win32 enumeration
-                window = desktop.window(handle=window_handle)
-                if not window.exists():
-                    return {
-                        "status": "error",
-                        "operation": "list",
-                        "error": f"Window with handle {window_handle} not found",
-                    }
-
-                def get_children_recursive(elem, depth=0):
-                    if depth > max_depth:
-                        return []
-
-                    elements = []
-                    try:
-                        for child in elem.children():
-                            elem_info = _get_element_info(child)
-                            elem_info["children"] = get_children_recursive(child, depth + 1)
-                            elements.append(elem_info)
-                    except Exception as e:
-                        logger.warning(f"Error getting children: {e}")
-
-                    return elements
-
-                elements = get_children_recursive(window)
-                return {
-                    "status": "success",
-                    "operation": "list",
-                    "source": "win32",
-                    "window_handle": window_handle,
-                    "element_count": len(elements),
-                    "elements": elements,
-                    "max_depth": max_depth,
-                    "timestamp": timestamp,
-                }
+                    return _err(operation, f"No window found with title '{window_title}'")
 
-            # === VALIDATION FOR OPERATIONS REQUIRING WINDOW ===
-            if window_handle is None:
+            handler = _OP_HANDLERS.get(operation)
+            if handler is None:
                 return {
                     "status": "error",
-                    "operation": operation,
-                    "error": "window_handle or window_title parameter is required",
-                }
-
-            window = desktop.window(handle=window_handle)
-
-            # === OPERATIONS WITH CONTROL_ID OR COORDINATES ===
-
-            # === CLICK OPERATION ===
-            if operation == "click":
-                # Try Delphi bridge first for auto_id or title
-                bridge = _get_bridge()
-                if bridge is not None and (auto_id or title):
-                    try:
-                        results = _bridge_find_controls(
-                            bridge, auto_id, title,
-                            active_form_only=active_form_only,
-                        )
-                        if results:
-                            ctrl = results[0]
-                            if _bridge_click(
-                                ctrl, window_handle, button,
-                                anchor=anchor,
-                            ):
-                                return {
-                                    "status": "success",
-                                    "operation": "click",
-                                    "source": "delphi_bridge",
-                                    "automation_id": ctrl.get("name", ""),
-                                    "text": ctrl.get("text", ""),
-                                    "button": button,
-                                    "anchor": anchor,
-                                    "timestamp": timestamp,
-                                }
-                    except Exception as e:
-                        logger.debug(f"Bridge click failed: {e}")
-
-                has_selector = any(
-                    v is not None for v in [control_id, auto_id, title, class_name, control_type]
-                )
-                if has_selector:
-                    element, desc = _find_element(
-                        window, control_id, auto_id, title, class_name, control_type
-                    )
-                    if not element.exists():
-                        return {
-                            "status": "error",
-                            "operation": "click",
-                            "error": f"Element with {desc} not found",
-                        }
-                    element.click(button=button)
-                    return {
-                        "status": "success",
-                        "operation": "click",
-                        "selector": desc,
-                        "button": button,
-                        "timestamp": timestamp,
-                    }
-                elif x is not None and y is not None:
-                    if absolute:
-                        pyautogui.click(x, y, button=button)
-                    else:
-                        rect = window.rectangle()
-                        pyautogui.click(rect.left + x, rect.top + y, button=button)
-                    return {
-                        "status": "success",
-                        "operation": "click",
-                        "x": x,
-                        "y": y,
-                        "absolute": absolute,
-                        "button": button,
-                        "timestamp": timestamp,
-                    }
-                else:
-                    return {
-                        "status": "error",
-                        "operation": "click",
-                        "error": "A selector (control_id/auto_id/title/class_name/control_type)"
-                        " or both x and y must be provided",
-                    }
-
-            # === DOUBLE_CLICK OPERATION ===
-            elif operation == "double_click":
-                has_selector = any(
-                    v is not None for v in [control_id, auto_id, title, class_name, control_type]
-                )
-                if has_selector:
-                    element, desc = _find_element(
-                        window, control_id, auto_id, title, class_name, control_type
-                    )
-                    if not element.exists():
-                        return {
-                            "status": "error",
-                            "operation": "double_click",
-                            "error": f"Element with {desc} not found",
-                        }
-                    element.double_click(button=button)
-                    return {
-                        "status": "success",
-                        "operation": "double_click",
-                        "selector": desc,
-                        "button": button,
-                        "timestamp": timestamp,
-                    }
-                elif x is not None and y is not None:
-                    if absolute:
-                        pyautogui.doubleClick(x, y, button=button)
-                    else:
-                        rect = window.rectangle()
-                        pyautogui.doubleClick(rect.left + x, rect.top + y, button=button)
-                    return {
-                        "status": "success",
-                        "operation": "double_click",
-                        "x": x,
-                        "y": y,
-                        "absolute": absolute,
-                        "button": button,
-                        "timestamp": timestamp,
-                    }
-                else:
-                    return {
-                        "status": "error",
-                        "operation": "double_click",
-                        "error": "A selector (control_id/auto_id/title/class_name/control_type)"
-                        " or both x and y must be provided",
-                    }
-
-            # === RIGHT_CLICK OPERATION ===
-            elif operation == "right_click":
-                has_selector = any(
-                    v is not None for v in [control_id, auto_id, title, class_name, control_type]
-                )
-                if has_selector:
-                    element, desc = _find_element(
-                        window, control_id, auto_id, title, class_name, control_type
-                    )
-                    if not element.exists():
-                        return {
-                            "status": "error",
-                            "operation": "right_click",
-                            "error": f"Element with {desc} not found",
-                        }
-                    element.click(button="right")
-                    return {
-                        "status": "success",
-                        "operation": "right_click",
-                        "selector": desc,
-                        "timestamp": timestamp,
-                    }
-                elif x is not None and y is not None:
-                    if absolute:
-                        pyautogui.rightClick(x, y)
-                    else:
-                        rect = window.rectangle()
-                        pyautogui.rightClick(rect.left + x, rect.top + y)
-                    return {
-                        "status": "success",
-                        "operation": "right_click",
-                        "x": x,
-                        "y": y,
-                        "absolute": absolute,
-                        "timestamp": timestamp,
-                    }
-                else:
-                    return {
-                        "status": "error",
-                        "operation": "right_click",
-                        "error": "A selector (control_id/auto_id/title/class_name/control_type)"
-                        " or both x and y must be provided",
-                    }
-
-            # === HOVER OPERATION ===
-            elif operation == "hover":
-                has_selector = any(
-                    v is not None for v in [control_id, auto_id, title, class_name, control_type]
-                )
-                if has_selector:
-                    element, desc = _find_element(
-                        window, control_id, auto_id, title, class_name, control_type
-                    )
-                    if not element.exists():
-                        return {
-                            "status": "error",
-                            "operation": "hover",
-                            "error": f"Element with {desc} not found",
-                        }
-                    rect = element.rectangle()
-                    center_x = rect.left + (rect.width() // 2)
-                    center_y = rect.top + (rect.height() // 2)
-                    pyautogui.moveTo(center_x, center_y, duration=0.3)
-                    time.sleep(duration)
-                    return {
-                        "status": "success",
-                        "operation": "hover",
-                        "selector": desc,
-                        "position": (center_x, center_y),
-                        "duration": duration,
-                        "timestamp": timestamp,
-                    }
-                elif x is not None and y is not None:
-                    if not absolute:
-                        rect = window.rectangle()
-                        x = rect.left + x
-                        y = rect.top + y
-                    pyautogui.moveTo(x, y, duration=0.3)
-                    time.sleep(duration)
-                    return {
-                        "status": "success",
-                        "operation": "hover",
-                        "position": (x, y),
-                        "duration": duration,
-                        "timestamp": timestamp,
-                    }
-                else:
-                    return {
-                        "status": "error",
-                        "operation": "hover",
-                        "error": "A selector (control_id/auto_id/title/class_name/control_type)"
-                        " or both x and y must be provided",
-                    }
-
-            # === OPERATIONS REQUIRING AN ELEMENT SELECTOR ===
-            has_selector = any(
-                v is not None for v in [control_id, auto_id, title, class_name, control_type]
-            )
-            if not has_selector:
-                return {
-                    "status": "error",
-                    "operation": operation,
-                    "error": (
-                        f"At least one selector (control_id, auto_id, title,"
-                        f" class_name, control_type) is required for {operation}"
-                    ),
+                    "error": f"Unknown operation: {operation}",
+                    "valid_operations": list(_VALID_OPERATIONS),
                 }
 
-            element, selector_desc = _find_element(
-                window, control_id, auto_id, title, class_name, control_type
+            # === VALIDATION FOR OPERATIONS REQUIRING WINDOW ===
+            if window_handle is None:
+                return _err(operation, "window_handle or window_title parameter is required")
+
+            element_key = (window_handle, *selectors)
+            ctx = _OpContext(
+                operation=operation,
+                window_handle=window_handle,
+                window=desktop.window(handle=window_handle),
+                selectors=selectors,
+                has_selector=has_selector,
+                element_key=element_key,
+                timestamp=timestamp,
+                auto_id=auto_id,
+                title=title,
+                x=x,
+                y=y,
+                button=button,
+                anchor=anchor,
+                absolute=absolute,
+                duration=duration,
+                text=text,
+                expected_text=expected_text,
+                exact_match=exact_match,
+                timeout=timeout,
+                max_depth=max_depth,
+                verbose=verbose,
+                active_form_only=active_form_only,
+                refresh_rect=refresh_rect,
+                operations=operations,
+                steps=steps,
             )
 
-            # === INFO OPERATION ===
-            if operation == "info":
-                if not element.exists():
-                    return {
-                        "status": "error",
-                        "operation": "info",
-                        "error": f"Element with {selector_desc} not found",
-                    }
-                info = _get_element_info(element)
-                info["status"] = "success"
-                info["operation"] = "info"
-                info["timestamp"] = timestamp
-                return info
-
-            # === TEXT OPERATION ===
-            elif operation == "text":
-                if not element.exists():
-                    return {
-                        "status": "error",
-                        "operation": "text",
-                        "error": f"Element with {selector_desc} not found",
-                    }
-                return {
-                    "status": "success",
-                    "operation": "text",
-                    "selector": selector_desc,
-                    "text": element.window_text(),
-                    "timestamp": timestamp,
-                }
-
-            # === SET_TEXT OPERATION ===
-            elif operation == "set_text":
-                if text is None:
-                    return {
-                        "status": "error",
-                        "operation": "set_text",
-                        "error": "text parameter is required for set_text operation",
-                    }
-
-                # Try Delphi bridge first for auto_id or title
-                bridge = _get_bridge()
-                if bridge is not None and (auto_id or title):
-                    try:
-                        results = _bridge_find_controls(
-                            bridge, auto_id, title,
-                            active_form_only=active_form_only,
-                        )
-                        if results:
-                            ctrl = results[0]
-                            # Click the control to focus it — physical
-                            # click goes through VCL's full focus pipeline
-                            # which SetFocus alone does not.
-                            if _bridge_click(ctrl, window_handle):
-                                time.sleep(0.15)
-                                pyautogui.hotkey("ctrl", "a")
-                                pyautogui.press("delete")
-                                if text.isascii():
-                                    pyautogui.typewrite(
-                                        text, interval=0.02
-                                    )
-                                else:
-                                    pyautogui.write(text)
-                                return {
-                                    "status": "success",
-                                    "operation": "set_text",
-                                    "source": "delphi_bridge",
-                                    "automation_id": ctrl.get("name", ""),
-                                    "text_set": text,
-                                    "method": "keyboard",
-                                    "timestamp": timestamp,
-                                }
-                    except Exception as e:
-                        logger.debug(f"Bridge set_text failed: {e}")
-
-                if not element.exists():
-                    return {
-                        "status": "error",
-                        "operation": "set_text",
-                        "error": f"Element with {selector_desc} not found",
-                    }
-
-                # Resolve the target: if the element is a container (Pane),
-                # look for an Edit-type child to type into (common with
-                # DevExpress/VCL composite controls like TcxTextEdit).
-                target = element
-                try:
-                    wrapper = element.wrapper_object()
-                    ct = str(getattr(wrapper.element_info, "control_type", ""))
-                    if ct in ("Pane", "Group", "Custom"):
-                        for child in wrapper.children():
-                            child_ct = str(getattr(child.element_info, "control_type", ""))
-                            if child_ct == "Edit":
-                                target = child
-                                logger.debug(f"set_text: using inner Edit child of {ct} element")
-                                break
-                except Exception as e:
-                    logger.debug(
-                        f"set_text: could not inspect children, using element directly: {e}"
-                    )
-
-                # Always use focus + keyboard input. WM_SETTEXT and UIA
-                # ValuePattern update the Win32 buffer but don't notify
-                # VCL/DevExpress, causing broken internal state.
-                if window_handle:
-                    ctypes.windll.user32.SetForegroundWindow(window_handle)
-                    time.sleep(0.05)
+            if operation in ("batch", "chain"):
+                return handler(ctx)
+            return _run_operation(ctx)
 
-                target_wrapper = (
-                    target.wrapper_object() if hasattr(target, "wrapper_object") else target
-                )
-                try:
-                    target_wrapper.set_focus()
-                except Exception:
-                    element.set_focus()
-                time.sleep(0.1)
-                pyautogui.hotkey("ctrl", "a")
-                pyautogui.press("delete")
-                if text.isascii():
-                    pyautogui.typewrite(text, interval=0.02)
-                else:
-                    pyautogui.write(text)
-                method = "keyboard"
-
-                return {
-                    "status": "success",
-                    "operation": "set_text",
-                    "selector": selector_desc,
-                    "text_set": text,
-                    "method": method,
-                    "timestamp": timestamp,
-                }
-
-            # === RECT OPERATION ===
-            elif operation == "rect":
-                # Try Delphi bridge first — UIA can't see many VCL controls
-                bridge = _get_bridge()
-                if bridge is not None and (auto_id or title):
-                    try:
-                        results = _bridge_find_controls(
-                            bridge, auto_id, title,
-                            active_form_only=active_form_only,
-                        )
-                        if results:
-                            ctrl = results[0]
-                            handle = ctrl.get("handle", 0)
-                            if handle:
-                                import win32gui
-
-                                r = win32gui.GetWindowRect(handle)
-                                return {
-                                    "status": "success",
-                                    "operation": "rect",
-                                    "source": "delphi_bridge",
-                                    "automation_id": ctrl.get("name", ""),
-                                    "left": r[0],
-                                    "top": r[1],
-                                    "right": r[2],
-                                    "bottom": r[3],
-                                    "width": r[2] - r[0],
-                                    "height": r[3] - r[1],
-                                    "timestamp": timestamp,
-                                }
-                    except Exception as e:
-                        logger.debug(f"Bridge rect failed: {e}")
-
-                if not element.exists():
-                    return {
-                        "status": "error",
-                        "operation": "rect",
-                        "error": f"Element with {selector_desc} not found",
-                    }
-                rect = element.rectangle()
-                return {
-                    "status": "success",
-                    "operation": "rect",
-                    "selector": selector_desc,
-                    "left": rect.left,
-                    "top": rect.top,
-                    "right": rect.right,
-                    "bottom": rect.bottom,
-                    "width": rect.width(),
-                    "height": rect.height(),
-                    "timestamp": timestamp,
-                }
-
-            # === VISIBLE OPERATION ===
-            elif operation == "visible":
-                if not element.exists():
-                    return {
-                        "status": "error",
-                        "operation": "visible",
-                        "error": f"Element with {selector_desc} not found",
-                    }
-                return {
-                    "status": "success",
-                    "operation": "visible",
-                    "selector": selector_desc,
-                    "is_visible": element.is_visible(),
-                    "timestamp": timestamp,
-                }
-
-            # === ENABLED OPERATION ===
-            elif operation == "enabled":
-                if not element.exists():
-                    return {
-                        "status": "error",
-                        "operation": "enabled",
-                        "error": f"Element with {selector_desc} not found",
-                    }
-                return {
-                    "status": "success",
-                    "operation": "enabled",
-                    "selector": selector_desc,
-                    "is_enabled": element.is_enabled(),
-                    "timestamp": timestamp,
-                }
-
-            # === EXISTS OPERATION ===
-            elif operation == "exists":
-                start_time = time.time()
-                while time.time() - start_time < timeout:
-                    if element.exists():
-                        return {
-                            "status": "success",
-                            "operation": "exists",
-                            "selector": selector_desc,
-                            "exists": True,
-                            "wait_time": time.time() - start_time,
-                            "timestamp": timestamp,
-                        }
-                    time.sleep(0.1)
-
-                return {
-                    "status": "success",
-                    "operation": "exists",
-                    "selector": selector_desc,
-                    "exists": False,
-                    "timeout": timeout,
-                    "timestamp": timestamp,
-                }
-
-            # === WAIT OPERATION ===
-            elif operation == "wait":
-                start_time = time.time()
-                while time.time() - start_time < timeout:
-                    if element.exists():
-                        return {
-                            "status": "success",
-                            "operation": "wait",
-                            "selector": selector_desc,
-                            "found": True,
-                            "wait_time": time.time() - start_time,
-                            "element": _get_element_info(element),
-                            "timestamp": timestamp,
-                        }
-                    time.sleep(0.1)
-
-                return {
-                    "status": "error",
-                    "operation": "wait",
-                    "selector": selector_desc,
-                    "error": f"Element not found within {timeout} seconds",
-                }
-
-            # === VERIFY_TEXT OPERATION ===
-            elif operation == "verify_text":
-                if expected_text is None:
-                    return {
-                        "status": "error",
-                        "operation": "verify_text",
-                        "error": "expected_text parameter is required",
-                    }
-                if not element.exists():
-                    return {
-                        "status": "error",
-                        "operation": "verify_text",
-                        "error": f"Element with {selector_desc} not found",
-                    }
-
-                actual_text = element.window_text()
-                if exact_match:
-                    matches = actual_text == expected_text
-                else:
-                    matches = expected_text.lower() in actual_text.lower()
-
-                return {
-                    "status": "success" if matches else "failure",
-                    "operation": "verify_text",
-                    "selector": selector_desc,
-                    "expected_text": expected_text,
-                    "actual_text": actual_text,
-                    "exact_match": exact_match,
-                    "match_found": matches,
-                    "timestamp": timestamp,
-                }
-
-            else:
-                return {
-                    "status": "error",
-                    "error": f"Unknown operation: {operation}",
-                    "valid_operations": [
-                        "click",
-                        "double_click",
-                        "right_click",
-                        "hover",
-                        "info",
-                        "text",
-                        "set_text",
-                        "rect",
-                        "visible",
-                        "enabled",
-                        "exists",
-                        "wait",
-                        "verify_text",
-                        "list",
-                    ],
-                }
-
-        except ElementNotFoundError as e:
-            return {
-                "status": "error",
-                "operation": operation,
-                "error": f"Element not found: {str(e)}",
-                "error_type": "ElementNotFoundError",
-            }
-        except ElementNotVisible as e:
-            return {
-                "status": "error",
-                "operation": operation,
-                "error": f"Element not visible: {str(e)}",
-                "error_type": "ElementNotVisible",
-            }
         except Exception as e:
-            return {
-                "status": "error",
-                "operation": operation,
-                "error": str(e),
-                "error_type": type(e).__name__,
-            }
+            # A stale wrapper may have caused this; search afresh next time
+            _element_cache.pop(element_key, None)
+            return _exception_err(operation, e)
 
 
 __all__ = ["automation_elements"]
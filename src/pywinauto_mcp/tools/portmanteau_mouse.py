@@ -26,6 +26,8 @@ from typing import Any, Literal
 
 import pyautogui
 
+from pywinauto_mcp.win32_input import click, click_at
+
 # Import the FastMCP app instance
 try:
     from pywinauto_mcp.app import app
@@ -42,6 +44,22 @@ pyautogui.PAUSE = 0.1
 pyautogui.FAILSAFE = True
 
 
+def _click(x: int | None, y: int | None, button: str = "left", clicks: int = 1) -> None:
+    """Click at (*x*, *y*), or at the cursor, via SendInput; pyautogui only if that fails.
+
+    SendInput bypasses pyautogui, so its fail-safe is checked here first:
+    with the cursor in a screen corner, pyautogui.FailSafeException is
+    raised and nothing is clicked.
+    """
+    pyautogui.failSafeCheck()
+    if x is not None and y is not None:
+        sent = click_at(x, y, button, clicks)
+    else:
+        sent = click(button, clicks)
+    if not sent:
+        pyautogui.click(x, y, clicks=clicks, button=button)
+
+
 if app is not None:
     logger.info("Registering portmanteau_mouse tool with FastMCP")
 
@@ -205,11 +223,10 @@ Examples:
 
             # === CLICK OPERATION ===
             elif operation == "click":
+                _click(x, y, button)
                 if x is not None and y is not None:
-                    pyautogui.click(x, y, button=button)
                     position = (x, y)
                 else:
-                    pyautogui.click(button=button)
                     position = pyautogui.position()
 
                 return {
@@ -223,11 +240,10 @@ Examples:
 
             # === DOUBLE_CLICK OPERATION ===
             elif operation == "double_click":
+                _click(x, y, button, clicks=2)
                 if x is not None and y is not None:
-                    pyautogui.doubleClick(x, y, button=button)
                     position = (x, y)
                 else:
-                    pyautogui.doubleClick(button=button)
                     position = pyautogui.position()
 
                 return {
@@ -241,11 +257,10 @@ Examples:
 
             # === RIGHT_CLICK OPERATION ===
             elif operation == "right_click":
+                _click(x, y, "right")
                 if x is not None and y is not None:
-                    pyautogui.rightClick(x, y)
                     position = (x, y)
                 else:
-                    pyautogui.rightClick()
                     position = pyautogui.position()
 
                 return {
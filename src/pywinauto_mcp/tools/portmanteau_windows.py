@@ -52,6 +52,7 @@ Examples:
 
 import logging
 import time
+from functools import lru_cache
 from typing import Any, Literal
 
 from pywinauto import Desktop
@@ -71,10 +72,20 @@ except ImportError as e:
     app = None
 
 
+@lru_cache(maxsize=4)
+def _desktop_for(backend: str):
+    """Return the shared Desktop for *backend*; Desktop holds no per-call state."""
+    return Desktop(backend=backend)
+
+
 def _get_desktop():
-    """Get a Desktop instance with proper error handling."""
+    """Get a Desktop instance with proper error handling.
+
+    Instances are reused per backend, so repeated tool calls skip Desktop
+    construction.
+    """
     try:
-        return Desktop(backend=settings.PYWINAUTO_BACKEND)
+        return _desktop_for(settings.PYWINAUTO_BACKEND)
     except Exception as e:
         logger.error(f"Failed to get Desktop instance: {e}")
         raise
@@ -0,0 +1,108 @@
+"""user32/kernel32 entry points shared by the Win32 helpers and tools.
+
+Each function is bound once, with explicit argtypes/restype, on a private
+WinDLL rather than ctypes.windll. ctypes.windll.user32 is a process-wide
+singleton, so prototypes set on it would leak into every other module
+(pywinauto included) that calls through it.
+"""
+
+from __future__ import annotations
+
+import ctypes
+from ctypes import wintypes
+
+user32 = ctypes.WinDLL("user32")
+kernel32 = ctypes.WinDLL("kernel32")
+
+# GetAncestor flag: the root window, walking the parent chain
+GA_ROOT = 2
+
+# SendMessageTimeoutW flag: return at once if the receiving thread is hung
+SMTO_ABORTIFHUNG = 0x0002
+
+WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+
+# pInputs is an array of win32_input.INPUT
+SendInput = user32.SendInput
+SendInput.argtypes = [wintypes.UINT, ctypes.c_void_p, ctypes.c_int]
+SendInput.restype = wintypes.UINT
+
+SetCursorPos = user32.SetCursorPos
+SetCursorPos.argtypes = [ctypes.c_int, ctypes.c_int]
+SetCursorPos.restype = wintypes.BOOL
+
+IsWindow = user32.IsWindow
+IsWindow.argtypes = [wintypes.HWND]
+IsWindow.restype = wintypes.BOOL
+
+IsWindowVisible = user32.IsWindowVisible
+IsWindowVisible.argtypes = [wintypes.HWND]
+IsWindowVisible.restype = wintypes.BOOL
+
+IsChild = user32.IsChild
+IsChild.argtypes = [wintypes.HWND, wintypes.HWND]
+IsChild.restype = wintypes.BOOL
+
+GetAncestor = user32.GetAncestor
+GetAncestor.argtypes = [wintypes.HWND, wintypes.UINT]
+GetAncestor.restype = wintypes.HWND
+
+FindWindowW = user32.FindWindowW
+FindWindowW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR]
+FindWindowW.restype = wintypes.HWND
+
+FindWindowExW = user32.FindWindowExW
+FindWindowExW.argtypes = [wintypes.HWND, wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR]
+FindWindowExW.restype = wintypes.HWND
+
+EnumWindows = user32.EnumWindows
+EnumWindows.argtypes = [WNDENUMPROC, wintypes.LPARAM]
+EnumWindows.restype = wintypes.BOOL
+
+GetWindowTextLengthW = user32.GetWindowTextLengthW
+GetWindowTextLengthW.argtypes = [wintypes.HWND]
+GetWindowTextLengthW.restype = ctypes.c_int
+
+GetWindowTextW = user32.GetWindowTextW
+GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+GetWindowTextW.restype = ctypes.c_int
+
+GetClassNameW = user32.GetClassNameW
+GetClassNameW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+GetClassNameW.restype = ctypes.c_int
+
+GetDlgCtrlID = user32.GetDlgCtrlID
+GetDlgCtrlID.argtypes = [wintypes.HWND]
+GetDlgCtrlID.restype = ctypes.c_int
+
+GetForegroundWindow = user32.GetForegroundWindow
+GetForegroundWindow.argtypes = []
+GetForegroundWindow.restype = wintypes.HWND
+
+SetForegroundWindow = user32.SetForegroundWindow
+SetForegroundWindow.argtypes = [wintypes.HWND]
+SetForegroundWindow.restype = wintypes.BOOL
+
+SetFocus = user32.SetFocus
+SetFocus.argtypes = [wintypes.HWND]
+SetFocus.restype = wintypes.HWND
+
+AttachThreadInput = user32.AttachThreadInput
+AttachThreadInput.argtypes = [wintypes.DWORD, wintypes.DWORD, wintypes.BOOL]
+AttachThreadInput.restype = wintypes.BOOL
+
+GetCurrentThreadId = kernel32.GetCurrentThreadId
+GetCurrentThreadId.argtypes = []
+GetCurrentThreadId.restype = wintypes.DWORD
+
+SendMessageTimeoutW = user32.SendMessageTimeoutW
+SendMessageTimeoutW.argtypes = [
+    wintypes.HWND,
+    wintypes.UINT,
+    wintypes.WPARAM,
+    wintypes.LPARAM,
+    wintypes.UINT,
+    wintypes.UINT,
+    ctypes.POINTER(ctypes.c_size_t),
+]
+SendMessageTimeoutW.restype = wintypes.LPARAM
@@ -0,0 +1,215 @@
+"""Direct keyboard and mouse input via the Win32 SendInput API.
+
+pyautogui types one character at a time with a sleep between keystrokes,
+and pauses around every mouse call. The helpers here build the whole
+sequence of INPUT events up front and inject it with a single SendInput
+call.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import logging
+import threading
+from ctypes import wintypes
+
+from pywinauto_mcp.win32_api import SendInput, SetCursorPos
+
+logger = logging.getLogger(__name__)
+
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+
+MOUSEEVENTF_LEFTDOWN = 0x0002
+MOUSEEVENTF_LEFTUP = 0x0004
+MOUSEEVENTF_RIGHTDOWN = 0x0008
+MOUSEEVENTF_RIGHTUP = 0x0010
+MOUSEEVENTF_MIDDLEDOWN = 0x0020
+MOUSEEVENTF_MIDDLEUP = 0x0040
+
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+
+VK_TAB = 0x09
+VK_RETURN = 0x0D
+VK_CONTROL = 0x11
+VK_DELETE = 0x2E
+VK_A = 0x41
+
+ULONG_PTR = ctypes.c_size_t
+
+# Characters typed as virtual keys rather than Unicode code units, matching
+# how pyautogui presses Enter/Tab for them
+_VK_FOR_CHAR = {"\n": VK_RETURN, "\r": VK_RETURN, "\t": VK_TAB}
+
+# Mouse button name -> (button-down flag, button-up flag)
+_MOUSE_BUTTON_FLAGS = {
+    "left": (MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_LEFTUP),
+    "right": (MOUSEEVENTF_RIGHTDOWN, MOUSEEVENTF_RIGHTUP),
+    "middle": (MOUSEEVENTF_MIDDLEDOWN, MOUSEEVENTF_MIDDLEUP),
+}
+
+
+class MOUSEINPUT(ctypes.Structure):
+    """Win32 MOUSEINPUT."""
+
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+
+class KEYBDINPUT(ctypes.Structure):
+    """Win32 KEYBDINPUT."""
+
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT)]
+
+
+class INPUT(ctypes.Structure):
+    """Win32 INPUT."""
+
+    _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+
+# Byte size of one INPUT, passed to every SendInput call
+_INPUT_SIZE = ctypes.sizeof(INPUT)
+
+# Smallest scratch array allocated per thread (enough for a double click)
+_SCRATCH_MIN = 8
+
+# Per-thread INPUT array reused across SendInput calls, grown on demand
+_tls = threading.local()
+
+
+def _scratch(n: int):
+    """Return this thread's INPUT array, reallocated only if it holds fewer than *n*."""
+    buf = getattr(_tls, "buf", None)
+    if buf is None or len(buf) < n:
+        buf = (INPUT * max(n, _SCRATCH_MIN))()
+        _tls.buf = buf
+    return buf
+
+
+def _key(vk: int = 0, scan: int = 0, flags: int = 0) -> INPUT:
+    """Build a single keyboard INPUT event."""
+    return INPUT(type=INPUT_KEYBOARD, u=_INPUTUNION(ki=KEYBDINPUT(vk, scan, flags, 0, 0)))
+
+
+def _mouse(flags: int) -> INPUT:
+    """Build a single mouse INPUT event at the current cursor position."""
+    return INPUT(type=INPUT_MOUSE, u=_INPUTUNION(mi=MOUSEINPUT(0, 0, 0, flags, 0, 0)))
+
+
+def _click_inputs(button: str, clicks: int) -> list[INPUT] | None:
+    """Build *clicks* down/up pairs for *button*, or None for an unknown button."""
+    flags = _MOUSE_BUTTON_FLAGS.get(button)
+    if flags is None:
+        return None
+    down, up = flags
+    return [_mouse(down), _mouse(up)] * clicks
+
+
+def _unicode_inputs(text: str) -> list[INPUT]:
+    """Build key-down/key-up event pairs that type *text*.
+
+    Characters are sent as UTF-16 code units with KEYEVENTF_UNICODE, so
+    characters outside the BMP go out as surrogate pairs. Newlines and
+    tabs are pressed as VK_RETURN / VK_TAB.
+    """
+    inputs: list[INPUT] = []
+    for ch in text:
+        vk = _VK_FOR_CHAR.get(ch)
+        if vk is not None:
+            inputs.append(_key(vk=vk))
+            inputs.append(_key(vk=vk, flags=KEYEVENTF_KEYUP))
+            continue
+        units = ch.encode("utf-16-le")
+        for i in range(0, len(units), 2):
+            unit = int.from_bytes(units[i : i + 2], "little")
+            inputs.append(_key(scan=unit, flags=KEYEVENTF_UNICODE))
+            inputs.append(_key(scan=unit, flags=KEYEVENTF_UNICODE | KEYEVENTF_KEYUP))
+    return inputs
+
+
+def _clear_field_inputs() -> list[INPUT]:
+    """Build the Ctrl+A, Delete event sequence."""
+    return [
+        _key(vk=VK_CONTROL),
+        _key(vk=VK_A),
+        _key(vk=VK_A, flags=KEYEVENTF_KEYUP),
+        _key(vk=VK_CONTROL, flags=KEYEVENTF_KEYUP),
+        _key(vk=VK_DELETE),
+        _key(vk=VK_DELETE, flags=KEYEVENTF_KEYUP),
+    ]
+
+
+def send_inputs(inputs: list[INPUT]) -> bool:
+    """Inject *inputs* with one SendInput call.
+
+    Returns True if every event was inserted. SendInput inserts nothing
+    when input is blocked (e.g. UIPI against an elevated window).
+    """
+    if not inputs:
+        return True
+    n = len(inputs)
+    buf = _scratch(n)
+    # Every slot up to n is overwritten whole; stale slots past n are not sent
+    for i, event in enumerate(inputs):
+        buf[i] = event
+    sent = SendInput(n, buf, _INPUT_SIZE)
+    if sent != n:
+        logger.debug(f"SendInput inserted {sent} of {n} events")
+        return False
+    return True
+
+
+def type_text(text: str) -> bool:
+    """Type *text* at the current keyboard focus in one SendInput burst."""
+    return send_inputs(_unicode_inputs(text))
+
+
+def replace_field_text(text: str) -> bool:
+    """Select all, delete, and type *text* at the current focus in one burst."""
+    return send_inputs(_clear_field_inputs() + _unicode_inputs(text))
+
+
+def move_cursor(x: int, y: int) -> bool:
+    """Move the mouse cursor to screen position (*x*, *y*)."""
+    return bool(SetCursorPos(x, y))
+
+
+def click(button: str = "left", clicks: int = 1) -> bool:
+    """Click *button* *clicks* times at the current cursor position in one burst.
+
+    Returns False for a button other than left/right/middle, or when the
+    input could not be sent.
+    """
+    inputs = _click_inputs(button, clicks)
+    if inputs is None:
+        return False
+    return send_inputs(inputs)
+
+
+def click_at(x: int, y: int, button: str = "left", clicks: int = 1) -> bool:
+    """Move to (*x*, *y*) and click *button* *clicks* times in one SendInput burst.
+
+    Returns False for a button other than left/right/middle, or when the
+    input could not be sent.
+    """
+    if button not in _MOUSE_BUTTON_FLAGS or not move_cursor(x, y):
+        return False
+    return click(button, clicks)
@@ -0,0 +1,142 @@
+"""Top-level window lookup via user32.
+
+Walking desktop.windows() through pywinauto reads every window's text
+through the backend (a UIA round-trip per window). The helpers here ask
+FindWindowW first and otherwise enumerate HWNDs with EnumWindows, reading
+titles with GetWindowTextW directly.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import logging
+import time
+from collections.abc import Callable, Iterable
+
+from pywinauto_mcp.win32_api import (
+    WNDENUMPROC,
+    EnumWindows,
+    FindWindowW,
+    GetWindowTextLengthW,
+    GetWindowTextW,
+    IsWindow,
+    IsWindowVisible,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def find_window_by_title(window_title: str) -> int | None:
+    """Find a visible top-level window by title (case-insensitive).
+
+    Titles are compared case-folded. Returns the first match in z-order, or
+    None. FindWindowW answers in one call when the first window with that
+    title is visible; otherwise the windows are enumerated, skipping those
+    whose text length rules out a match without reading their text.
+    """
+    wanted = window_title.casefold()
+    # Window text lengths and buffer sizes count UTF-16 code units, which
+    # differ from len() for characters outside the BMP (emoji, say)
+    wanted_len = len(wanted.encode("utf-16-le")) // 2
+    # Case folding maps each character to one to three, so only texts of
+    # ceil(wanted_len / 3) to wanted_len units can fold to *wanted*
+    min_len = -(-wanted_len // 3)
+    # One slot beyond the longest possible match, so a longer text read
+    # truncated still cannot compare equal
+    size = wanted_len + 2
+    buf = ctypes.create_unicode_buffer(size)
+
+    # FindWindowW returns the first title match in z-order, visible or not,
+    # and compares case-insensitively by its own rules; confirm both
+    hwnd = FindWindowW(None, window_title)
+    if hwnd and IsWindowVisible(hwnd):
+        GetWindowTextW(hwnd, buf, size)
+        if buf.value.casefold() == wanted:
+            return hwnd
+
+    found: list[int] = []
+
+    def _callback(hwnd, _):
+        if not min_len <= GetWindowTextLengthW(hwnd) <= wanted_len:
+            return True
+        if not IsWindowVisible(hwnd):
+            return True
+        GetWindowTextW(hwnd, buf, size)
+        if buf.value.casefold() == wanted:
+            found.append(hwnd)
+            return False
+        return True
+
+    EnumWindows(WNDENUMPROC(_callback), 0)
+    return found[0] if found else None
+
+
+# Resolved top-level windows keyed by case-folded title: title -> (timestamp, hwnd)
+_window_handle_cache: dict[str, tuple[float, int]] = {}
+
+# How long a cached title -> handle mapping is trusted (seconds)
+WINDOW_CACHE_TTL = 2.0
+
+
+def _window_text(hwnd: int) -> str:
+    """Return *hwnd*'s window text as GetWindowTextW reports it."""
+    size = GetWindowTextLengthW(hwnd) + 1
+    buf = ctypes.create_unicode_buffer(size)
+    GetWindowTextW(hwnd, buf, size)
+    return buf.value
+
+
+def _cached_window_handle(key: str) -> int | None:
+    """Return the cached handle for case-folded title *key* if it still matches.
+
+    The entry must be younger than WINDOW_CACHE_TTL and the window must
+    still exist and still carry the same title; otherwise it is dropped.
+    """
+    cached = _window_handle_cache.get(key)
+    if cached is None:
+        return None
+    ts, hwnd = cached
+    if (
+        time.monotonic() - ts < WINDOW_CACHE_TTL
+        and IsWindow(hwnd)
+        and _window_text(hwnd).casefold() == key
+    ):
+        return hwnd
+    _window_handle_cache.pop(key, None)
+    return None
+
+
+def find_window_handle(
+    window_title: str,
+    windows: Callable[[], Iterable] | None = None,
+    refresh: bool = False,
+) -> int | None:
+    """Resolve a top-level window title (case-insensitive) to its handle.
+
+    Uses the title cache unless *refresh* is set, then find_window_by_title.
+    Only if that finds nothing are the wrappers returned by *windows* (for
+    instance desktop.windows) compared by window_text(), which covers titles
+    the backend reports differently from the window text. Found handles are
+    cached.
+    """
+    key = window_title.casefold()
+    if not refresh:
+        hwnd = _cached_window_handle(key)
+        if hwnd is not None:
+            return hwnd
+
+    hwnd = find_window_by_title(window_title)
+    if hwnd:
+        _window_handle_cache[key] = (time.monotonic(), hwnd)
+        return hwnd
+
+    if windows is None:
+        return None
+    for w in windows():
+        try:
+            if w.window_text().casefold() == key:
+                _window_handle_cache[key] = (time.monotonic(), w.handle)
+                return w.handle
+        except Exception as e:
+            logger.debug(f"Skipping window whose text could not be read: {e}")
+    return None
@@ -0,0 +1,131 @@
+"""Tests for the Delphi bridge control-tree helpers in portmanteau_elements.py."""
+
+from unittest.mock import MagicMock, patch
+
+from pywinauto_mcp.tools import portmanteau_elements
+from pywinauto_mcp.tools.portmanteau_elements import (
+    _activeform_index,
+    _bridge_control_to_element_info,
+    _bridge_find_controls,
+    _index_bridge_controls,
+    _lookup_indexed_controls,
+)
+
+TREE = [
+    {
+        "name": "pnlMain",
+        "text": "",
+        "children": [
+            {"name": "btnOk", "text": "OK", "children": []},
+            {
+                "name": "pnlInner",
+                "text": "",
+                "children": [{"name": "btnOk", "text": "Confirm", "children": []}],
+            },
+        ],
+    },
+    {"name": "btnCancel", "text": "OK", "children": []},
+]
+
+
+class TestIndexBridgeControls:
+    """Test name/caption indexing of the bridge control tree."""
+
+    def setup_method(self):
+        """Index the sample tree and start with no cached active form."""
+        portmanteau_elements._activeform_cache.clear()
+        self.bridge = MagicMock()
+        self.bridge.get_activeform_controls.return_value = TREE
+        self.index = _index_bridge_controls(TREE)
+
+    def _walk_result(self, auto_id=None, title=None):
+        return _bridge_find_controls(self.bridge, auto_id, title, active_form_only=True)
+
+    def test_lookup_by_name_in_document_order(self):
+        """Name lookups list every match, outermost and earliest first."""
+        matches = _lookup_indexed_controls(self.index, auto_id="btnOk")
+        assert [m["text"] for m in matches] == ["OK", "Confirm"]
+        assert self._walk_result("btnOk") == matches
+
+    def test_lookup_by_caption(self):
+        """Caption lookups match across different names."""
+        matches = _lookup_indexed_controls(self.index, title="OK")
+        assert [m["name"] for m in matches] == ["btnOk", "btnCancel"]
+        assert self._walk_result(title="OK") == matches
+
+    def test_lookup_by_name_and_caption(self):
+        """Both selectors must match."""
+        matches = _lookup_indexed_controls(self.index, auto_id="btnOk", title="Confirm")
+        assert [m["text"] for m in matches] == ["Confirm"]
+        assert self._walk_result("btnOk", "Confirm") == matches
+
+    def test_lookup_missing(self):
+        """Unknown names return an empty list."""
+        assert _lookup_indexed_controls(self.index, auto_id="nope") == []
+
+
+class TestActiveformIndex:
+    """Test the short-lived cache of the active form's control tree."""
+
+    def setup_method(self):
+        """Start with no cached active form and a bridge serving the sample tree."""
+        portmanteau_elements._activeform_cache.clear()
+        self.bridge = MagicMock(base_url="http://127.0.0.1:8000")
+        self.bridge.get_activeform_controls.return_value = TREE
+
+    def _fetch(self, foreground=100):
+        with patch.object(portmanteau_elements, "GetForegroundWindow", return_value=foreground):
+            return _activeform_index(self.bridge)
+
+    def test_consecutive_lookups_share_tree(self):
+        """Lookups within the TTL reuse one fetched and indexed tree."""
+        with patch.object(portmanteau_elements, "GetForegroundWindow", return_value=100):
+            _bridge_find_controls(self.bridge, "btnOk", active_form_only=True)
+            _bridge_find_controls(self.bridge, "btnCancel", active_form_only=True)
+        self.bridge.get_activeform_controls.assert_called_once()
+        assert self._fetch() is self._fetch()
+
+    def test_foreground_change_refetches(self):
+        """A different foreground window means a different active form."""
+        self._fetch(100)
+        self._fetch(200)
+        assert self.bridge.get_activeform_controls.call_count == 2
+
+    def test_expires(self):
+        """Trees older than the TTL are fetched again."""
+        with patch.object(portmanteau_elements, "_ACTIVEFORM_CACHE_TTL", 0):
+            self._fetch()
+            self._fetch()
+        assert self.bridge.get_activeform_controls.call_count == 2
+
+    def test_invalidated_by_input(self):
+        """Clicks and typing drop the cached tree."""
+        self._fetch()
+        portmanteau_elements._invalidate_bridge_caches()
+        self._fetch()
+        assert self.bridge.get_activeform_controls.call_count == 2
+
+
+class TestBridgeControlToElementInfo:
+    """Test conversion of bridge control trees to element info."""
+
+    def test_fields_and_child_order(self):
+        """Fields are renamed and children keep their order at every level."""
+        info = _bridge_control_to_element_info(TREE[0])
+        assert info["automation_id"] == "pnlMain"
+        assert [c["automation_id"] for c in info["children"]] == ["btnOk", "pnlInner"]
+        inner = info["children"][1]["children"][0]
+        assert (inner["text"], inner["name"]) == ("Confirm", "Confirm")
+        assert inner["children"] == []
+
+    def test_deep_tree(self):
+        """Deeply nested forms do not hit the recursion limit."""
+        root: dict = {"name": "leaf"}
+        for _ in range(5000):
+            root = {"name": "pnl", "children": [root]}
+        info = _bridge_control_to_element_info(root)
+        depth = 0
+        while info["children"]:
+            info = info["children"][0]
+            depth += 1
+        assert (depth, info["automation_id"]) == (5000, "leaf")
@@ -22,6 +22,7 @@ class TestSettings:
         assert s.TIMEOUT == 10.0
         assert s.RETRY_ATTEMPTS == 3
         assert s.RETRY_DELAY == 1.0
+        assert s.FAST_CLICK is False
         assert s.SCREENSHOT_FORMAT == "png"
         assert s.TESSERACT_LANG == "eng"
         assert s.MCP_NAME == "pywinauto-mcp"
@@ -39,11 +40,20 @@ class TestSettings:
             assert s.PORT == 9000
 
     def test_screenshot_dir_created(self, tmp_path):
-        """Verify screenshot directory is created by the validator."""
+        """Verify screenshot directory is created on first access, not at load."""
         new_dir = tmp_path / "screenshots_test"
         with patch.dict(os.environ, {"SCREENSHOT_DIR": str(new_dir)}):
             s = Settings()
-            assert s.SCREENSHOT_DIR.exists()
+            assert not s.SCREENSHOT_DIR.exists()
+            assert s.screenshot_dir == new_dir
+            assert new_dir.exists()
+
+    def test_get_settings_is_cached(self):
+        """get_settings returns the same instance on every call."""
+        from pywinauto_mcp.config import get_settings, settings
+
+        assert get_settings() is get_settings()
+        assert get_settings() is settings
 
 
 class TestCoreConfig:
@@ -66,6 +66,14 @@ class TestToolDecorator:
         assert func._input_model == "InputModel"
         assert func._output_model == "OutputModel"
 
+    def test_returns_original_function(self):
+        """The decorated function is returned as-is, without a wrapper."""
+
+        async def handler(value):
+            return value
+
+        assert tool()(handler) is handler
+
 
 class TestStatefulDecorator:
     """Test the @stateful decorator factory."""
@@ -0,0 +1,204 @@
+"""Tests for control flattening and native dialog detection in delphi_activeform.py."""
+
+from contextlib import ExitStack
+from unittest.mock import MagicMock, patch
+
+from pywinauto_mcp.tools import delphi_activeform
+from pywinauto_mcp.tools.delphi_activeform import (
+    _columnar_controls,
+    _detect_native_dialogs,
+    _flatten_controls,
+    _iter_flatten_controls,
+)
+
+TREE = [
+    {
+        "name": "pnlMain",
+        "className": "TPanel",
+        "children": [
+            {"name": "edtName", "className": "TcxTextEdit", "text": "Bob", "children": []},
+            {
+                "name": "cbxType",
+                "className": "TcxComboBox",
+                "children": [
+                    {"name": "inner", "className": "TcxCustomDropDownInnerEdit"},
+                ],
+            },
+            {"name": "lblName", "className": "TLabel", "text": "Name:"},
+        ],
+    },
+    {
+        "name": "pnlHidden",
+        "className": "TPanel",
+        "visible": False,
+        "children": [
+            {"name": "btnHidden", "className": "TButton", "visible": False},
+            {"name": "btnShown", "className": "TButton", "enabled": False},
+        ],
+    },
+    {"name": "btnOk", "className": "TButton", "text": "btnOk"},
+]
+
+
+def _ids(controls):
+    return [c["automation_id"] for c in controls]
+
+
+class TestFlattenControls:
+    """Test filtering and ordering of the flattened control list."""
+
+    def test_default_filters(self):
+        """Containers, labels, inner parts and hidden controls are dropped."""
+        assert _ids(_flatten_controls(TREE)) == ["edtName", "cbxType", "btnOk"]
+
+    def test_hidden_parent_hides_subtree(self):
+        """Children of an invisible control are skipped unless hidden ones are included."""
+        assert "btnShown" not in _ids(_flatten_controls(TREE))
+        assert "btnShown" in _ids(_flatten_controls(TREE, include_hidden=True))
+
+    def test_document_order_with_everything(self):
+        """Controls are listed in depth-first document order."""
+        controls = _flatten_controls(
+            TREE, include_hidden=True, include_labels=True, include_containers=True
+        )
+        assert _ids(controls) == [
+            "pnlMain",
+            "edtName",
+            "cbxType",
+            "lblName",
+            "pnlHidden",
+            "btnHidden",
+            "btnShown",
+            "btnOk",
+        ]
+
+    def test_entry_fields(self):
+        """Text is only kept when it differs from the name; flags only when False."""
+        by_id = {c["automation_id"]: c for c in _flatten_controls(TREE, include_hidden=True)}
+        assert by_id["edtName"] == {
+            "automation_id": "edtName",
+            "class_name": "TcxTextEdit",
+            "text": "Bob",
+        }
+        assert "text" not in by_id["btnOk"]
+        assert by_id["btnShown"]["enabled"] is False
+
+    def test_long_text_truncated(self):
+        """Captions are cut to 80 characters."""
+        nodes = [{"name": "memNotes", "className": "TMemo", "text": "x" * 200}]
+        assert _flatten_controls(nodes)[0]["text"] == "x" * 80
+
+    def test_iter_is_lazy(self):
+        """The iterator yields the first match without walking the rest."""
+        rest = MagicMock()
+        nodes = [{"name": "btnOk", "className": "TButton"}, rest]
+        assert next(_iter_flatten_controls(nodes))["automation_id"] == "btnOk"
+        rest.get.assert_not_called()
+
+    def test_deep_tree(self):
+        """Deeply nested forms do not hit the recursion limit."""
+        root: dict = {"name": "leaf", "className": "TButton"}
+        for _ in range(5000):
+            root = {"name": "", "className": "TPanel", "children": [root]}
+        assert _ids(_flatten_controls([root])) == ["leaf"]
+
+
+class TestColumnarControls:
+    """Test the parallel-list control layout."""
+
+    def test_rows_line_up(self):
+        """Row i of every column describes the same control."""
+        entries = _flatten_controls(TREE, include_hidden=True)
+        columns = _columnar_controls(entries)
+        assert columns["automation_id"] == _ids(entries)
+        assert columns["class_name"] == [e["class_name"] for e in entries]
+        assert columns["text"] == [e.get("text", "") for e in entries]
+
+    def test_flag_indexes(self):
+        """Hidden and disabled controls are listed by row index."""
+        columns = _columnar_controls(_flatten_controls(TREE, include_hidden=True))
+        ids = columns["automation_id"]
+        assert [ids[i] for i in columns["hidden"]] == ["btnHidden"]
+        assert [ids[i] for i in columns["disabled"]] == ["btnShown"]
+
+    def test_empty(self):
+        """No controls gives empty columns."""
+        assert _columnar_controls([]) == {
+            "automation_id": [],
+            "class_name": [],
+            "text": [],
+            "hidden": [],
+            "disabled": [],
+        }
+
+
+class TestDetectNativeDialogs:
+    """Test reporting of native #32770 dialogs owned by the foreground app."""
+
+    # hwnd -> (class, visible, text, ctrl id, owning pid)
+    WINDOWS = {
+        100: ("#32770", True, "Confirm", 0, 42),
+        200: ("#32770", True, "Elsewhere", 0, 7),
+        11: ("Button", True, "OK", 1, 42),
+        12: ("Button", False, "Hidden", 2, 42),
+        13: ("SysListView32", True, "", 3, 42),
+        14: ("Static", True, "Save changes?", 0, 42),
+    }
+
+    def _patch_win32(self, dialogs, children):
+        """Patch the Win32 calls to describe WINDOWS; dialogs are the #32770 z-order."""
+        windows = self.WINDOWS
+
+        def write(index):
+            def call(hwnd, buf, size):
+                buf.value = windows[hwnd][index][: size - 1]
+                return len(buf.value)
+
+            return call
+
+        # FindWindowExW after each dialog (None: from the start) yields the next;
+        # the key list is one longer, leaving the last dialog without a successor
+        next_dialog = dict(zip([None, *dialogs], dialogs, strict=False))
+        win32gui = MagicMock()
+        win32gui.EnumChildWindows.side_effect = lambda h, cb, arg: [cb(c, arg) for c in children]
+        win32gui.GetWindowText.side_effect = lambda h: windows[h][2]
+        win32gui.GetWindowRect.return_value = (0, 0, 200, 100)
+        win32process = MagicMock()
+        win32process.GetWindowThreadProcessId.side_effect = lambda h: (1, windows[h][4])
+        return [
+            patch.object(delphi_activeform, "win32gui", win32gui),
+            patch.object(delphi_activeform, "win32process", win32process),
+            patch.object(delphi_activeform, "GetForegroundWindow", return_value=100),
+            patch.object(
+                delphi_activeform,
+                "FindWindowExW",
+                side_effect=lambda parent, after, *_: next_dialog.get(after),
+            ),
+            patch.object(delphi_activeform, "IsWindowVisible", lambda h: windows[h][1]),
+            patch.object(delphi_activeform, "GetClassNameW", side_effect=write(0)),
+            patch.object(delphi_activeform, "GetWindowTextW", side_effect=write(2)),
+            patch.object(delphi_activeform, "GetDlgCtrlID", lambda h: windows[h][3]),
+        ]
+
+    def _detect(self, dialogs, children=()):
+        with ExitStack() as stack:
+            mocks = [stack.enter_context(p) for p in self._patch_win32(dialogs, children)]
+            return _detect_native_dialogs(), mocks
+
+    def test_reports_wanted_children(self):
+        """Only visible children of the allow-listed classes are reported."""
+        dialogs, _ = self._detect([100, 200], children=[11, 12, 13, 14])
+        assert len(dialogs) == 1
+        assert dialogs[0]["title"] == "Confirm"
+        assert dialogs[0]["controls"] == [
+            {"class": "Button", "handle": 11, "text": "OK", "id": 1},
+            {"class": "Static", "handle": 14, "text": "Save changes?"},
+        ]
+
+    def test_no_dialogs(self):
+        """With no #32770 top-level windows nothing else is queried."""
+        dialogs, mocks = self._detect([])
+        assert dialogs == []
+        find_window, get_class_name = mocks[3], mocks[5]
+        find_window.assert_called_once_with(None, None, "#32770", None)
+        get_class_name.assert_not_called()
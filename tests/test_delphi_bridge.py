@@ -0,0 +1,270 @@
+"""Tests for the DelphiBridge client in delphi_bridge.py."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from pywinauto_mcp import delphi_bridge
+from pywinauto_mcp.delphi_bridge import DelphiBridge
+
+
+@pytest.fixture(autouse=True)
+def last_port_file(tmp_path, monkeypatch):
+    """Keep the remembered-port file out of the user's home directory."""
+    path = tmp_path / "bridge_port"
+    monkeypatch.setattr(delphi_bridge, "LAST_PORT_FILE", path)
+    return path
+
+
+class TestDiscover:
+    """Test bridge discovery across candidate ports."""
+
+    def test_finds_responding_port(self):
+        """The port whose probe succeeds becomes the bridge URL."""
+        bridge = DelphiBridge()
+        with (
+            patch.object(bridge, "_get_candidate_ports", return_value=[8000, 8001, 8002]),
+            patch.object(bridge, "_probe_port", side_effect=lambda p: p == 8001),
+        ):
+            assert bridge.discover() is True
+        assert bridge.port == 8001
+        assert bridge.base_url == "http://127.0.0.1:8001"
+
+    def test_no_responding_port(self):
+        """Discovery fails cleanly when no probe succeeds."""
+        bridge = DelphiBridge()
+        with (
+            patch.object(bridge, "_get_candidate_ports", return_value=[8000, 8001]),
+            patch.object(bridge, "_probe_port", return_value=False),
+        ):
+            assert bridge.discover() is False
+        assert bridge.connected is False
+
+    def test_no_candidate_ports(self):
+        """An empty candidate list never starts a probe."""
+        bridge = DelphiBridge()
+        with (
+            patch.object(bridge, "_get_candidate_ports", return_value=[]),
+            patch.object(bridge, "_probe_port") as probe,
+        ):
+            assert bridge.discover(process_name="FineAid.exe") is False
+        probe.assert_not_called()
+
+    def test_known_port_skips_enumeration(self):
+        """A bridge on a well-known port is found without scanning listeners."""
+        bridge = DelphiBridge()
+        with (
+            patch.object(bridge, "_get_candidate_ports") as candidates,
+            patch.object(bridge, "_probe_port", side_effect=lambda p: p == 8888),
+        ):
+            assert bridge.discover() is True
+        assert bridge.port == 8888
+        candidates.assert_not_called()
+
+    def test_remembers_last_port(self, last_port_file):
+        """The discovered port is saved and probed first next time."""
+        bridge = DelphiBridge()
+        with (
+            patch.object(bridge, "_get_candidate_ports", return_value=[8000, 51234]),
+            patch.object(bridge, "_probe_port", side_effect=lambda p: p == 51234),
+        ):
+            assert bridge.discover() is True
+        assert last_port_file.read_text() == "51234"
+
+        bridge = DelphiBridge()
+        with (
+            patch.object(bridge, "_get_candidate_ports") as candidates,
+            patch.object(bridge, "_probe_port", side_effect=lambda p: p == 51234),
+        ):
+            assert bridge.discover() is True
+        candidates.assert_not_called()
+
+
+class TestGet:
+    """Test GET requests against a connected bridge."""
+
+    def test_requests_share_session(self):
+        """Consecutive calls go through the bridge's persistent session."""
+        bridge = DelphiBridge(port=8000)
+        with patch.object(bridge._session, "get") as get:
+            get.return_value.content = b"[]"
+            bridge.get_forms()
+            bridge.get_activeform_controls()
+        assert get.call_count == 2
+        assert get.call_args_list[0].args[0] == "http://127.0.0.1:8000/forms"
+
+    def test_failed_rediscovery_disconnects(self):
+        """A failed re-discovery leaves the client disconnected, not on the dead URL."""
+        bridge = DelphiBridge(port=8000)
+        with (
+            patch.object(bridge._session, "get", side_effect=requests.ConnectionError) as get,
+            patch.object(bridge, "discover", return_value=False),
+        ):
+            with pytest.raises(requests.ConnectionError):
+                bridge.get_forms()
+            with pytest.raises(RuntimeError):
+                bridge.get_forms()
+        get.assert_called_once()
+        assert bridge.connected is False
+        assert bridge.port is None
+
+    def test_rediscovery_backs_off_after_failure(self):
+        """A failed re-discovery is not repeated until its back-off has passed."""
+        bridge = DelphiBridge(port=8000)
+        with (
+            patch.object(bridge._session, "get", side_effect=requests.ConnectionError),
+            patch.object(bridge, "discover", return_value=False) as discover,
+        ):
+            with pytest.raises(requests.ConnectionError):
+                bridge.get_forms()
+            assert bridge.reconnect() is False
+            discover.assert_called_once()
+            bridge._last_discover_ts -= delphi_bridge.REDISCOVER_MAX_DELAY * 2
+            assert bridge.reconnect() is False
+        assert discover.call_count == 2
+        assert bridge._discover_failures == 2
+
+    def test_reconnect_finds_moved_bridge(self):
+        """A successful reconnect resets the back-off and uses the new port."""
+        bridge = DelphiBridge(port=8000)
+        bridge._discover_failures = 3
+        bridge._last_discover_ts = float("-inf")
+
+        def discover():
+            return bridge._connect_to(8001)
+
+        with patch.object(bridge, "discover", side_effect=discover):
+            assert bridge.reconnect() is True
+        assert bridge.base_url == "http://127.0.0.1:8001"
+        assert bridge._discover_failures == 0
+
+
+class TestCandidatePorts:
+    """Test listener enumeration and its short-lived cache."""
+
+    def setup_method(self):
+        """Start each test with no listener snapshot or process names cached."""
+        delphi_bridge._conn_cache = None
+        delphi_bridge._process_name.cache_clear()
+
+    @staticmethod
+    def _conn(port, pid, ip="127.0.0.1", status="LISTEN"):
+        return SimpleNamespace(status=status, laddr=SimpleNamespace(ip=ip, port=port), pid=pid)
+
+    def test_filters_and_sorts_listeners(self):
+        """Only local LISTEN sockets are returned, deduplicated and sorted."""
+        conns = [
+            self._conn(9000, 1),
+            self._conn(8000, 1),
+            self._conn(8000, 1, ip="0.0.0.0"),
+            self._conn(7000, 1, status="ESTABLISHED"),
+            self._conn(6000, 1, ip="192.168.1.5"),
+        ]
+        with patch("psutil.net_connections", return_value=conns) as scan:
+            assert DelphiBridge()._get_candidate_ports(None) == [8000, 9000]
+        scan.assert_called_once_with(kind="tcp4")
+
+    def test_listener_table_is_cached(self):
+        """A second lookup within the TTL does not rescan the OS table."""
+        with patch("psutil.net_connections", return_value=[self._conn(8000, 1)]) as scan:
+            bridge = DelphiBridge()
+            bridge._get_candidate_ports(None)
+            bridge._get_candidate_ports(None)
+        scan.assert_called_once()
+
+    def test_process_name_filter(self):
+        """Ports owned by other processes are skipped, one lookup per PID."""
+        conns = [self._conn(8000, 10), self._conn(8001, 10), self._conn(9000, 20)]
+        names = {10: "FineAid.exe", 20: "other.exe"}
+        with (
+            patch("psutil.net_connections", return_value=conns),
+            patch("psutil.Process") as proc,
+        ):
+            proc.side_effect = lambda pid: SimpleNamespace(name=lambda: names[pid])
+            ports = DelphiBridge()._get_candidate_ports("fineaid")
+        assert ports == [8000, 8001]
+        assert proc.call_count == 2
+
+    def test_no_process_filter_skips_process_lookup(self):
+        """Without a process filter, owning processes are never resolved."""
+        with (
+            patch("psutil.net_connections", return_value=[self._conn(8000, 10)]),
+            patch("psutil.Process") as proc,
+        ):
+            assert DelphiBridge()._get_candidate_ports(None) == [8000]
+        proc.assert_not_called()
+
+
+
+class TestProbePort:
+    """Test the single-port bridge probe."""
+
+    def test_closed_port(self):
+        """A refused connection means no bridge."""
+        bridge = DelphiBridge()
+        with patch.object(bridge._session, "get", side_effect=requests.ConnectionError):
+            assert bridge._probe_port(8000) is False
+
+    def test_bridge_response(self):
+        """A /forms list of form dicts identifies the bridge."""
+        bridge = DelphiBridge()
+        with patch.object(bridge._session, "get") as get:
+            get.return_value.status_code = 200
+            get.return_value.content = b'[{"handle": 1234}]'
+            assert bridge._probe_port(8000) is True
+
+    def test_malformed_response(self):
+        """A service sending a broken body is skipped, not fatal to discovery."""
+        bridge = DelphiBridge()
+
+        def get(url, timeout):
+            if ":8000/" in url:
+                raise requests.exceptions.ChunkedEncodingError("bad chunk")
+            return SimpleNamespace(status_code=200, content=b"[]")
+
+        with patch.object(bridge._session, "get", side_effect=get):
+            assert bridge._probe_port(8000) is False
+            assert bridge._probe_ports([8000, 8001]) == 8001
+
+    def test_other_http_server(self):
+        """Unrelated HTTP servers on the port are not mistaken for the bridge."""
+        bridge = DelphiBridge()
+        with patch.object(bridge._session, "get") as get:
+            get.return_value.status_code = 200
+            get.return_value.content = b"<html>It works!</html>"
+            assert bridge._probe_port(8000) is False
+
+
+class TestControlsCache:
+    """Test the short-lived /controls result cache."""
+
+    def test_repeated_query_is_cached(self):
+        """The same query within the TTL is served without a request."""
+        bridge = DelphiBridge(port=8000)
+        with patch.object(bridge._session, "get") as get:
+            get.return_value.content = b'[{"name": "btnOk"}]'
+            first = bridge.find_control_by_caption("OK")
+            second = bridge.find_control_by_caption("OK")
+        assert first == second == {"name": "btnOk"}
+        get.assert_called_once()
+
+    def test_different_queries_not_shared(self):
+        """Different filters are cached separately."""
+        bridge = DelphiBridge(port=8000)
+        with patch.object(bridge._session, "get") as get:
+            get.return_value.content = b"[]"
+            bridge.get_controls(caption="OK")
+            bridge.get_controls(caption="Cancel")
+        assert get.call_count == 2
+
+    def test_invalidate_cache(self):
+        """invalidate_cache forces the next query to refetch."""
+        bridge = DelphiBridge(port=8000)
+        with patch.object(bridge._session, "get") as get:
+            get.return_value.content = b"[]"
+            bridge.get_controls(name="btnOk")
+            bridge.invalidate_cache()
+            bridge.get_controls(name="btnOk")
+        assert get.call_count == 2
@@ -0,0 +1,1168 @@
+"""Tests for the automation_elements helpers in portmanteau_elements.py."""
+
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pywinauto.base_wrapper import ElementNotVisible
+from pywinauto.findwindows import ElementNotFoundError
+
+from pywinauto_mcp.tools import portmanteau_elements
+from pywinauto_mcp.tools.portmanteau_elements import (
+    _ELEMENT_OPS,
+    _NO_SELECTORS,
+    _OP_HANDLERS,
+    _bind_element,
+    _bridge_wrapper,
+    _CachedWrapper,
+    _desktop_for,
+    _find_control,
+    _find_edit_child,
+    _get_bridge,
+    _get_desktop,
+    _list_uia_elements,
+    _list_wrapper_children,
+    _OpContext,
+    _resolve_target,
+    _resolve_wrapper,
+    _run_operation,
+    _wait_for_element,
+)
+
+
+@pytest.fixture(autouse=True)
+def spec_search(request):
+    """Resolve element specifications through their mocked wrapper_object().
+
+    TestFindControl exercises the real bounded search.
+    """
+    if request.cls is TestFindControl:
+        yield
+        return
+    with patch.object(
+        portmanteau_elements,
+        "_find_control",
+        side_effect=lambda element, timeout=None, visible_only=True: element.wrapper_object(),
+    ):
+        yield
+
+
+class _WaitTimeoutError(Exception):
+    """Stand-in for pywinauto.timings.TimeoutError."""
+
+
+def _wait_until_passes(timeout, retry_interval, func, exceptions, *args, **kwargs):
+    """Retry *func* like pywinauto.timings.wait_until_passes."""
+    start = time.monotonic()
+    while True:
+        try:
+            return func(*args, **kwargs)
+        except exceptions as e:
+            if time.monotonic() - start >= timeout:
+                error = _WaitTimeoutError()
+                error.original_exception = e
+                raise error from e
+            time.sleep(retry_interval)
+
+
+class TestFindControl:
+    """Test the single bounded element search."""
+
+    def _search(self, find_element, timeout=None, **kwargs):
+        spec = MagicMock()
+        spec.criteria = [{"handle": 100, "backend": "uia"}, {"auto_id": "btnOk"}]
+        backend = MagicMock()
+        backend.name = "uia"
+        timings = SimpleNamespace(
+            Timings=SimpleNamespace(exists_timeout=0.2, exists_retry=0.05, window_find_timeout=5),
+            TimeoutError=_WaitTimeoutError,
+            wait_until_passes=_wait_until_passes,
+        )
+        with (
+            patch.dict(
+                sys.modules,
+                {
+                    "pywinauto.timings": timings,
+                    "pywinauto.backend": SimpleNamespace(
+                        registry=SimpleNamespace(backends={"uia": backend})
+                    ),
+                },
+            ),
+            patch.object(
+                sys.modules["pywinauto.findwindows"], "find_element", side_effect=find_element
+            ) as find,
+        ):
+            return _find_control(spec, timeout, **kwargs), find, backend
+
+    def test_visible_controls_only(self):
+        """By default only visible controls match, as with wrapper_object()."""
+        wrapper, find, backend = self._search(lambda **criteria: "info")
+        assert wrapper is backend.generic_wrapper_class.return_value
+        backend.generic_wrapper_class.assert_called_once_with("info")
+        criteria = find.call_args.kwargs
+        assert criteria["auto_id"] == "btnOk"
+        assert criteria["parent"] is backend.element_info_class.return_value
+        backend.element_info_class.assert_called_once_with(100)
+        assert criteria["visible_only"] is True
+        assert "enabled_only" not in criteria
+        assert criteria["top_level_only"] is False
+
+    def test_hidden_controls_on_request(self):
+        """visible_only=False matches hidden controls too, as exists() does."""
+        _, find, _ = self._search(lambda **criteria: "info", visible_only=False)
+        assert find.call_args.kwargs["visible_only"] is False
+
+    def test_miss_returns_within_exists_timeout(self):
+        """A selector that matches nothing fails after exists_timeout, not 5 s."""
+
+        def missing(**criteria):
+            raise ElementNotFoundError
+
+        start = time.monotonic()
+        with pytest.raises(ElementNotFoundError):
+            self._search(missing)
+        assert time.monotonic() - start < 1.0
+
+
+class TestGetDesktop:
+    """Test reuse of Desktop instances."""
+
+    def setup_method(self):
+        """Start each test with no cached Desktop instances."""
+        _desktop_for.cache_clear()
+
+    def teardown_method(self):
+        """Leave no test Desktop instances cached for later tests."""
+        _desktop_for.cache_clear()
+
+    def test_reused_per_backend(self):
+        """Repeated calls return the same Desktop for the same backend."""
+        with patch.object(portmanteau_elements, "Desktop") as desktop:
+            first = _get_desktop("uia")
+            assert _get_desktop("uia") is first
+            _get_desktop("win32")
+        assert [c.kwargs["backend"] for c in desktop.call_args_list] == ["uia", "win32"]
+
+    def test_defaults_to_configured_backend(self):
+        """Without an explicit backend the configured one is used."""
+        with (
+            patch.object(portmanteau_elements, "Desktop") as desktop,
+            patch.object(portmanteau_elements.settings, "PYWINAUTO_BACKEND", "win32"),
+        ):
+            _get_desktop()
+        desktop.assert_called_once_with(backend="win32")
+
+
+class TestGetBridge:
+    """Test the lazily discovered bridge singleton."""
+
+    def test_lost_bridge_not_handed_out(self):
+        """A bridge that was lost and cannot be re-found is not returned."""
+        bridge = MagicMock(connected=False)
+        bridge.reconnect.return_value = False
+        with (
+            patch.object(portmanteau_elements, "_bridge", bridge),
+            patch.object(portmanteau_elements, "_bridge_attempted", True),
+        ):
+            assert _get_bridge() is None
+            bridge.reconnect.return_value = True
+            assert _get_bridge() is bridge
+
+
+class TestResolveWrapper:
+    """Test reuse of wrappers resolved from element selectors."""
+
+    KEY = (100, None, "btnOk", None, None, None)
+
+    def setup_method(self):
+        """Start each test with no cached wrappers."""
+        portmanteau_elements._element_cache.clear()
+
+    def test_reused_within_ttl(self):
+        """A second resolve of the same selector skips the element search."""
+        spec = MagicMock()
+        first = _resolve_wrapper(spec, self.KEY)
+        second = _resolve_wrapper(spec, self.KEY)
+        assert first is second is spec.wrapper_object.return_value
+        spec.wrapper_object.assert_called_once()
+        spec.exists.assert_not_called()
+
+    def test_expired_entry_searches_again(self):
+        """Entries older than the TTL are resolved afresh."""
+        spec = MagicMock()
+        with patch.object(portmanteau_elements, "_ELEMENT_CACHE_TTL", 0):
+            _resolve_wrapper(spec, self.KEY)
+            _resolve_wrapper(spec, self.KEY)
+        assert spec.wrapper_object.call_count == 2
+
+    def test_missing_element(self):
+        """A selector that matches nothing gives None and is not cached."""
+        spec = MagicMock()
+        spec.wrapper_object.side_effect = ElementNotFoundError
+        assert _resolve_wrapper(spec, self.KEY) is None
+        assert self.KEY not in portmanteau_elements._element_cache
+
+    def test_search_error_propagates(self):
+        """A failed search is re-raised and leaves nothing cached."""
+        spec = MagicMock()
+        spec.wrapper_object.side_effect = RuntimeError("COM error")
+        with pytest.raises(RuntimeError):
+            _resolve_wrapper(spec, self.KEY)
+        assert self.KEY not in portmanteau_elements._element_cache
+
+
+class TestRunOperation:
+    """Test cache handling around a single operation."""
+
+    def setup_method(self):
+        """Start each test with no cached wrappers."""
+        portmanteau_elements._element_cache.clear()
+
+    def _ctx(self, operation, auto_id="edtName"):
+        return _OpContext(
+            operation=operation,
+            window_handle=100,
+            window=MagicMock(),
+            selectors=(None, auto_id, None, None, None),
+            has_selector=True,
+            element_key=(100, None, auto_id, None, None, None),
+            timestamp=0.0,
+        )
+
+    def test_stale_cached_wrapper_retried_fresh(self):
+        """An operation failing on a cached wrapper runs again on a new search."""
+        ctx = self._ctx("text")
+        stale = MagicMock()
+        stale.window_text.side_effect = RuntimeError("element not available")
+        portmanteau_elements._element_cache[ctx.element_key] = (time.monotonic(), stale)
+        fresh = ctx.window.child_window.return_value.wrapper_object.return_value
+        fresh.window_text.return_value = "Bob"
+        with patch.object(portmanteau_elements, "_get_bridge", return_value=None):
+            result = _run_operation(ctx)
+        assert result["text"] == "Bob"
+        assert portmanteau_elements._element_cache[ctx.element_key][1] is fresh
+
+    def test_fresh_search_failure_not_retried(self):
+        """An error on a wrapper that was just searched for is raised once."""
+        ctx = self._ctx("text")
+        wrapper = ctx.window.child_window.return_value.wrapper_object.return_value
+        wrapper.window_text.side_effect = RuntimeError("COM error")
+        with (
+            patch.object(portmanteau_elements, "_get_bridge", return_value=None),
+            pytest.raises(RuntimeError),
+        ):
+            _run_operation(ctx)
+        wrapper.window_text.assert_called_once()
+
+    def test_mutating_operation_clears_window_entries(self):
+        """After a click no wrapper cached for that window is reused."""
+        ctx = self._ctx("click")
+        cache = portmanteau_elements._element_cache
+        cache[(100, None, "edtOther", None, None, None)] = (time.monotonic(), MagicMock())
+        cache[(200, None, "edtOther", None, None, None)] = (time.monotonic(), MagicMock())
+        with patch.object(portmanteau_elements, "_get_bridge", return_value=None):
+            assert _run_operation(ctx)["status"] == "success"
+        assert list(cache) == [(200, None, "edtOther", None, None, None)]
+
+
+class TestOpHandlers:
+    """Test the operation dispatch table."""
+
+    def setup_method(self):
+        """Start each test with no cached wrappers or window rectangles."""
+        portmanteau_elements._element_cache.clear()
+        portmanteau_elements._window_rect_cache.clear()
+
+    def _ctx(self, operation, **kwargs):
+        return _OpContext(
+            operation=operation,
+            window_handle=100,
+            window=MagicMock(),
+            selectors=(None, "edtName", None, None, None),
+            has_selector=True,
+            element_key=(100, None, "edtName", None, None, None),
+            timestamp=0.0,
+            **{
+                "element": MagicMock(),
+                "selector_desc": "auto_id='edtName'",
+                "wrapper": MagicMock(),
+                **kwargs,
+            },
+        )
+
+    def test_element_ops_have_handlers(self):
+        """Every operation that needs a selector is dispatchable."""
+        assert _ELEMENT_OPS <= _OP_HANDLERS.keys()
+
+    def test_text(self):
+        """The text handler reads the resolved wrapper."""
+        ctx = self._ctx("text")
+        ctx.wrapper.window_text.return_value = "Bob"
+        result = _OP_HANDLERS["text"](ctx)
+        assert result["status"] == "success"
+        assert result["text"] == "Bob"
+
+    def test_not_found_names_operation(self):
+        """A missing element reports the operation that was attempted."""
+        ctx = self._ctx("enabled", element=None, wrapper=None)
+        ctx.window.child_window.return_value.wrapper_object.side_effect = ElementNotFoundError
+        assert _bind_element(ctx) == {
+            "status": "error",
+            "operation": "enabled",
+            "error": "Element with auto_id='edtName' not found",
+        }
+
+    def test_bind_element_searches_once(self):
+        """Wrapper-only operations resolve the element once, before dispatch."""
+        ctx = self._ctx("visible", element=None, wrapper=None)
+        assert _bind_element(ctx) is None
+        search = ctx.window.child_window.return_value
+        assert ctx.wrapper._wrapper is search.wrapper_object.return_value
+        _OP_HANDLERS["visible"](ctx)
+        search.wrapper_object.assert_called_once()
+        search.exists.assert_not_called()
+
+    def test_bind_element_defers_bridge_ops(self):
+        """The rect and set_text operations do not search UIA before trying the bridge."""
+        ctx = self._ctx("rect", element=None, wrapper=None)
+        assert _bind_element(ctx) is None
+        assert ctx.wrapper is None
+        ctx.window.child_window.return_value.wrapper_object.assert_not_called()
+
+    def test_rect_from_edges(self):
+        """Width and height come from the rectangle's edges."""
+        ctx = self._ctx("rect", auto_id=None)
+        ctx.element.wrapper_object.return_value.rectangle.return_value = SimpleNamespace(
+            left=10, top=20, right=110, bottom=45
+        )
+        with patch.object(portmanteau_elements, "_get_bridge", return_value=None):
+            result = _OP_HANDLERS["rect"](ctx)
+        assert (result["width"], result["height"]) == (100, 25)
+
+    def test_element_click_at_centre(self):
+        """Element clicks go to the element's centre once its window is in front."""
+        ctx = self._ctx("double_click", auto_id=None)
+        wrapper = ctx.element.wrapper_object.return_value
+        wrapper.rectangle.return_value = SimpleNamespace(left=10, top=20, right=110, bottom=40)
+        ctx.window.child_window.return_value = ctx.element
+        calls = MagicMock()
+        with (
+            patch.object(portmanteau_elements.settings, "FAST_CLICK", True),
+            patch.object(portmanteau_elements, "GetAncestor", return_value=50),
+            patch.object(portmanteau_elements, "_bring_to_foreground", calls.foreground),
+            patch.object(portmanteau_elements, "click_at", calls.click_at),
+        ):
+            calls.click_at.return_value = True
+            assert _OP_HANDLERS["double_click"](ctx)["status"] == "success"
+        assert calls.mock_calls[:2] == [
+            ("foreground", (50,), {}),
+            ("click_at", (60, 30, "left", 2), {}),
+        ]
+        wrapper.double_click_input.assert_not_called()
+
+    def test_hidden_element_not_fast_clicked(self):
+        """FAST_CLICK refuses hidden or zero-area elements instead of clicking their centre."""
+        ctx = self._ctx("click", auto_id=None)
+        wrapper = ctx.element.wrapper_object.return_value
+        ctx.window.child_window.return_value = ctx.element
+        rects = {
+            True: SimpleNamespace(left=10, top=20, right=10, bottom=40),
+            False: SimpleNamespace(left=10, top=20, right=110, bottom=40),
+        }
+        with (
+            patch.object(portmanteau_elements.settings, "FAST_CLICK", True),
+            patch.object(portmanteau_elements, "_get_bridge", return_value=None),
+            patch.object(portmanteau_elements, "_bring_to_foreground") as foreground,
+            patch.object(portmanteau_elements, "click_at") as click,
+        ):
+            for visible, rect in rects.items():
+                wrapper.is_visible.return_value = visible
+                wrapper.rectangle.return_value = rect
+                with pytest.raises(ElementNotVisible):
+                    _OP_HANDLERS["click"](ctx)
+        click.assert_not_called()
+        foreground.assert_not_called()
+
+    def test_element_click_without_fast_click(self):
+        """By default the wrapper's own click method does the clicking."""
+        ctx = self._ctx("right_click", auto_id=None)
+        wrapper = ctx.element.wrapper_object.return_value
+        ctx.window.child_window.return_value = ctx.element
+        with (
+            patch.object(portmanteau_elements, "_bring_to_foreground") as foreground,
+            patch.object(portmanteau_elements, "click_at") as click,
+        ):
+            _OP_HANDLERS["right_click"](ctx)
+        wrapper.click.assert_called_once_with(button="right")
+        wrapper.click_input.assert_not_called()
+        click.assert_not_called()
+        foreground.assert_not_called()
+
+    def test_element_click_input_when_no_click_method(self):
+        """Wrappers without double_click() fall back to double_click_input()."""
+        ctx = self._ctx("double_click", auto_id=None)
+        wrapper = ctx.element.wrapper_object.return_value
+        del wrapper.double_click
+        ctx.window.child_window.return_value = ctx.element
+        _OP_HANDLERS["double_click"](ctx)
+        wrapper.double_click_input.assert_called_once_with(button="left")
+
+    def test_target_relative_point(self):
+        """Window-relative x/y are offset by the window's top-left corner."""
+        ctx = self._ctx("click", x=5, y=7)
+        ctx.has_selector = False
+        ctx.window.rectangle.return_value = SimpleNamespace(
+            left=100, top=200, right=300, bottom=400
+        )
+        assert _resolve_target(ctx) == ("point", 105, 207)
+
+    def test_window_rect_cached(self):
+        """Back-to-back relative clicks read the window rectangle once."""
+        ctx = self._ctx("click", x=5, y=7)
+        ctx.has_selector = False
+        ctx.window.rectangle.return_value = SimpleNamespace(
+            left=100, top=200, right=300, bottom=400
+        )
+        _resolve_target(ctx)
+        _resolve_target(ctx)
+        ctx.window.rectangle.assert_called_once()
+        ctx.refresh_rect = True
+        _resolve_target(ctx)
+        assert ctx.window.rectangle.call_count == 2
+
+    def test_target_absolute_point(self):
+        """Absolute x/y are used as given without reading the window rect."""
+        ctx = self._ctx("hover", x=5, y=7, absolute=True)
+        ctx.has_selector = False
+        assert _resolve_target(ctx) == ("point", 5, 7)
+        ctx.window.rectangle.assert_not_called()
+
+    def test_target_missing(self):
+        """Neither selectors nor a full x/y pair is an error for the operation."""
+        ctx = self._ctx("double_click", x=5)
+        ctx.has_selector = False
+        kind, result, _ = _resolve_target(ctx)
+        assert kind == "error"
+        assert result["operation"] == "double_click"
+
+    def test_set_text_hung_window(self):
+        """set_text refuses to type into a window that is not responding."""
+        ctx = self._ctx("set_text", text="Bob", auto_id=None)
+        with (
+            patch.object(portmanteau_elements, "_get_bridge", return_value=None),
+            patch.object(portmanteau_elements, "SendMessageTimeoutW", return_value=0),
+            patch.object(portmanteau_elements, "SetForegroundWindow") as foreground,
+        ):
+            result = _OP_HANDLERS["set_text"](ctx)
+        assert result["status"] == "error"
+        assert "not responding" in result["error"]
+        foreground.assert_not_called()
+
+    def test_set_text_focus_not_retried(self):
+        """A plain element that refuses focus is not asked a second time."""
+        ctx = self._ctx("set_text", text="Bob", auto_id=None)
+        ctx.element.wrapper_object.return_value.set_focus.side_effect = RuntimeError("denied")
+        with (
+            patch.object(portmanteau_elements, "_get_bridge", return_value=None),
+            patch.object(portmanteau_elements, "_window_responding", return_value=True),
+            patch.object(portmanteau_elements, "SetForegroundWindow"),
+            patch.object(portmanteau_elements.time, "sleep"),
+            pytest.raises(RuntimeError),
+        ):
+            _OP_HANDLERS["set_text"](ctx)
+        ctx.element.wrapper_object.return_value.set_focus.assert_called_once()
+
+    def test_verify_text_partial(self):
+        """Partial matching ignores case."""
+        ctx = self._ctx("verify_text", expected_text="BOB", exact_match=False)
+        ctx.wrapper.window_text.return_value = "Bobby"
+        assert _OP_HANDLERS["verify_text"](ctx)["match_found"] is True
+
+    def test_verify_text_partial_casefold(self):
+        """Partial matching folds case fully, so a longer expected text can match."""
+        ctx = self._ctx("verify_text", expected_text="STRASSE", exact_match=False)
+        ctx.wrapper.window_text.return_value = "Hauptstraße 1"
+        assert _OP_HANDLERS["verify_text"](ctx)["match_found"] is True
+        ctx.wrapper.window_text.return_value = "Hauptweg 1"
+        assert _OP_HANDLERS["verify_text"](ctx)["match_found"] is False
+
+    def test_verify_text_mismatch_shape(self):
+        """A mismatch is a failure result that still names the selector and time."""
+        ctx = self._ctx("verify_text", expected_text="Bob")
+        ctx.wrapper.window_text.return_value = "Alice"
+        result = _OP_HANDLERS["verify_text"](ctx)
+        assert result["status"] == "failure"
+        assert result["operation"] == "verify_text"
+        assert result["selector"] == "auto_id='edtName'"
+        assert result["timestamp"] == 0.0
+
+    def test_wait_reads_info_from_one_wrapper(self):
+        """The found element's info is read from a wrapper, not the spec."""
+        ctx = self._ctx("wait", timeout=1)
+        with (
+            patch.object(portmanteau_elements, "_wait_for_element", return_value=0.1),
+            patch.object(portmanteau_elements, "_get_element_info", return_value={}) as info,
+        ):
+            assert _OP_HANDLERS["wait"](ctx)["found"] is True
+        ctx.element.wrapper_object.assert_called_once()
+        assert info.call_args.args[0]._wrapper is ctx.element.wrapper_object.return_value
+        portmanteau_elements._find_control.assert_called_once_with(
+            ctx.element, visible_only=False
+        )
+
+
+class TestBatch:
+    """Test running several operations against one element."""
+
+    def setup_method(self):
+        """Start each test with no cached wrappers."""
+        portmanteau_elements._element_cache.clear()
+
+    def _ctx(self, operations):
+        return _OpContext(
+            operation="batch",
+            window_handle=100,
+            window=MagicMock(),
+            selectors=(None, "edtName", None, None, None),
+            has_selector=True,
+            element_key=(100, None, "edtName", None, None, None),
+            timestamp=0.0,
+            operations=operations,
+        )
+
+    def test_one_search_for_all_steps(self):
+        """Every step reuses the element found for the first one."""
+        ctx = self._ctx(["visible", "enabled", "text", "verify_text"])
+        ctx.expected_text = "Bob"
+        search = ctx.window.child_window.return_value
+        search.wrapper_object.return_value.window_text.return_value = "Bob"
+        result = _OP_HANDLERS["batch"](ctx)
+        assert result["status"] == "success"
+        assert [r["operation"] for r in result["results"]] == [
+            "visible",
+            "enabled",
+            "text",
+            "verify_text",
+        ]
+        assert result["results"][3]["match_found"] is True
+        ctx.window.child_window.assert_called_once()
+        search.wrapper_object.assert_called_once()
+        search.wrapper_object.return_value.window_text.assert_called_once()
+
+    def test_mutating_step_drops_cached_state(self):
+        """State read before a set_text is read again after it."""
+        ctx = self._ctx(["text", "set_text", "text"])
+        ctx.text = "Bob"
+        wrapper = ctx.window.child_window.return_value.wrapper_object.return_value
+        with (
+            patch.object(portmanteau_elements, "_get_bridge", return_value=None),
+            patch.object(portmanteau_elements, "_window_responding", return_value=True),
+            patch.object(portmanteau_elements, "SetForegroundWindow"),
+            patch.object(portmanteau_elements, "_type_replacing"),
+            patch.object(portmanteau_elements.time, "sleep"),
+        ):
+            result = _OP_HANDLERS["batch"](ctx)
+        assert [r["status"] for r in result["results"]] == ["success"] * 3
+        assert wrapper.window_text.call_count == 2
+
+    def test_failing_step_does_not_stop_batch(self):
+        """An exception in one step is reported and later steps still run."""
+        ctx = self._ctx(["rect", "visible"])
+        wrapper = ctx.window.child_window.return_value.wrapper_object.return_value
+        wrapper.rectangle.side_effect = RuntimeError("COM error")
+        with patch.object(portmanteau_elements, "_get_bridge", return_value=None):
+            result = _OP_HANDLERS["batch"](ctx)
+        assert result["results"][0]["error_type"] == "RuntimeError"
+        assert result["results"][1]["status"] == "success"
+
+    def test_click_reuses_bound_element(self):
+        """A click after a read builds no second element specification."""
+        ctx = self._ctx(["text", "click"])
+        wrapper = ctx.window.child_window.return_value.wrapper_object.return_value
+        with patch.object(portmanteau_elements, "_get_bridge", return_value=None):
+            result = _OP_HANDLERS["batch"](ctx)
+        assert result["results"][1]["selector"] == "auto_id='edtName'"
+        ctx.window.child_window.assert_called_once()
+        wrapper.click.assert_called_once_with(button="left")
+
+    def test_unknown_operation(self):
+        """Unknown and nested batch operations are rejected before anything runs."""
+        ctx = self._ctx(["visible", "batch", "teleport"])
+        result = _OP_HANDLERS["batch"](ctx)
+        assert result["status"] == "error"
+        assert result["error"] == "Unknown operations: batch, teleport"
+        assert result["valid_operations"][0] == "click"
+        assert "batch" not in result["valid_operations"]
+        ctx.window.child_window.assert_not_called()
+
+
+class TestChain:
+    """Test running steps on different elements of one window."""
+
+    def setup_method(self):
+        """Start each test with no cached wrappers."""
+        portmanteau_elements._element_cache.clear()
+
+    def _ctx(self, steps):
+        return _OpContext(
+            operation="chain",
+            window_handle=100,
+            window=MagicMock(),
+            selectors=_NO_SELECTORS,
+            has_selector=False,
+            element_key=(100, *_NO_SELECTORS),
+            timestamp=0.0,
+            steps=steps,
+        )
+
+    def test_steps_use_own_selectors(self):
+        """Each step searches for its own element in the chain's window."""
+        ctx = self._ctx(
+            [
+                {"operation": "text", "auto_id": "edtName"},
+                {"operation": "enabled", "title": "OK", "control_type": "Button"},
+            ]
+        )
+        result = _OP_HANDLERS["chain"](ctx)
+        assert result["status"] == "success"
+        assert [r["selector"] for r in result["results"]] == [
+            "auto_id='edtName'",
+            "title='OK', control_type='Button'",
+        ]
+        assert ctx.window.child_window.call_args_list[1].kwargs == {
+            "title": "OK",
+            "control_type": "Button",
+        }
+
+    def test_step_options_override(self):
+        """Step arguments apply to that step only."""
+        ctx = self._ctx(
+            [
+                {"operation": "verify_text", "auto_id": "a", "expected_text": "x"},
+                {"operation": "verify_text", "auto_id": "b"},
+            ]
+        )
+        ctx.expected_text = "default"
+        wrapper = ctx.window.child_window.return_value.wrapper_object.return_value
+        wrapper.window_text.return_value = "x"
+        result = _OP_HANDLERS["chain"](ctx)
+        assert [r["expected_text"] for r in result["results"]] == ["x", "default"]
+
+    def test_stops_at_failed_step(self):
+        """Steps after a failure do not run."""
+        ctx = self._ctx(
+            [
+                {"operation": "text"},
+                {"operation": "click", "auto_id": "btnOk"},
+            ]
+        )
+        result = _OP_HANDLERS["chain"](ctx)
+        assert result["status"] == "error"
+        assert result["failed_step"] == 0
+        assert len(result["results"]) == 1
+        ctx.window.child_window.assert_not_called()
+
+    def test_rejects_unknown_step(self):
+        """Nested chains and misspelt keys are reported with their step index."""
+        assert _OP_HANDLERS["chain"](self._ctx([{"operation": "chain"}]))["failed_step"] == 0
+        result = _OP_HANDLERS["chain"](self._ctx([{"operation": "text", "autoid": "x"}]))
+        assert result["error"] == "Step 0: unknown keys: autoid"
+
+
+class TestExceptionErr:
+    """Test error responses built from exceptions."""
+
+    def test_known_exception(self):
+        """Lookup errors from pywinauto get a stable type and a readable prefix."""
+        result = portmanteau_elements._exception_err("click", ElementNotFoundError("edtName"))
+        assert result == {
+            "status": "error",
+            "operation": "click",
+            "error": "Element not found: edtName",
+            "error_type": "ElementNotFoundError",
+        }
+
+    def test_subclass_of_known_exception(self):
+        """Subclasses report the taxonomy of the class they derive from."""
+
+        class StaleElementError(ElementNotFoundError):
+            pass
+
+        result = portmanteau_elements._exception_err("text", StaleElementError("gone"))
+        assert result["error_type"] == "ElementNotFoundError"
+
+    def test_other_exception(self):
+        """Anything else reports its own class name and message."""
+        result = portmanteau_elements._exception_err("rect", RuntimeError("COM error"))
+        assert result["error"] == "COM error"
+        assert result["error_type"] == "RuntimeError"
+
+
+class TestBridgeWrapper:
+    """Test wrapping bridge-known controls from their handle."""
+
+    def _ctx(self, **kwargs):
+        return _OpContext(
+            operation="text",
+            window_handle=100,
+            window=MagicMock(),
+            has_selector=True,
+            element_key=(100, None, "edtName", None, None, None),
+            timestamp=0.0,
+            **{"selectors": (None, "edtName", None, None, None), "auto_id": "edtName", **kwargs},
+        )
+
+    def _wrap(self, ctx, controls, is_child=True):
+        with (
+            patch.object(portmanteau_elements, "_get_bridge", return_value=MagicMock()),
+            patch.object(portmanteau_elements, "_bridge_find_controls", return_value=controls),
+            patch.object(portmanteau_elements, "IsChild", return_value=is_child),
+            patch.object(portmanteau_elements, "_wrap_handle") as wrap,
+        ):
+            return _bridge_wrapper(ctx), wrap
+
+    def test_windowed_control_skips_search(self):
+        """A bridge match with a handle is wrapped directly, with no UIA search."""
+        ctx = self._ctx()
+        with (
+            patch.object(portmanteau_elements, "_get_bridge", return_value=MagicMock()),
+            patch.object(
+                portmanteau_elements, "_bridge_find_controls", return_value=[{"handle": 555}]
+            ),
+            patch.object(portmanteau_elements, "IsChild", return_value=True) as is_child,
+            patch.object(portmanteau_elements, "_wrap_handle") as wrap,
+        ):
+            assert _bind_element(ctx) is None
+        is_child.assert_called_once_with(100, 555)
+        wrap.assert_called_once_with(555)
+        assert ctx.wrapper._wrapper is wrap.return_value
+        ctx.window.child_window.return_value.wrapper_object.assert_not_called()
+
+    def test_control_in_other_window(self):
+        """A match on an active form outside the target window is not used."""
+        wrapper, wrap = self._wrap(self._ctx(), [{"handle": 555}], is_child=False)
+        assert wrapper is None
+        wrap.assert_not_called()
+
+    def test_other_window_falls_back_to_search(self):
+        """The target window's own control is then found by the UIA search."""
+        ctx = self._ctx()
+        with (
+            patch.object(portmanteau_elements, "_get_bridge", return_value=MagicMock()),
+            patch.object(
+                portmanteau_elements, "_bridge_find_controls", return_value=[{"handle": 555}]
+            ),
+            patch.object(portmanteau_elements, "IsChild", return_value=False),
+            patch.object(portmanteau_elements, "_wrap_handle") as wrap,
+        ):
+            assert _bind_element(ctx) is None
+        wrap.assert_not_called()
+        search = ctx.window.child_window.return_value
+        assert ctx.wrapper._wrapper is search.wrapper_object.return_value
+
+    def test_non_windowed_control(self):
+        """Controls without a handle fall back to the UIA search."""
+        wrapper, wrap = self._wrap(self._ctx(), [{"handle": 0}])
+        assert wrapper is None
+        wrap.assert_not_called()
+
+    def test_selectors_bridge_cannot_check(self):
+        """A class_name (or any non-bridge selector) keeps the UIA search."""
+        ctx = self._ctx(selectors=(None, "edtName", None, "TEdit", None))
+        wrapper, wrap = self._wrap(ctx, [{"handle": 555}])
+        assert wrapper is None
+        wrap.assert_not_called()
+
+    def test_all_forms(self):
+        """Without active_form_only the bridge match may be on another form."""
+        wrapper, wrap = self._wrap(self._ctx(active_form_only=False), [{"handle": 555}])
+        assert wrapper is None
+        wrap.assert_not_called()
+
+    def test_stale_handle(self):
+        """A handle that can no longer be wrapped falls back quietly."""
+        with (
+            patch.object(portmanteau_elements, "_get_bridge", return_value=MagicMock()),
+            patch.object(
+                portmanteau_elements, "_bridge_find_controls", return_value=[{"handle": 555}]
+            ),
+            patch.object(portmanteau_elements, "IsChild", return_value=True),
+            patch.object(portmanteau_elements, "_wrap_handle", side_effect=RuntimeError),
+        ):
+            assert _bridge_wrapper(self._ctx()) is None
+
+
+class TestBringToForeground:
+    """Test activating a window before input."""
+
+    def test_already_foreground(self):
+        """A window already in front is neither activated nor waited on."""
+        with (
+            patch.object(portmanteau_elements, "GetForegroundWindow", return_value=100),
+            patch.object(portmanteau_elements, "SetForegroundWindow") as activate,
+            patch.object(portmanteau_elements.time, "sleep") as sleep,
+        ):
+            portmanteau_elements._bring_to_foreground(100)
+        activate.assert_not_called()
+        sleep.assert_not_called()
+
+    def test_other_window_in_front(self):
+        """Another foreground window is replaced, then the UI is given time to settle."""
+        with (
+            patch.object(portmanteau_elements, "GetForegroundWindow", return_value=200),
+            patch.object(portmanteau_elements, "SetForegroundWindow") as activate,
+            patch.object(portmanteau_elements.time, "sleep") as sleep,
+        ):
+            portmanteau_elements._bring_to_foreground(100)
+        activate.assert_called_once_with(100)
+        sleep.assert_called_once_with(portmanteau_elements._FOREGROUND_SETTLE)
+
+
+class TestTypeReplacing:
+    """Test replacing a field's text at the keyboard focus."""
+
+    def test_single_burst(self):
+        """Select-all, delete and the text go out in one SendInput call."""
+        with (
+            patch.object(portmanteau_elements, "replace_field_text", return_value=True) as send,
+            patch.dict(sys.modules, {"pyautogui": MagicMock()}),
+        ):
+            portmanteau_elements._type_replacing("Bob")
+            pyautogui = sys.modules["pyautogui"]
+        send.assert_called_once_with("Bob")
+        pyautogui.hotkey.assert_not_called()
+
+    def test_falls_back_to_pyautogui(self):
+        """When SendInput is blocked the keys are typed through pyautogui."""
+        with (
+            patch.object(portmanteau_elements, "replace_field_text", return_value=False),
+            patch.dict(sys.modules, {"pyautogui": MagicMock()}),
+        ):
+            portmanteau_elements._type_replacing("Bob")
+            pyautogui = sys.modules["pyautogui"]
+        pyautogui.hotkey.assert_called_once_with("ctrl", "a")
+        pyautogui.typewrite.assert_called_once_with("Bob", interval=0.02)
+
+
+class TestCachedWrapper:
+    """Test the per-call property cache around a wrapper."""
+
+    def test_reads_once(self):
+        """Repeated state reads hit the wrapper once."""
+        wrapper = MagicMock()
+        cached = _CachedWrapper(wrapper)
+        assert cached.window_text() is cached.window_text()
+        cached.is_visible()
+        cached.is_visible()
+        wrapper.window_text.assert_called_once()
+        wrapper.is_visible.assert_called_once()
+
+    def test_other_calls_pass_through(self):
+        """Actions are not cached."""
+        wrapper = MagicMock()
+        cached = _CachedWrapper(wrapper)
+        cached.set_focus()
+        cached.set_focus()
+        assert wrapper.set_focus.call_count == 2
+
+    def test_isinstance_of_wrapped_class(self):
+        """Wrapper-class checks see the wrapped control's class."""
+
+        class Wrapper:
+            def window_text(self):
+                return "Bob"
+
+        cached = _CachedWrapper(Wrapper())
+        assert isinstance(cached, Wrapper)
+        assert cached.window_text() == "Bob"
+
+
+class TestWaitForElement:
+    """Test waiting for an element to appear."""
+
+    def test_polls_without_events(self):
+        """Without a UIA subscription the element is polled with growing gaps."""
+        element = MagicMock()
+        element.exists.side_effect = [False, False, True]
+        waits = []
+
+        class RecordingEvent(threading.Event):
+            def wait(self, timeout=None):
+                waits.append(timeout)
+                return False
+
+        with (
+            patch.object(portmanteau_elements, "_subscribe_structure_changed", return_value=None),
+            patch.object(portmanteau_elements.threading, "Event", RecordingEvent),
+        ):
+            assert _wait_for_element(MagicMock(), element, timeout=5) is not None
+        assert element.exists.call_count == 3
+        assert waits == [pytest.approx(0.005), pytest.approx(0.0075)]
+
+    def test_zero_timeout_single_probe(self):
+        """A zero timeout checks once without subscribing to UIA events."""
+        element = MagicMock()
+        element.exists.return_value = False
+        with patch.object(portmanteau_elements, "_subscribe_structure_changed") as subscribe:
+            assert _wait_for_element(MagicMock(), element, timeout=0) is None
+        element.exists.assert_called_once_with(timeout=0)
+        subscribe.assert_not_called()
+
+    def test_poll_backoff_is_capped(self):
+        """Polling backs off to the maximum interval and stays there."""
+        element = MagicMock()
+        element.exists.side_effect = [False] * 20 + [True]
+        waits = []
+
+        class RecordingEvent(threading.Event):
+            def wait(self, timeout=None):
+                waits.append(timeout)
+                return False
+
+        with (
+            patch.object(portmanteau_elements, "_subscribe_structure_changed", return_value=None),
+            patch.object(portmanteau_elements.threading, "Event", RecordingEvent),
+        ):
+            _wait_for_element(MagicMock(), element, timeout=60)
+        assert waits == sorted(waits)
+        assert waits[-1] == portmanteau_elements._WAIT_POLL_INTERVAL
+
+    def test_structure_change_triggers_recheck(self):
+        """A structure event re-checks at once and the subscription is removed."""
+        element = MagicMock()
+        element.exists.side_effect = [False, True]
+        unsubscribe = MagicMock()
+
+        def subscribe(window, event):
+            threading.Timer(0.05, event.set).start()
+            return unsubscribe
+
+        with (
+            patch.object(portmanteau_elements, "_subscribe_structure_changed", subscribe),
+            patch.object(portmanteau_elements, "_WAIT_RECHECK_INTERVAL", 30),
+        ):
+            assert _wait_for_element(MagicMock(), element, timeout=30) < 5
+        unsubscribe.assert_called_once()
+
+    def test_timeout(self):
+        """None is returned once the timeout passes."""
+        element = MagicMock()
+        element.exists.return_value = False
+        with patch.object(portmanteau_elements, "_subscribe_structure_changed", return_value=None):
+            assert _wait_for_element(MagicMock(), element, timeout=0) is None
+        element.exists.assert_called_once_with(timeout=0)
+
+
+class TestFindEditChild:
+    """Test locating the inner Edit of a composite control."""
+
+    def _find(self, found):
+        uia = MagicMock()
+        uia.known_control_types = {"Edit": 50004}
+        uia.tree_scope = {"children": 2}
+        wrapper = MagicMock()
+        wrapper.element_info.element.FindFirst.return_value = found
+        modules = {
+            "pywinauto.uia_defines": SimpleNamespace(IUIA=lambda: uia),
+            "pywinauto.uia_element_info": SimpleNamespace(UIAElementInfo=lambda e: ("info", e)),
+            "pywinauto.controls.uiawrapper": SimpleNamespace(UIAWrapper=lambda i: ("wrapper", i)),
+        }
+        with patch.dict(sys.modules, modules):
+            result = _find_edit_child(wrapper)
+        return result, uia, wrapper
+
+    def test_single_find_first(self):
+        """The Edit child is found with one FindFirst over direct children."""
+        result, uia, wrapper = self._find("edit-elem")
+        assert result == ("wrapper", ("info", "edit-elem"))
+        uia.iuia.CreatePropertyCondition.assert_called_once_with(
+            uia.UIA_dll.UIA_ControlTypePropertyId, 50004
+        )
+        wrapper.element_info.element.FindFirst.assert_called_once_with(
+            2, uia.iuia.CreatePropertyCondition.return_value
+        )
+        wrapper.children.assert_not_called()
+
+    def test_no_edit_child(self):
+        """A NULL FindFirst result gives None."""
+        assert self._find(None)[0] is None
+
+
+class TestGetElementInfo:
+    """Test element info read through wrapper properties."""
+
+    def test_edit_type_and_readonly(self):
+        """Edit wrappers are typed and report their read-only state."""
+        edit_wrapper = portmanteau_elements.EditWrapper
+        if edit_wrapper is None:
+            pytest.skip("UIA wrappers not available")
+        element = MagicMock()
+        element.__class__ = edit_wrapper
+        element.is_read_only = MagicMock(return_value=True)
+        with patch.object(portmanteau_elements.settings, "PYWINAUTO_BACKEND", "win32"):
+            info = portmanteau_elements._get_element_info(element)
+        assert info["element_type"] == "edit"
+        assert info["is_readonly"] is True
+
+    def test_lite_info_skips_extras(self):
+        """Without verbose, the type is reported but its extras are not read."""
+        edit_wrapper = portmanteau_elements.EditWrapper
+        if edit_wrapper is None:
+            pytest.skip("UIA wrappers not available")
+        element = MagicMock()
+        element.__class__ = edit_wrapper
+        with patch.object(portmanteau_elements.settings, "PYWINAUTO_BACKEND", "win32"):
+            info = portmanteau_elements._get_element_info(element, verbose=False)
+        assert info["element_type"] == "edit"
+        assert "is_readonly" not in info
+        element.is_read_only.assert_not_called()
+
+    def test_plain_wrapper_has_no_type(self):
+        """Wrappers outside the known classes get no element_type."""
+        with patch.object(portmanteau_elements.settings, "PYWINAUTO_BACKEND", "win32"):
+            info = portmanteau_elements._get_element_info(MagicMock())
+        assert "element_type" not in info
+
+
+class TestListWrapperChildren:
+    """Test the wrapper-based element tree walk."""
+
+    @staticmethod
+    def _node(name, *children):
+        node = MagicMock(name=name)
+        node.children.return_value = list(children)
+        return node
+
+    def _list(self, root, max_depth):
+        def info(elem, verbose):
+            return {"name": elem._mock_name}
+
+        with patch.object(portmanteau_elements, "_get_element_info", side_effect=info):
+            return _list_wrapper_children(root, max_depth)
+
+    def test_tree_shape_and_depth(self):
+        """Children nest under their parents in order, cut off below max_depth."""
+        grandchild = self._node("grandchild", self._node("too-deep"))
+        root = self._node("root", self._node("a", grandchild), self._node("b"))
+        assert self._list(root, max_depth=1) == [
+            {"name": "a", "children": [{"name": "grandchild", "children": []}]},
+            {"name": "b", "children": []},
+        ]
+        grandchild.children.assert_not_called()
+
+    def test_sibling_order_with_parallel_reads(self):
+        """Siblings keep their order even when an earlier read finishes last."""
+        names = [f"c{i}" for i in range(20)]
+        root = self._node("root", *[self._node(n) for n in names])
+
+        def info(elem, verbose):
+            if elem._mock_name == "c0":
+                time.sleep(0.05)
+            return {"name": elem._mock_name}
+
+        with patch.object(portmanteau_elements, "_get_element_info", side_effect=info):
+            elements = _list_wrapper_children(root, max_depth=0)
+        assert [e["name"] for e in elements] == names
+
+    def test_deep_tree(self):
+        """Deep trees do not hit the recursion limit."""
+        node = self._node("leaf")
+        for _ in range(3000):
+            node = self._node("", node)
+        elements = self._list(node, max_depth=5000)
+        for _ in range(2999):
+            elements = elements[0]["children"]
+        assert elements[0]["name"] == "leaf"
+
+
+class _FakeUIAElement:
+    """Stand-in for a cached IUIAutomationElement."""
+
+    def __init__(self, name, control_type, children=(), handle=0, value=None):
+        self.CachedName = name
+        self.CachedClassName = f"T{name}"
+        self.CachedAutomationId = name.lower()
+        self.CachedControlType = control_type
+        self.CachedProcessId = 42
+        self.CachedNativeWindowHandle = handle
+        self.CachedBoundingRectangle = SimpleNamespace(left=10, top=20, right=110, bottom=50)
+        self.CachedIsEnabled = 1
+        self.CachedIsOffscreen = 0
+        self.values = {"UIA_ValueValuePropertyId": value, "UIA_ValueIsReadOnlyPropertyId": 0}
+        self.children = list(children)
+        self.find_calls = 0
+
+    def GetCachedPropertyValue(self, prop):  # noqa: N802
+        return self.values[prop]
+
+    def FindAllBuildCache(self, scope, condition, cache_request):  # noqa: N802
+        self.find_calls += 1
+        return SimpleNamespace(Length=len(self.children), GetElement=self.children.__getitem__)
+
+
+class TestListUIAElements:
+    """Test cache-request based element info and listing."""
+
+    def setup_method(self):
+        """Build a fake IUIA and a small Root/Panel/Edit element tree."""
+        self.uia = SimpleNamespace(
+            iuia=MagicMock(),
+            # Property ids are their own names
+            UIA_dll=SimpleNamespace(**{p: p for p in portmanteau_elements._UIA_LIST_PROPERTIES}),
+            known_control_type_ids={1: "Pane", 2: "Button", 3: "Edit"},
+            tree_scope={"children": "children"},
+            true_condition="true",
+        )
+        self.edit = _FakeUIAElement("Name", 3, value="Bob")
+        self.panel = _FakeUIAElement("Panel", 1, children=[self.edit])
+        self.root = _FakeUIAElement("Root", 1, children=[self.panel, _FakeUIAElement("Ok", 2)])
+
+    def _list(self, max_depth):
+        uia_defines = SimpleNamespace(IUIA=lambda: self.uia)
+        with patch.dict(sys.modules, {"pywinauto.uia_defines": uia_defines}):
+            return _list_uia_elements(self.root, max_depth)
+
+    def test_tree_shape_and_fields(self):
+        """Children nest like the wrapper walk and carry the usual fields."""
+        elements = self._list(max_depth=3)
+        assert [e["name"] for e in elements] == ["Panel", "Ok"]
+        assert elements[1]["element_type"] == "button"
+        edit = elements[0]["children"][0]
+        assert edit["text"] == "Bob"
+        assert edit["control_type"] == "Edit"
+        assert edit["is_readonly"] is False
+        assert edit["rect"]["width"] == 100
+        assert edit["is_visible"] is True
+        assert edit["control_id"] is None
+
+    def test_one_request_per_parent(self):
+        """Each listed parent is queried exactly once."""
+        self._list(max_depth=3)
+        assert (self.root.find_calls, self.panel.find_calls) == (1, 1)
+
+    def test_max_depth(self):
+        """Children below max_depth are not fetched."""
+        elements = self._list(max_depth=0)
+        assert elements[0]["children"] == []
+        assert self.panel.find_calls == 0
+
+    def test_element_info_single_cache_refresh(self):
+        """_get_element_info on UIA refreshes all properties in one call."""
+        wrapper = MagicMock()
+        wrapper.element_info.element.BuildUpdatedCache.return_value = _FakeUIAElement("Ok", 2)
+        spec = MagicMock()
+        spec.wrapper_object.return_value = wrapper
+        uia_defines = SimpleNamespace(IUIA=lambda: self.uia)
+        with (
+            patch.dict(sys.modules, {"pywinauto.uia_defines": uia_defines}),
+            patch.object(portmanteau_elements.settings, "PYWINAUTO_BACKEND", "uia"),
+        ):
+            info = portmanteau_elements._get_element_info(spec)
+        spec.wrapper_object.assert_called_once()
+        wrapper.element_info.element.BuildUpdatedCache.assert_called_once()
+        assert info["name"] == "Ok"
+        assert info["element_type"] == "button"
+        assert info["automation_id"] == "ok"
@@ -0,0 +1,146 @@
+"""Tests for SendInput event construction in win32_input.py."""
+
+from unittest.mock import patch
+
+from pywinauto_mcp import win32_input
+from pywinauto_mcp.win32_input import (
+    INPUT_MOUSE,
+    KEYEVENTF_KEYUP,
+    KEYEVENTF_UNICODE,
+    MOUSEEVENTF_LEFTDOWN,
+    MOUSEEVENTF_LEFTUP,
+    MOUSEEVENTF_RIGHTDOWN,
+    MOUSEEVENTF_RIGHTUP,
+    VK_A,
+    VK_CONTROL,
+    VK_DELETE,
+    VK_RETURN,
+    _clear_field_inputs,
+    _click_inputs,
+    _unicode_inputs,
+    click_at,
+    send_inputs,
+)
+
+
+def _keys(inputs):
+    return [(i.u.ki.wVk, i.u.ki.wScan, i.u.ki.dwFlags) for i in inputs]
+
+
+class TestUnicodeInputs:
+    """Test building typed-text event sequences."""
+
+    def test_down_up_pair_per_char(self):
+        """Each character becomes a Unicode key-down and key-up."""
+        assert _keys(_unicode_inputs("ab")) == [
+            (0, ord("a"), KEYEVENTF_UNICODE),
+            (0, ord("a"), KEYEVENTF_UNICODE | KEYEVENTF_KEYUP),
+            (0, ord("b"), KEYEVENTF_UNICODE),
+            (0, ord("b"), KEYEVENTF_UNICODE | KEYEVENTF_KEYUP),
+        ]
+
+    def test_non_ascii(self):
+        """Non-ASCII BMP characters are sent as their code point."""
+        assert _keys(_unicode_inputs("é"))[0] == (0, 0xE9, KEYEVENTF_UNICODE)
+
+    def test_astral_char_uses_surrogates(self):
+        """Characters outside the BMP are sent as a UTF-16 surrogate pair."""
+        events = _keys(_unicode_inputs("😀"))
+        scans = [scan for _, scan, flags in events if not flags & KEYEVENTF_KEYUP]
+        assert scans == [0xD83D, 0xDE00]
+
+    def test_newline_is_enter(self):
+        """Newlines press the Enter virtual key."""
+        assert _keys(_unicode_inputs("\n")) == [(VK_RETURN, 0, 0), (VK_RETURN, 0, KEYEVENTF_KEYUP)]
+
+    def test_empty_text(self):
+        """Empty text produces no events."""
+        assert _unicode_inputs("") == []
+
+
+class TestClearFieldInputs:
+    """Test the select-all/delete sequence."""
+
+    def test_ctrl_a_then_delete(self):
+        """Ctrl is held around A, then Delete is pressed."""
+        assert [(vk, flags) for vk, _, flags in _keys(_clear_field_inputs())] == [
+            (VK_CONTROL, 0),
+            (VK_A, 0),
+            (VK_A, KEYEVENTF_KEYUP),
+            (VK_CONTROL, KEYEVENTF_KEYUP),
+            (VK_DELETE, 0),
+            (VK_DELETE, KEYEVENTF_KEYUP),
+        ]
+
+
+class TestClickInputs:
+    """Test building mouse click event sequences."""
+
+    def test_double_click(self):
+        """Each click is a button-down/button-up pair at the cursor."""
+        inputs = _click_inputs("left", 2)
+        assert {i.type for i in inputs} == {INPUT_MOUSE}
+        assert [i.u.mi.dwFlags for i in inputs] == [
+            MOUSEEVENTF_LEFTDOWN,
+            MOUSEEVENTF_LEFTUP,
+            MOUSEEVENTF_LEFTDOWN,
+            MOUSEEVENTF_LEFTUP,
+        ]
+
+    def test_right_button(self):
+        """The right button uses its own down/up flags."""
+        flags = [i.u.mi.dwFlags for i in _click_inputs("right", 1)]
+        assert flags == [MOUSEEVENTF_RIGHTDOWN, MOUSEEVENTF_RIGHTUP]
+
+    def test_unknown_button(self):
+        """Buttons SendInput cannot express give None."""
+        assert _click_inputs("primary", 1) is None
+
+
+class TestClickAt:
+    """Test coordinate clicks sent as one SendInput burst."""
+
+    def test_double_click_is_one_send(self):
+        """The cursor is moved once and both clicks go out in a single call."""
+        with (
+            patch.object(win32_input, "move_cursor", return_value=True) as move,
+            patch.object(win32_input, "send_inputs", return_value=True) as send,
+        ):
+            assert click_at(10, 20, "left", 2) is True
+        move.assert_called_once_with(10, 20)
+        send.assert_called_once()
+        assert len(send.call_args.args[0]) == 4
+
+    def test_unknown_button_does_not_move(self):
+        """An unsupported button fails before the cursor is moved."""
+        with patch.object(win32_input, "move_cursor") as move:
+            assert click_at(10, 20, "primary") is False
+        move.assert_not_called()
+
+
+class TestSendInputs:
+    """Test injecting events through the per-thread scratch array."""
+
+    def test_empty(self):
+        """Sending nothing succeeds without calling SendInput."""
+        with patch.object(win32_input, "SendInput") as send:
+            assert send_inputs([]) is True
+        send.assert_not_called()
+
+    def test_scratch_reused_and_grown(self):
+        """Short bursts share one array; a longer burst gets a bigger one."""
+        with patch.object(win32_input, "SendInput", side_effect=lambda n, buf, size: n) as send:
+            assert send_inputs(_click_inputs("left", 1)) is True
+            assert send_inputs(_click_inputs("right", 2)) is True
+            first, second = (c.args[1] for c in send.call_args_list)
+            assert first is second
+            assert send.call_args.args[0] == 4
+            assert first[0].u.mi.dwFlags == MOUSEEVENTF_RIGHTDOWN
+
+            assert send_inputs(_unicode_inputs("x" * 10)) is True
+            assert len(send.call_args.args[1]) >= 20
+
+    def test_partial_insert_fails(self):
+        """Fewer inserted events than sent is reported as failure."""
+        with patch.object(win32_input, "SendInput", return_value=0):
+            assert send_inputs(_click_inputs("left", 1)) is False
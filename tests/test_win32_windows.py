@@ -0,0 +1,166 @@
+"""Tests for top-level window lookup in win32_windows.py."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from pywinauto_mcp import win32_windows
+from pywinauto_mcp.win32_windows import find_window_by_title, find_window_handle
+
+
+def _patch_windows(windows, enum_windows=None):
+    """Patch user32 so FindWindowW and EnumWindows see *windows*: hwnd -> (title, visible)."""
+
+    def find_window(class_name, title):
+        matches = [h for h, (text, _) in windows.items() if text.lower() == title.lower()]
+        return matches[0] if matches else None
+
+    def walk_windows(callback, lparam):
+        for hwnd in windows:
+            if not callback(hwnd, lparam):
+                break
+        return True
+
+    def get_text(hwnd, buf, size):
+        buf.value = windows[hwnd][0][: size - 1]
+        return len(buf.value)
+
+    def text_length(hwnd):
+        # Counted in UTF-16 code units, like GetWindowTextLengthW
+        return len(windows[hwnd][0].encode("utf-16-le")) // 2
+
+    return [
+        patch.object(win32_windows, "FindWindowW", find_window),
+        patch.object(win32_windows, "EnumWindows", enum_windows or walk_windows),
+        patch.object(win32_windows, "GetWindowTextLengthW", text_length),
+        patch.object(win32_windows, "GetWindowTextW", get_text),
+        patch.object(win32_windows, "IsWindowVisible", lambda h: windows[h][1]),
+    ]
+
+
+def _find(windows, title, enum_windows=None):
+    patches = _patch_windows(windows, enum_windows)
+    for p in patches:
+        p.start()
+    try:
+        return find_window_by_title(title)
+    finally:
+        for p in patches:
+            p.stop()
+
+
+class TestFindWindowByTitle:
+    """Test EnumWindows-based title lookup."""
+
+    def test_case_insensitive(self):
+        """Titles match regardless of case."""
+        assert _find({1: ("Main", True), 2: ("Login", True)}, "LOGIN") == 2
+
+    def test_first_in_z_order(self):
+        """The first matching window wins."""
+        assert _find({1: ("Login", True), 2: ("Login", True)}, "Login") == 1
+
+    def test_hidden_windows_skipped(self):
+        """Invisible windows are not matched."""
+        assert _find({1: ("Login", False), 2: ("Login", True)}, "Login") == 2
+
+    def test_case_folded(self):
+        """Titles that differ only by full case folding match via enumeration."""
+        assert _find({1: ("STRASSE", True)}, "Straße") == 1
+        assert _find({1: ("Straße", True)}, "STRASSE") == 1
+
+    def test_title_outside_bmp(self):
+        """Titles with emoji are matched by enumeration despite their surrogate pairs."""
+        windows = {1: ("Sales 📈", False), 2: ("SALES 📈", True)}
+        assert _find(windows, "sales 📈") == 2
+
+    def test_longer_title_does_not_match(self):
+        """A title that only starts with the wanted text is not a match."""
+        assert _find({1: ("Loginx", True)}, "login") is None
+
+    def test_prefix_does_not_match(self):
+        """Titles that only share a prefix do not match."""
+        assert _find({1: ("Login - App", True)}, "Login") is None
+
+    def test_find_window_skips_enumeration(self):
+        """A visible first match from FindWindowW needs no EnumWindows pass."""
+
+        def enum_windows(callback, lparam):
+            raise AssertionError("EnumWindows should not run")
+
+        assert _find({1: ("Main", True), 2: ("Login", True)}, "login", enum_windows) == 2
+
+
+class TestFindWindowHandle:
+    """Test window_title resolution and its handle cache."""
+
+    def setup_method(self):
+        """Start from an empty cache with two top-level windows."""
+        win32_windows._window_handle_cache.clear()
+        self.desktop_windows = MagicMock(
+            return_value=[
+                SimpleNamespace(handle=10, window_text=lambda: "Other"),
+                SimpleNamespace(handle=20, window_text=lambda: "Login"),
+            ]
+        )
+        self.titles = {10: "Other", 20: "Login"}
+        self.is_window = MagicMock(return_value=True)
+        self.patches = [
+            patch.object(win32_windows, "IsWindow", self.is_window),
+            patch.object(win32_windows, "_window_text", lambda h: self.titles[h]),
+            patch.object(win32_windows, "find_window_by_title", return_value=None),
+        ]
+        self.enum = [p.start() for p in self.patches][-1]
+
+    def teardown_method(self):
+        """Undo the user32 patches and drop cached handles."""
+        for p in self.patches:
+            p.stop()
+        win32_windows._window_handle_cache.clear()
+
+    def test_enum_windows_match_skips_desktop_scan(self):
+        """A title found by EnumWindows never walks the backend's windows."""
+        self.enum.return_value = 20
+        assert find_window_handle("Login", self.desktop_windows) == 20
+        self.desktop_windows.assert_not_called()
+
+    def test_case_insensitive_match(self):
+        """Titles match regardless of case."""
+        assert find_window_handle("LOGIN", self.desktop_windows) == 20
+
+    def test_not_found(self):
+        """An unknown title resolves to None."""
+        assert find_window_handle("Missing", self.desktop_windows) is None
+        assert find_window_handle("Missing") is None
+
+    def test_second_lookup_uses_cache(self):
+        """A resolved title is not searched for again."""
+        find_window_handle("Login", self.desktop_windows)
+        assert find_window_handle("login", self.desktop_windows) == 20
+        self.desktop_windows.assert_called_once()
+
+    def test_refresh_bypasses_cache(self):
+        """refresh=True searches again."""
+        find_window_handle("Login", self.desktop_windows)
+        find_window_handle("Login", self.desktop_windows, refresh=True)
+        assert self.desktop_windows.call_count == 2
+
+    def test_expired_entry_is_rescanned(self):
+        """Entries older than WINDOW_CACHE_TTL are not trusted."""
+        with patch.object(win32_windows, "WINDOW_CACHE_TTL", 0):
+            find_window_handle("Login", self.desktop_windows)
+            find_window_handle("Login", self.desktop_windows)
+        assert self.desktop_windows.call_count == 2
+
+    def test_destroyed_window_is_rescanned(self):
+        """A cached handle that no longer exists is dropped."""
+        find_window_handle("Login", self.desktop_windows)
+        self.is_window.return_value = False
+        find_window_handle("Login", self.desktop_windows)
+        assert self.desktop_windows.call_count == 2
+
+    def test_retitled_window_is_rescanned(self):
+        """A cached handle whose title changed is dropped."""
+        find_window_handle("Login", self.desktop_windows)
+        self.titles[20] = "Main"
+        find_window_handle("Login", self.desktop_windows)
+        assert self.desktop_windows.call_count == 2